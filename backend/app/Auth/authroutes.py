@@ -18,6 +18,7 @@ from app.core.config import settings
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 # ==================== DEPENDENCY: GET CURRENT USER ====================
@@ -55,6 +56,16 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
+def get_optional_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: Session = Depends(get_db)
+):
+    """Like get_current_user, but returns None for anonymous requests"""
+    if credentials is None:
+        return None
+    return get_current_user(credentials, db)
+
+
 def get_current_session(
     request: Request,
     current_user: dict = Depends(get_current_user),
@@ -0,0 +1,154 @@
+"""
+Result cache for the hook explorer (``GET /hooks``).
+
+Most explorer traffic is the same few filter combinations ("All Platforms /
+All Niches / Newest" and friends), and each used to re-run its query. Pages
+are now cached in a TTLCache (LRU + TTL, see app/core/cache.py) keyed by
+the normalized ``(q, platform, niche, tone, sort_by, cursor, limit)``.
+
+Entries are invalidated by generation counters rather than by scanning the
+cache. Every key also carries the generations its page depends on, so
+bumping a generation makes every older entry unreachable (LRU and TTL
+clean them up later):
+
+- ``hooks`` is bumped when a commit inserts, deletes or edits a hook.
+  Every page depends on it.
+- ``counters`` is bumped when a commit changes view / like / comment /
+  copy / share counts or the score. Only the counter-ordered sorts depend
+  on it. Counter writes are coalesced: the bump happens at most once per
+  HOOK_CACHE_COUNTER_FLUSH_SECONDS, so a busy hook can't keep
+  "Most Popular" permanently cold.
+
+Counts shown on "Newest" and "Relevance" pages, and writes made by other
+processes, are at most HOOK_CACHE_TTL seconds stale.
+"""
+
+import threading
+import time
+from typing import Dict, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, attributes
+
+from ..core.cache import MISSING, TTLCache
+from ..core.config import settings
+from .models import EssentialHook, HOOK_SORT_KEYS
+
+COUNTER_FIELDS = ("score", "view_count", "like_count", "comment_count", "copy_count", "share_count")
+
+_cache = TTLCache(settings.HOOK_CACHE_MAX_ENTRIES, settings.HOOK_CACHE_TTL)
+_generations: Dict[str, int] = {"hooks": 0, "counters": 0}
+_counters_dirty_since: Optional[float] = None  # first unflushed counter write
+_lock = threading.Lock()
+
+
+def _normalize(value: Optional[str], everything: str) -> Optional[str]:
+    value = (value or "").strip()
+    return None if not value or value == everything else value
+
+
+def _counter_generation() -> int:
+    """The counters generation, after flushing writes older than the coalescing window."""
+    global _counters_dirty_since
+    with _lock:
+        if (_counters_dirty_since is not None
+                and time.monotonic() - _counters_dirty_since >= settings.HOOK_CACHE_COUNTER_FLUSH_SECONDS):
+            _generations["counters"] += 1
+            _counters_dirty_since = None
+        return _generations["counters"]
+
+
+def hooks_cache_key(search_query: Optional[str], platform: Optional[str], niche: Optional[str],
+                    tone: Optional[str], sort_by: Optional[str], cursor: Optional[str],
+                    limit: int) -> Hashable:
+    """
+    Cache key of one explorer page, including the current generations.
+
+    Filters meaning "everything" (None, "", "All Platforms", ...) share a
+    key, and so do sorts the service treats as "Newest".
+    """
+    q = (search_query or "").strip().lower() or None  # search is case-insensitive
+    if not (sort_by in HOOK_SORT_KEYS or (sort_by == "Relevance" and q)):
+        sort_by = "Newest"
+    generations = (_generations["hooks"], _counter_generation() if sort_by in HOOK_SORT_KEYS else None)
+    return (
+        q,
+        _normalize(platform, "All Platforms"),
+        _normalize(niche, "All Niches"),
+        _normalize(tone, "All Tones"),
+        sort_by,
+        cursor or None,
+        limit,
+        generations,
+    )
+
+
+def get_cached_page(key: Hashable):
+    """The cached page for ``key``, or MISSING."""
+    if settings.HOOK_CACHE_TTL <= 0:
+        return MISSING
+    return _cache.get(key)
+
+
+def cache_page(key: Hashable, page: Dict):
+    if settings.HOOK_CACHE_TTL > 0:
+        _cache.set(key, page)
+
+
+def clear_hook_cache():
+    _cache.clear()
+
+
+def get_hook_cache_stats() -> Dict:
+    """Entries, hit rate and current generations of the explorer cache."""
+    with _lock:
+        generations = dict(_generations)
+        pending = _counters_dirty_since is not None
+    return dict(_cache.to_dict(), generations=generations, counter_flush_pending=pending)
+
+
+# ----------------------------------------------------------------------
+# Generation bumps from ORM commits
+# ----------------------------------------------------------------------
+_PENDING = "hook_cache_changes"
+
+
+def _mark(target, kind: str):
+    session = attributes.instance_state(target).session
+    if session is not None:
+        session.info.setdefault(_PENDING, set()).add(kind)
+
+
+@event.listens_for(EssentialHook, "after_insert")
+@event.listens_for(EssentialHook, "after_delete")
+def _hook_added_or_removed(mapper, connection, target):
+    _mark(target, "hooks")
+
+
+@event.listens_for(EssentialHook, "after_update")
+def _hook_updated(mapper, connection, target):
+    state = attributes.instance_state(target)
+    for attr in state.mapper.column_attrs:
+        if state.attrs[attr.key].history.has_changes():
+            _mark(target, "counters" if attr.key in COUNTER_FIELDS else "hooks")
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_generations(session):
+    global _counters_dirty_since
+    changes = session.info.pop(_PENDING, None)
+    if not changes:
+        return
+    with _lock:
+        if "hooks" in changes:
+            _generations["hooks"] += 1
+        if "counters" in changes:
+            if settings.HOOK_CACHE_COUNTER_FLUSH_SECONDS <= 0:
+                _generations["counters"] += 1
+            elif _counters_dirty_since is None:
+                _counters_dirty_since = time.monotonic()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_changes(session):
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,670 @@
+"""
+In-memory inverted index over EssentialHook for explorer typeahead.
+
+Even with the full-text index, every typeahead keystroke would be a
+database round trip. This index answers ``GET /hooks/typeahead`` from
+memory instead:
+
+- Words of title, text and niche map to postings: sorted ``array('I')``
+  of hook ids (4 bytes per entry). platform, tone and niche values are
+  indexed as exact ``field:value`` facet postings for filtering.
+- The last word of a query is a prefix. It expands to its most common
+  completions, found by bisecting the sorted vocabulary. Every other word,
+  and every facet, is intersected. The smallest clause drives the
+  intersection, newest id first, and the others are probed by binary
+  search, so a page of results costs roughly ``limit x clauses x log n``.
+- Commits that insert, update or delete hooks through the ORM update the
+  index incrementally, once the transaction has committed.
+- A background thread loads or builds the index and then keeps it in step
+  with the database. Every HOOK_INDEX_SYNC_SECONDS it indexes rows written
+  by other processes: everything above ``synced_id`` (the highest id a
+  sync has read, which local commits never advance), plus the last
+  HOOK_INDEX_SYNC_OVERLAP ids below it, for inserts that committed out of
+  id order. Re-reading a hook that is already indexed is a no-op.
+- Edits and deletes made by other processes can't be seen by id, so the
+  whole index is rebuilt every HOOK_INDEX_REBUILD_SECONDS. The new index
+  is built off to the side and swapped in, with ORM changes committed
+  during the build replayed onto it.
+- The index is written to HOOK_INDEX_SNAPSHOT on shutdown and after a
+  full build, so a new worker loads it in one read instead of
+  re-tokenising every hook. A snapshot whose build is older than
+  HOOK_INDEX_REBUILD_SECONDS is ignored.
+- Until the first load finishes, typeahead answers 503 rather than
+  building the index on the request path.
+"""
+
+import bisect
+import heapq
+import json
+import os
+import re
+import sys
+import threading
+import time
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, attributes
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from .models import EssentialHook
+
+SNAPSHOT_VERSION = 2
+ALL_KEY = ":all"  # postings of every indexed hook (facet keys never start with ":")
+TEXT_FIELDS = ("title", "text", "niche")
+FACET_FIELDS = ("platform", "tone", "niche")
+INDEXED_FIELDS = ("title", "text", "niche", "platform", "tone")
+MAX_TERM_LENGTH = 32
+PREFIX_EXPANSIONS = 32  # completions of the last word searched
+COMPLETION_CACHE_MAX_PREFIX = 3  # prefixes this short have their completions cached
+
+_WORD_RE = re.compile(r"\b\w{1,%d}\b" % MAX_TERM_LENGTH)  # longer "words" are noise (urls, hashes)
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Lowercased words of ``value``, in order."""
+    return _WORD_RE.findall((value or "").lower())
+
+
+def facet_key(field: str, value: str) -> str:
+    """Postings key of an exact field value (can't collide with a word)."""
+    return f"{field}:{value.lower()}"
+
+
+def document_terms(doc: Dict) -> set:
+    """Every postings key a hook belongs to."""
+    terms = set(tokenize(" ".join(doc.get(field) or "" for field in TEXT_FIELDS)))
+    for field in FACET_FIELDS:
+        if doc.get(field):
+            terms.add(facet_key(field, doc[field]))
+    return terms
+
+
+def _contains(postings: array, hook_id: int, lo: int = 0, hi: Optional[int] = None) -> bool:
+    hi = len(postings) if hi is None else hi
+    pos = bisect.bisect_left(postings, hook_id, lo, hi)
+    return pos < hi and postings[pos] == hook_id
+
+
+def _ids_between(clause: List[array], lo: int, hi: int) -> set:
+    """Ids in ``[lo, hi)`` of any postings list of ``clause``."""
+    ids = set()
+    for postings in clause:
+        ids.update(postings[bisect.bisect_left(postings, lo):bisect.bisect_left(postings, hi)])
+    return ids
+
+
+class HookIndex:
+    """Term -> sorted hook id postings, with prefix completion and intersection."""
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}
+        self.vocabulary: List[str] = []  # sorted words (facet keys excluded)
+        self.max_id = 0      # highest id indexed, from any source
+        self.synced_id = 0   # highest id read from the database by a build or sync
+        self.built_at: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+        self.source: Optional[str] = None  # "build" or "snapshot"
+        self._completions: Dict[str, List[str]] = {}  # short prefix -> ranked words
+        self._lock = threading.RLock()
+
+    @property
+    def documents(self) -> int:
+        return len(self.postings.get(ALL_KEY, ()))
+
+    def __contains__(self, hook_id: int) -> bool:
+        return _contains(self.postings.get(ALL_KEY, array("I")), hook_id)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def _add_term(self, term: str, hook_id: int):
+        postings = self.postings.get(term)
+        if postings is None:
+            self.postings[term] = array("I", [hook_id])
+            if ":" not in term:
+                bisect.insort(self.vocabulary, term)
+                self._completions.clear()
+        elif not postings or postings[-1] < hook_id:
+            postings.append(hook_id)
+        else:
+            pos = bisect.bisect_left(postings, hook_id)
+            if pos == len(postings) or postings[pos] != hook_id:
+                postings.insert(pos, hook_id)
+
+    def _remove_term(self, term: str, hook_id: int):
+        postings = self.postings.get(term)
+        if postings is None:
+            return
+        pos = bisect.bisect_left(postings, hook_id)
+        if pos < len(postings) and postings[pos] == hook_id:
+            del postings[pos]
+        if not postings:
+            del self.postings[term]
+            if ":" not in term:
+                pos = bisect.bisect_left(self.vocabulary, term)
+                if pos < len(self.vocabulary) and self.vocabulary[pos] == term:
+                    del self.vocabulary[pos]
+                self._completions.clear()
+
+    def add(self, hook_id: int, doc: Dict) -> bool:
+        """Index a new hook; returns False (and changes nothing) if it is already indexed."""
+        with self._lock:
+            if hook_id in self:
+                return False
+            for term in document_terms(doc):
+                self._add_term(term, hook_id)
+            self._add_term(ALL_KEY, hook_id)
+            self.max_id = max(self.max_id, hook_id)
+            return True
+
+    def update(self, hook_id: int, old: Dict, new: Dict):
+        """Re-index a hook whose indexed fields changed from ``old`` to ``new``."""
+        old_terms, new_terms = document_terms(old), document_terms(new)
+        with self._lock:
+            if hook_id not in self:
+                self.add(hook_id, new)
+                return
+            for term in old_terms - new_terms:
+                self._remove_term(term, hook_id)
+            for term in new_terms - old_terms:
+                self._add_term(term, hook_id)
+
+    def remove(self, hook_id: int, doc: Dict):
+        """Drop a deleted hook."""
+        with self._lock:
+            for term in document_terms(doc):
+                self._remove_term(term, hook_id)
+            self._remove_term(ALL_KEY, hook_id)
+
+    def bulk_load(self, rows: Iterable[Tuple[int, Dict]]):
+        """
+        Index many hooks at once, far faster than repeated ``add``.
+
+        Meant for filling a new index from rows in id order; hooks that are
+        already indexed are skipped.
+        """
+        lists: Dict[str, List[int]] = defaultdict(list)
+        max_id = 0
+        indexed = self.postings.get(ALL_KEY)
+        for hook_id, doc in rows:
+            if indexed is not None and _contains(indexed, hook_id):
+                continue
+            for term in document_terms(doc):
+                lists[term].append(hook_id)
+            lists[ALL_KEY].append(hook_id)
+            max_id = max(max_id, hook_id)
+        with self._lock:
+            for term, ids in lists.items():
+                if term in self.postings:
+                    for hook_id in sorted(ids):
+                        self._add_term(term, hook_id)
+                else:
+                    self.postings[term] = array("I", sorted(ids))
+            self.vocabulary = sorted(term for term in self.postings if ":" not in term)
+            self.max_id = max(self.max_id, max_id)
+            self._completions.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def completions(self, prefix: str, limit: int = PREFIX_EXPANSIONS) -> List[Tuple[str, int]]:
+        """
+        Most common words starting with ``prefix``.
+
+        Rankings of short prefixes are cached until a word is added to or
+        dropped from the vocabulary; counts are always current.
+
+        Returns:
+            (word, number of hooks containing it) pairs, most common first
+        """
+        with self._lock:
+            postings = self.postings
+            ranked = self._completions.get(prefix)
+            if ranked is None or len(ranked) < limit:
+                start = bisect.bisect_left(self.vocabulary, prefix)
+                end = bisect.bisect_left(self.vocabulary, prefix + "\U0010ffff")
+                ranked = heapq.nlargest(limit, self.vocabulary[start:end], key=lambda term: len(postings[term]))
+                if len(prefix) <= COMPLETION_CACHE_MAX_PREFIX:
+                    self._completions[prefix] = ranked
+            return [(term, len(postings[term])) for term in ranked[:limit]]
+
+    def search(self, query: str, filters: Optional[Dict[str, str]] = None, limit: int = 10,
+               suggestions: int = 8) -> Dict:
+        """
+        Typeahead lookup.
+
+        Args:
+            query: What the user typed so far; the last word is a prefix
+                unless the query ends with a space
+            filters: Exact ``{"platform" | "tone" | "niche": value}`` filters
+            limit: Max hook ids returned, newest first
+            suggestions: Max completions of the last word returned
+
+        Returns:
+            Dictionary with ``suggestions`` ((word, hooks) pairs) and
+            ``hook_ids`` matching every word and filter
+        """
+        words = tokenize(query)
+        prefix = words.pop() if words and not query[-1:].isspace() else None
+
+        with self._lock:
+            clauses: List[List[array]] = []  # each clause is a union of postings
+            for word in words:
+                clauses.append([self.postings.get(word, array("I"))])
+            for field, value in (filters or {}).items():
+                if value:
+                    clauses.append([self.postings.get(facet_key(field, value), array("I"))])
+
+            expansions = []
+            if prefix:
+                expansions = self.completions(prefix)
+                clauses.append([self.postings[term] for term, _ in expansions])
+
+            hook_ids = self._intersect(clauses, limit) if clauses else []
+        return {
+            "suggestions": [{"word": term, "hooks": count} for term, count in expansions[:suggestions]],
+            "hook_ids": hook_ids,
+        }
+
+    def _intersect(self, clauses: List[List[array]], limit: int) -> List[int]:
+        """
+        Newest ids present in every clause (a clause matches if any of its
+        postings does).
+
+        Ids are intersected in descending id windows sized from the
+        smallest clause, so each window is a few bisects and C-level
+        slices per postings list. Windows double until ``limit`` ids are
+        found or the ids run out.
+        """
+        clauses = sorted(clauses, key=lambda postings: sum(len(p) for p in postings))
+        driver_size = sum(len(p) for p in clauses[0])
+        if not driver_size:
+            return []
+
+        found: List[int] = []
+        hi = self.max_id + 1
+        width = max(1, 2 * limit * hi // driver_size)
+        while hi > 0 and len(found) < limit:
+            lo = max(0, hi - width)
+            ids = _ids_between(clauses[0], lo, hi)
+            for clause in clauses[1:]:
+                if not ids:
+                    break
+                spans = [(p, bisect.bisect_left(p, lo), bisect.bisect_left(p, hi)) for p in clause]
+                if sum(end - start for _, start, end in spans) > 16 * len(ids) * len(clause):
+                    # Slicing would copy far more ids than there are
+                    # candidates: binary-search each candidate instead
+                    ids = {hook_id for hook_id in ids
+                           if any(_contains(p, hook_id, start, end) for p, start, end in spans)}
+                else:
+                    window = set()
+                    for p, start, end in spans:
+                        window.update(p[start:end])
+                    ids &= window
+            found.extend(sorted(ids, reverse=True))
+            hi, width = lo, width * 2
+        return found[:limit]
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+    def save(self, path: str):
+        """
+        Write the index to ``path`` atomically.
+
+        Layout: a JSON header line, then the newline-joined terms, the
+        postings offsets and the concatenated postings as raw arrays.
+        """
+        with self._lock:
+            terms = list(self.postings)
+            offsets = array("I", [0])
+            data = array("I")
+            for term in terms:
+                data.extend(self.postings[term])
+                offsets.append(len(data))
+            header = {
+                "version": SNAPSHOT_VERSION,
+                "byteorder": sys.byteorder,
+                "max_id": self.max_id,
+                "synced_id": self.synced_id,
+                "built_at": self.built_at,
+                "terms_bytes": 0,
+                "terms": len(terms),
+                "postings": len(data),
+            }
+        terms_blob = "\n".join(terms).encode("utf-8")
+        header["terms_bytes"] = len(terms_blob)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(json.dumps(header).encode("utf-8") + b"\n")
+            fh.write(terms_blob)
+            offsets.tofile(fh)
+            data.tofile(fh)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["HookIndex"]:
+        """Read a snapshot; None when it is missing, stale or unreadable."""
+        try:
+            with open(path, "rb") as fh:
+                header = json.loads(fh.readline())
+                if header.get("version") != SNAPSHOT_VERSION or header.get("byteorder") != sys.byteorder:
+                    return None
+                blob = fh.read(header["terms_bytes"]).decode("utf-8")
+                terms = blob.split("\n") if header["terms"] else []
+                offsets = array("I")
+                offsets.fromfile(fh, header["terms"] + 1)
+                data = array("I")
+                data.fromfile(fh, header["postings"])
+        except (OSError, EOFError, ValueError, KeyError) as e:
+            print(f"⚠️ Could not load hook index snapshot {path}: {e}")
+            return None
+
+        index = cls()
+        index.postings = {term: data[offsets[i]:offsets[i + 1]] for i, term in enumerate(terms)}
+        index.vocabulary = sorted(term for term in terms if ":" not in term)
+        index.max_id = header["max_id"]
+        index.synced_id = header["synced_id"]
+        index.built_at = header["built_at"]
+        return index
+
+    def to_dict(self) -> Dict:
+        """Convert index state to dictionary."""
+        with self._lock:
+            return {
+                "documents": self.documents,
+                "terms": len(self.postings),
+                "words": len(self.vocabulary),
+                "postings": sum(len(p) for p in self.postings.values()),
+                "max_id": self.max_id,
+                "synced_id": self.synced_id,
+                "source": self.source,
+                "built_at": self.built_at,
+                "build_seconds": round(self.build_seconds, 3) if self.build_seconds is not None else None,
+            }
+
+
+# ----------------------------------------------------------------------
+# Process-wide index
+# ----------------------------------------------------------------------
+_index: Optional[HookIndex] = None
+_index_lock = threading.Lock()    # one load / sync / rebuild at a time
+_changes_lock = threading.Lock()  # ORM changes vs. swapping in a rebuilt index
+_rebuild_changes: Optional[List[Tuple]] = None  # ORM changes committed during a rebuild
+_thread: Optional[threading.Thread] = None
+_thread_lock = threading.Lock()
+_stop = threading.Event()
+_last_sync: Dict = {}
+
+
+def _doc(hook) -> Dict:
+    return {field: getattr(hook, field) for field in INDEXED_FIELDS}
+
+
+def _iter_rows(db: Session, after_id: int = 0, batch_size: int = 10000) -> Iterator[Tuple[int, Dict]]:
+    """(id, indexed fields) of every hook above ``after_id``, in id order."""
+    columns = [EssentialHook.id] + [getattr(EssentialHook, field) for field in INDEXED_FIELDS]
+    while True:
+        batch = (
+            db.query(*columns)
+            .filter(EssentialHook.id > after_id)
+            .order_by(EssentialHook.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            return
+        for row in batch:
+            yield row[0], dict(zip(INDEXED_FIELDS, row[1:]))
+        after_id = batch[-1][0]
+
+
+def build_hook_index(db: Session) -> HookIndex:
+    """Index every hook from the database."""
+    started = time.perf_counter()
+    index = HookIndex()
+    index.built_at = time.time()  # rows committed after this are left to the next sync
+
+    def _tracked():
+        for hook_id, doc in _iter_rows(db):
+            index.synced_id = hook_id
+            yield hook_id, doc
+
+    index.bulk_load(_tracked())
+    index.source = "build"
+    index.build_seconds = time.perf_counter() - started
+    print(f"🔎 Indexed {index.documents} hooks for typeahead in {index.build_seconds:.2f}s")
+    return index
+
+
+def sync_hook_index(db: Session, index: HookIndex) -> int:
+    """
+    Index hooks written by other processes since the last sync.
+
+    Reads every row above ``index.synced_id`` and re-reads the last
+    HOOK_INDEX_SYNC_OVERLAP ids below it (rows whose insert committed
+    after a higher id was already synced). Hooks already indexed are
+    skipped.
+
+    Returns:
+        How many hooks were added
+    """
+    added = 0
+    synced_id = index.synced_id
+    for hook_id, doc in _iter_rows(db, max(0, index.synced_id - settings.HOOK_INDEX_SYNC_OVERLAP)):
+        added += index.add(hook_id, doc)
+        synced_id = max(synced_id, hook_id)
+    index.synced_id = synced_id
+    _last_sync.update(at=time.time(), added=added)
+    return added
+
+
+def _rebuild_due(index: HookIndex) -> bool:
+    """Whether ``index`` is older than HOOK_INDEX_REBUILD_SECONDS (0 never rebuilds)."""
+    if settings.HOOK_INDEX_REBUILD_SECONDS <= 0:
+        return False
+    return index.built_at is None or time.time() - index.built_at >= settings.HOOK_INDEX_REBUILD_SECONDS
+
+
+def _swap_in(index: HookIndex):
+    """Make ``index`` the process-wide index, replaying ORM changes it may have missed."""
+    global _index, _rebuild_changes
+    with _changes_lock:
+        for change in _rebuild_changes or []:
+            _apply(index, change)
+        _rebuild_changes = None
+        _index = index
+
+
+def load_hook_index(db: Session) -> HookIndex:
+    """
+    Load the snapshot (plus newer rows) or build from the database, and
+    make the result the process-wide index.
+    """
+    global _rebuild_changes
+    with _index_lock:
+        if _index is not None:
+            return _index
+        with _changes_lock:
+            _rebuild_changes = []
+        started = time.perf_counter()
+        path = settings.HOOK_INDEX_SNAPSHOT
+        index = HookIndex.load(path) if path and os.path.exists(path) else None
+        if index is not None and _rebuild_due(index):
+            print("🔎 Typeahead index snapshot is older than HOOK_INDEX_REBUILD_SECONDS, rebuilding")
+            index = None
+        if index is None:
+            index = build_hook_index(db)
+            save_hook_index(index)
+        else:
+            index.source = "snapshot"
+            sync_hook_index(db, index)
+            index.build_seconds = time.perf_counter() - started
+            print(f"🔎 Loaded typeahead index ({index.documents} hooks) in {index.build_seconds:.2f}s")
+        _swap_in(index)
+        return index
+
+
+def rebuild_hook_index(db: Session) -> HookIndex:
+    """Build a fresh index beside the live one and swap it in."""
+    global _rebuild_changes
+    with _index_lock:
+        with _changes_lock:
+            _rebuild_changes = []
+        try:
+            index = build_hook_index(db)
+        except Exception:
+            with _changes_lock:
+                _rebuild_changes = None
+            raise
+        _swap_in(index)
+        save_hook_index(index)
+        return index
+
+
+def refresh_hook_index(db: Session):
+    """One tick of the background thread: first load, periodic rebuild or sync."""
+    if _index is None:
+        if inspect(db.get_bind()).has_table(EssentialHook.__tablename__):
+            load_hook_index(db)
+    elif _rebuild_due(_index):
+        rebuild_hook_index(db)
+    else:
+        with _index_lock:
+            sync_hook_index(db, _index)
+
+
+def get_hook_index() -> Optional[HookIndex]:
+    """
+    The process-wide index, or None while it is still loading.
+
+    Never touches the database: if the background loader isn't running
+    yet (HOOK_INDEX_ENABLED off) it is started here.
+    """
+    if _index is None:
+        start_hook_index(on_demand=True)
+    return _index
+
+
+def save_hook_index(index: Optional[HookIndex] = None):
+    """Snapshot the index to HOOK_INDEX_SNAPSHOT (no-op when unset or not built)."""
+    index = index or _index
+    if index is None or not settings.HOOK_INDEX_SNAPSHOT:
+        return
+    try:
+        index.save(settings.HOOK_INDEX_SNAPSHOT)
+    except OSError as e:
+        print(f"⚠️ Could not write hook index snapshot: {e}")
+
+
+def _loop():
+    while True:
+        db = SessionLocal()
+        try:
+            refresh_hook_index(db)
+        except Exception as e:
+            print(f"❌ Typeahead index refresh failed: {e}")
+        finally:
+            db.close()
+        if _stop.wait(settings.HOOK_INDEX_SYNC_SECONDS):
+            return
+
+
+def start_hook_index(on_demand: bool = False):
+    """
+    Start the background thread that loads the index and keeps it synced.
+
+    At startup this only runs when HOOK_INDEX_ENABLED is set; otherwise the
+    first typeahead request starts it (``on_demand``).
+    """
+    global _thread
+    if not (settings.HOOK_INDEX_ENABLED or on_demand):
+        return
+    with _thread_lock:
+        if _thread and _thread.is_alive():
+            return
+        _stop.clear()
+        _thread = threading.Thread(target=_loop, name="hook-index", daemon=True)
+        _thread.start()
+
+
+def stop_hook_index():
+    _stop.set()
+
+
+def get_hook_index_status() -> Dict:
+    """Size and origin of the typeahead index (None until first built) and the last sync."""
+    status = _index.to_dict() if _index else {"documents": None, "source": None}
+    return dict(status, loading=_index is None and bool(_thread and _thread.is_alive()),
+                last_sync=dict(_last_sync) or None)
+
+
+# ----------------------------------------------------------------------
+# Incremental updates from ORM commits
+# ----------------------------------------------------------------------
+_PENDING = "hook_index_changes"
+
+
+def _queue(target, change: Tuple):
+    session = attributes.instance_state(target).session
+    if session is not None:
+        session.info.setdefault(_PENDING, []).append(change)
+
+
+@event.listens_for(EssentialHook, "after_insert")
+def _hook_inserted(mapper, connection, target):
+    _queue(target, ("add", target.id, None, _doc(target)))
+
+
+@event.listens_for(EssentialHook, "after_update")
+def _hook_updated(mapper, connection, target):
+    state = attributes.instance_state(target)
+    old, changed = {}, False
+    for field in INDEXED_FIELDS:
+        history = state.attrs[field].history
+        if history.has_changes():
+            changed = True
+            old[field] = history.deleted[0] if history.deleted else None
+        else:
+            old[field] = getattr(target, field)
+    if changed:  # counter bumps don't touch the index
+        _queue(target, ("update", target.id, old, _doc(target)))
+
+
+@event.listens_for(EssentialHook, "after_delete")
+def _hook_deleted(mapper, connection, target):
+    _queue(target, ("remove", target.id, _doc(target), None))
+
+
+def _apply(index: HookIndex, change: Tuple):
+    op, hook_id, old, new = change
+    if op == "add":
+        index.add(hook_id, new)
+    elif op == "update":
+        index.update(hook_id, old, new)
+    else:
+        index.remove(hook_id, old)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_hook_changes(session):
+    changes = session.info.pop(_PENDING, None)
+    if not changes:
+        return
+    with _changes_lock:
+        if _rebuild_changes is not None:
+            _rebuild_changes.extend(changes)  # replayed onto the index being built
+        if _index is not None:
+            for change in changes:
+                _apply(_index, change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_hook_changes(session):
+    session.info.pop(_PENDING, None)
@@ -35,7 +35,8 @@ from .EssentialFeaturesService import (
     reset_filters_service,
     add_hook_comment_service,
     like_hook_service,
-    fetch_filtered_hooks_service
+    fetch_filtered_hooks_service,
+    typeahead_hooks_service
 )
 
 from .EssentialFeaturesService import MetricsService
@@ -111,29 +112,58 @@ async def require_auth(request: Request) -> User:
     description="Retrieve hooks with optional filtering and sorting"
 )
 async def get_filtered_hooks(
-    q: Optional[str] = Query(None, description="Search query for title, text, or niche"),
+    q: Optional[str] = Query(None, description="Full-text search over title, text and niche"),
     platform: str = Query("All Platforms", description="Filter by platform"),
     niche: str = Query("All Niches", description="Filter by niche"),
     tone: str = Query("All Tones", description="Filter by tone"),
     sort_by: str = Query("Newest First", description="Sort order"),
+    limit: Optional[int] = Query(None, ge=1, description="Hooks per page (default 50, max 200)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
     db: Session = Depends(get_db)
 ):
     """
-    Get hooks with filtering and sorting.
+    Get one page of hooks with filtering and sorting.
     
     Example:
         GET /api/hooks?q=fitness&platform=YouTube&tone=Emotional&sort_by=Most Popular
+        GET /api/hooks?sort_by=Most Popular&cursor=<next_cursor>
+        GET /api/hooks?q=morning routine&sort_by=Relevance
     """
-    hooks = fetch_filtered_hooks_service(
+    page = fetch_filtered_hooks_service(
         db=db,
         search_query=q,
         platform=platform,
         niche=niche,
         tone=tone,
-        sort_by=sort_by
+        sort_by=sort_by,
+        limit=limit,
+        cursor=cursor
     )
     
-    return JSONResponse(content=hooks, status_code=status.HTTP_200_OK)
+    return JSONResponse(content=page, status_code=status.HTTP_200_OK)
+
+
+@essential_features_bp.get(
+    "/hooks/typeahead",
+    summary="Hook typeahead",
+    description="Word completions and matching hooks for a partially typed query"
+)
+async def hook_typeahead(
+    q: str = Query(..., min_length=1, description="Text typed so far"),
+    platform: str = Query("All Platforms", description="Filter by platform"),
+    niche: str = Query("All Niches", description="Filter by niche"),
+    tone: str = Query("All Tones", description="Filter by tone"),
+    limit: int = Query(10, ge=1, le=50, description="Max hooks returned"),
+    db: Session = Depends(get_db)
+):
+    """
+    Answer a typeahead keystroke from the in-memory hook index.
+
+    Example:
+        GET /hooks/typeahead?q=morning rou&platform=YouTube
+    """
+    result = typeahead_hooks_service(db=db, q=q, platform=platform, niche=niche, tone=tone, limit=limit)
+    return JSONResponse(content=result, status_code=status.HTTP_200_OK)
 
 
 @essential_features_bp.post(
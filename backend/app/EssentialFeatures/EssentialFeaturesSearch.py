@@ -0,0 +1,171 @@
+"""
+Full-text search for the hook explorer ``q`` parameter.
+
+``q`` used to be three leading-wildcard ``ilike`` predicates, which no
+index can serve. Hooks are now indexed by the database's own full-text
+engine:
+
+- PostgreSQL: a stored generated ``search_vector`` tsvector column
+  (title weighted A, text B, niche C) with a GIN index. Postgres keeps
+  it up to date on every insert and update.
+- SQLite: an external-content FTS5 table ``essential_hooks_fts`` over
+  title, text and niche, kept in sync by insert / update / delete
+  triggers.
+
+Words are stemmed ("fitness" finds "fit"), the last one is also matched
+as a prefix so partially typed queries work, and all words must match.
+The "Relevance" sort orders by ``ts_rank_cd`` (Postgres) or ``bm25``
+(SQLite). Any other database keeps the ``ilike`` fallback.
+
+On SQLite, results are keyed by the FTS rowid so "Newest" pages walk the
+FTS doclist backwards instead of sorting every match.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, cast, column, func, inspect, literal_column, or_, table, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query
+
+from .models import EssentialHook
+
+FTS_TABLE = "essential_hooks_fts"
+SEARCH_INDEX = "ix_essential_hooks_search_vector"
+TS_CONFIG = "english"
+
+_POSTGRES_DDL = [
+    f"""
+    ALTER TABLE essential_hooks ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(text, '')), 'B') ||
+        setweight(to_tsvector('{TS_CONFIG}', coalesce(niche, '')), 'C')
+    ) STORED
+    """,
+    f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} ON essential_hooks USING GIN (search_vector)",
+]
+
+_SQLITE_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, text, niche,
+        content='essential_hooks', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS essential_hooks_fts_ai AFTER INSERT ON essential_hooks BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, text, niche) VALUES (new.id, new.title, new.text, new.niche);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS essential_hooks_fts_ad AFTER DELETE ON essential_hooks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, text, niche)
+        VALUES ('delete', old.id, old.title, old.text, old.niche);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS essential_hooks_fts_au AFTER UPDATE OF title, text, niche ON essential_hooks BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, text, niche)
+        VALUES ('delete', old.id, old.title, old.text, old.niche);
+        INSERT INTO {FTS_TABLE}(rowid, title, text, niche) VALUES (new.id, new.title, new.text, new.niche);
+    END
+    """,
+]
+
+# Engine URL -> "postgresql", "sqlite" or None (ilike fallback)
+_backends: Dict[str, Optional[str]] = {}
+
+
+def ensure_search_index(bind) -> Optional[str]:
+    """
+    Create the full-text index for this database if it is missing.
+
+    Args:
+        bind: Engine of the database holding essential_hooks
+
+    Returns:
+        The search backend in use: "postgresql", "sqlite" or None
+    """
+    key = str(bind.url)
+    if key in _backends:
+        return _backends[key]
+    if not inspect(bind).has_table(EssentialHook.__tablename__):
+        return None  # nothing to index yet; checked again on the next search
+
+    dialect = bind.dialect.name
+    backend = None
+    try:
+        if dialect == "postgresql":
+            with bind.begin() as conn:
+                for ddl in _POSTGRES_DDL:
+                    conn.execute(text(ddl))
+            backend = "postgresql"
+        elif dialect == "sqlite":
+            with bind.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": FTS_TABLE},
+                ).first()
+                if not exists:
+                    print("🛠 Building the hook search index...")
+                    conn.execute(text(_SQLITE_DDL[0]))
+                    conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+                for ddl in _SQLITE_DDL[1:]:
+                    conn.execute(text(ddl))
+            backend = "sqlite"
+    except OperationalError as e:
+        # e.g. SQLite built without FTS5
+        print(f"⚠️ Full-text search unavailable, falling back to ilike: {e}")
+    _backends[key] = backend
+    return backend
+
+
+def search_terms(search_query: str) -> List[str]:
+    """Lowercased words of a query; punctuation and operators are dropped."""
+    return re.findall(r"\w+", search_query.lower())
+
+
+def apply_search(query: Query, search_query: str) -> Tuple[Query, Optional[object], object]:
+    """
+    Restrict a hooks query to matches of ``search_query``.
+
+    Args:
+        query: Query over EssentialHook
+        search_query: Raw ``q`` parameter
+
+    Returns:
+        The filtered query, its relevance expression (higher is more
+        relevant, None for the ilike fallback) and the hook id expression
+        to order and seek on
+    """
+    terms = search_terms(search_query)
+    backend = ensure_search_index(query.session.get_bind()) if terms else None
+
+    if backend == "postgresql":
+        tsquery = func.to_tsquery(TS_CONFIG, " & ".join(terms[:-1] + [f"{terms[-1]}:*"]))
+        vector = literal_column("essential_hooks.search_vector")
+        # ts_rank_cd is float4; as float8 the value round-trips through the
+        # cursor exactly, so the seek predicate matches the row it came from
+        relevance = cast(func.ts_rank_cd(vector, tsquery), Float(53))
+        return query.filter(vector.op("@@")(tsquery)), relevance, EssentialHook.id
+
+    if backend == "sqlite":
+        match = " ".join([f'"{term}"' for term in terms[:-1]] + [f'"{terms[-1]}"*'])
+        fts = table(FTS_TABLE, column("rowid"))
+        query = (
+            query.join(fts, fts.c.rowid == EssentialHook.id)
+            .filter(literal_column(FTS_TABLE).op("MATCH")(match))
+        )
+        # bm25 is lower-is-better; title hits count most, niche least
+        return query, -func.bm25(literal_column(FTS_TABLE), 10.0, 5.0, 1.0), fts.c.rowid
+
+    search_term = f"%{search_query.strip()}%"
+    return query.filter(
+        or_(
+            EssentialHook.title.ilike(search_term),
+            EssentialHook.text.ilike(search_term),
+            EssentialHook.niche.ilike(search_term)
+        )
+    ), None, EssentialHook.id
@@ -4,12 +4,23 @@ Service layer for Essential Features module.
 Contains business logic for hooks, posts, comments, likes, and metrics.
 """
 
+import base64
+import binascii
+import json
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, or_
-from typing import Dict, Optional, List
+from sqlalchemy import func, case, and_, or_, inspect
+from sqlalchemy.schema import CreateIndex
+from typing import Dict, Optional, List, Tuple
 from fastapi import HTTPException, status
 
+from ..core.config import settings
+from .EssentialFeaturesSearch import apply_search
+from .EssentialFeaturesIndex import get_hook_index
+from .EssentialFeaturesCache import MISSING, cache_page, get_cached_page, hooks_cache_key
 from .models import (
+    HOOK_SORT_KEYS,
+    HOOK_SORT_INDEXES,
     EssentialHook,
     EssentialPost,
     EssentialPostLike,
@@ -240,40 +251,88 @@ def record_hook_copy_service(db: Session, hook_id: int) -> Dict:
     return {"message": "Copy recorded.", "copies": hook.copy_count}
 
 
+def encode_hooks_cursor(sort_by: str, key: Optional[float], hook_id: int) -> str:
+    """Opaque token for the position after (key, hook_id) in one sort order."""
+    raw = json.dumps([sort_by, key, hook_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_hooks_cursor(cursor: str, sort_by: str) -> Tuple[Optional[float], int]:
+    """
+    Decode a next-cursor token.
+
+    Raises:
+        HTTPException 400: Malformed token, or issued for another sort order
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, key, hook_id = json.loads(raw)
+        if cursor_sort != sort_by or not isinstance(hook_id, int) or not isinstance(key, (int, float, type(None))):
+            raise ValueError(cursor_sort)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor for this sort order"
+        )
+    return key, hook_id
+
+
+def ensure_hook_sort_indexes(bind) -> None:
+    """Create the explorer sort indexes on databases that predate them."""
+    if not inspect(bind).has_table(EssentialHook.__tablename__):
+        return  # created along with the table
+    # Expression indexes are invisible to reflection, so checkfirst can't be used
+    with bind.begin() as conn:
+        for index in HOOK_SORT_INDEXES:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+
+
 def fetch_filtered_hooks_service(
     db: Session,
     search_query: Optional[str] = None,
     platform: str = "All Platforms",
     niche: str = "All Niches",
     tone: str = "All Tones",
-    sort_by: str = "Newest"
-) -> List[Dict]:
+    sort_by: str = "Newest",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Dict:
     """
-    Fetch hooks with filters and sorting applied.
-    
+    Fetch one page of hooks with filters and sorting applied.
+
+    Pages are keyset-paginated: rows are ordered by (sort key, id) descending
+    and ``cursor`` resumes strictly after the last row of the previous page,
+    so every page costs the same however deep it is. Pages are cached by
+    their normalized filters until a write invalidates them (see
+    EssentialFeaturesCache).
+
     Args:
         db: Database session
-        search_query: Text search query (searches title, text, niche)
+        search_query: Full-text query over title, text and niche
         platform: Platform filter
         niche: Niche/category filter
         tone: Tone filter
-        sort_by: Sorting method
-        
+        sort_by: Sorting method ("Newest", "Most Popular", "Most Copied",
+            "Highest Engagement" or "Relevance")
+        limit: Page size (defaults to HOOK_PAGE_SIZE, capped at HOOK_PAGE_MAX)
+        cursor: ``next_cursor`` of the previous page
+
     Returns:
-        List of hook dictionaries
+        Dictionary with the page of hook dictionaries and the next cursor
+        (None on the last page)
     """
+    limit = min(limit or settings.HOOK_PAGE_SIZE, settings.HOOK_PAGE_MAX)
+    cache_key = hooks_cache_key(search_query, platform, niche, tone, sort_by, cursor, limit)
+    page = get_cached_page(cache_key)
+    if page is not MISSING:
+        return page
+
     query = db.query(EssentialHook)
 
-    # Apply search filter
+    # Apply search filter (full-text index, see EssentialFeaturesSearch)
+    relevance, row_id = None, EssentialHook.id
     if search_query and search_query.strip():
-        search_term = f"%{search_query.strip()}%"
-        query = query.filter(
-            or_(
-                EssentialHook.title.ilike(search_term),
-                EssentialHook.text.ilike(search_term),
-                EssentialHook.niche.ilike(search_term)
-            )
-        )
+        query, relevance, row_id = apply_search(query, search_query)
 
     # Apply platform filter
     if platform and platform != "All Platforms":
@@ -287,26 +346,109 @@ def fetch_filtered_hooks_service(
     if tone and tone != "All Tones":
         query = query.filter(EssentialHook.tone == tone)
 
-    # Apply sorting
-    if sort_by == "Newest":
-        query = query.order_by(EssentialHook.id.desc())
-    elif sort_by == "Most Popular":
-        query = query.order_by(EssentialHook.view_count.desc())
-    elif sort_by == "Most Copied":
-        query = query.order_by(EssentialHook.copy_count.desc())
-    elif sort_by == "Highest Engagement":
-        # Calculate engagement as sum of interactions
-        engagement = (
-            EssentialHook.like_count +
-            EssentialHook.comment_count +
-            EssentialHook.view_count
-        )
-        query = query.order_by(engagement.desc())
+    # Apply sorting; "Newest" and unknown values order by id alone, as does
+    # "Relevance" without a full-text query
+    if sort_by == "Relevance":
+        sort_key = relevance
     else:
-        query = query.order_by(EssentialHook.id.desc())
+        sort_key = HOOK_SORT_KEYS.get(sort_by)
+    if sort_key is None:
+        sort_by = "Newest"
+
+    # Resume after the previous page
+    if cursor:
+        last_key, last_id = decode_hooks_cursor(cursor, sort_by)
+        if sort_key is None:
+            query = query.filter(row_id < last_id)
+        else:
+            # Spelled out rather than as a row value: SQLite only seeks an
+            # expression index on a plain bound like "key <= :last_key"
+            query = query.filter(
+                sort_key <= last_key,
+                or_(sort_key < last_key, row_id < last_id)
+            )
 
-    hooks = query.all()
-    return [hook.to_dict() for hook in hooks]
+    if sort_key is None:
+        query = query.order_by(row_id.desc())
+    else:
+        query = query.add_columns(sort_key).order_by(sort_key.desc(), row_id.desc())
+
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        if sort_key is None:
+            next_cursor = encode_hooks_cursor(sort_by, None, rows[-1].id)
+        else:
+            hook, key = rows[-1]
+            next_cursor = encode_hooks_cursor(sort_by, key, hook.id)
+
+    hooks = rows if sort_key is None else [hook for hook, _ in rows]
+    page = {
+        "hooks": [hook.to_dict() for hook in hooks],
+        "next_cursor": next_cursor
+    }
+    cache_page(cache_key, page)
+    return page
+
+
+def typeahead_hooks_service(
+    db: Session,
+    q: str,
+    platform: str = "All Platforms",
+    niche: str = "All Niches",
+    tone: str = "All Tones",
+    limit: int = 10
+) -> Dict:
+    """
+    Completions and matching hooks for a partially typed query.
+
+    Answered from the in-memory inverted index; the database is only read
+    for the titles of the returned hooks (one primary-key lookup). While
+    the index is still loading this raises 503.
+
+    Args:
+        db: Database session
+        q: Text typed so far; the last word is completed as a prefix
+        platform: Platform filter
+        niche: Niche/category filter
+        tone: Tone filter
+        limit: Max hooks returned, newest first
+
+    Returns:
+        Dictionary with word ``suggestions`` and matching ``hooks``
+        (id, title, platform, niche, tone)
+    """
+    filters = {
+        "platform": platform if platform != "All Platforms" else None,
+        "niche": niche if niche != "All Niches" else None,
+        "tone": tone if tone != "All Tones" else None,
+    }
+    index = get_hook_index()
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Typeahead index is still loading, retry shortly",
+            headers={"Retry-After": "5"},
+        )
+    found = index.search(q, filters, limit=limit)
+
+    hooks = []
+    if found["hook_ids"]:
+        rows = (
+            db.query(EssentialHook.id, EssentialHook.title, EssentialHook.platform,
+                     EssentialHook.niche, EssentialHook.tone)
+            .filter(EssentialHook.id.in_(found["hook_ids"]))
+            .all()
+        )
+        by_id = {row.id: row for row in rows}
+        hooks = [
+            {"id": row.id, "title": row.title, "platform": row.platform, "niche": row.niche, "tone": row.tone}
+            for row in (by_id.get(hook_id) for hook_id in found["hook_ids"]) if row is not None
+        ]
+    return {"suggestions": found["suggestions"], "hooks": hooks}
 
 
 def reset_filters_service(db: Session) -> List[Dict]:
@@ -4,7 +4,7 @@ SQLAlchemy ORM models for Essential Features module.
 Defines database schema for hooks, posts, comments, likes, and saves.
 """
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, UniqueConstraint, Index, func, literal_column
 from sqlalchemy.orm import relationship
 from ..core.database import Base
 
@@ -73,6 +73,29 @@ class EssentialHook(Base):
         }
 
 
+def _counter(column):
+    """Counter with NULLs read as 0, so keyset comparisons never hit NULL."""
+    return func.coalesce(column, literal_column("0"))
+
+
+# Sort keys of the hook explorer (GET /hooks) besides "Newest" (id). Each is
+# indexed together with id, the tiebreaker, so any page is one index range scan.
+HOOK_SORT_KEYS = {
+    "Most Popular": _counter(EssentialHook.view_count),
+    "Most Copied": _counter(EssentialHook.copy_count),
+    "Highest Engagement": (
+        _counter(EssentialHook.like_count)
+        + _counter(EssentialHook.comment_count)
+        + _counter(EssentialHook.view_count)
+    ),
+}
+HOOK_SORT_INDEXES = [
+    Index("ix_essential_hooks_views_id", HOOK_SORT_KEYS["Most Popular"], EssentialHook.id),
+    Index("ix_essential_hooks_copies_id", HOOK_SORT_KEYS["Most Copied"], EssentialHook.id),
+    Index("ix_essential_hooks_engagement_id", HOOK_SORT_KEYS["Highest Engagement"], EssentialHook.id),
+]
+
+
 class EssentialPost(Base):
     """Post model - stores user posts/content."""
     __tablename__ = "essential_posts"
@@ -17,6 +17,8 @@ from ..Settings.Settingsreportsschemas import (
 )
 from app.core.database import get_db
 from app.Auth.authroutes import get_current_user
+from app.Settings.models import User
+from app.services.scheduler import compute_next_run
 
 
 
@@ -74,7 +76,10 @@ async def update_scheduled_scraping(
     """
     Configure scheduled scraping
     
-    Set up automatic scraping at specified intervals.
+    Set up automatic scraping at specified intervals. ``time_of_day`` is
+    interpreted as UTC, and ``next_auto_scrape`` is returned in UTC.
+    Subreddits and Instagram accounts come from ``targets``; niches are
+    only scraped as YouTube keyword searches.
     """
     try:
         # Store scheduled scraping settings
@@ -83,9 +88,18 @@ async def update_scheduled_scraping(
             raise HTTPException(status_code=404, detail="User not found")
         
         user.scheduled_scrape_settings = settings.dict()
+        user.next_scheduled_scrape_at = compute_next_run(
+            user.scheduled_scrape_settings, user.id, last_run=user.last_scheduled_scrape_at
+        )
         db.commit()
         
-        return {"message": "Scheduled scraping configured successfully"}
+        return {
+            "message": "Scheduled scraping configured successfully",
+            "next_auto_scrape": user.next_scheduled_scrape_at,
+            "timezone": "UTC",
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -701,8 +715,8 @@ async def get_scheduled_tasks_info(
         return {
             "scheduled_scraping": user.scheduled_scrape_settings or {},
             "scheduled_reports": user.scheduled_report_settings or {},
-            "last_auto_scrape": None,  # Implement tracking
-            "next_auto_scrape": None,  # Calculate based on settings
+            "last_auto_scrape": user.last_scheduled_scrape_at,
+            "next_auto_scrape": user.next_scheduled_scrape_at,
             "last_report_sent": user.last_report_generated if hasattr(user, 'last_report_generated') else None
         }
         
@@ -307,8 +307,12 @@ class ScheduledScrapeSettings(BaseModel):
     enabled: bool
     platforms: List[str]
     frequency: str = Field(..., pattern="^(daily|weekly|monthly)$")
-    time_of_day: str = Field(..., pattern="^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$")
-    niches: List[str]
+    time_of_day: str = Field(..., pattern="^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$", description="HH:MM in UTC")
+    niches: List[str] = Field(..., description="Search keywords; only used on platforms that search by keyword (YouTube)")
+    targets: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description='Per-platform targets, e.g. {"reddit": ["Business"], "instagram": ["garyvee"]}',
+    )
     max_hooks_per_scrape: int = Field(default=50, ge=10, le=200)
 
 
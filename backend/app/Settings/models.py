@@ -87,6 +87,10 @@ class User(Base):
     ai_credits = Column(Integer, default=100)
     is_public = Column(Boolean, default=False)
     settings = Column(JSON, nullable=True)
+    scheduled_scrape_settings = Column(JSON, nullable=True)
+    scheduled_report_settings = Column(JSON, nullable=True)
+    last_scheduled_scrape_at = Column(DateTime, nullable=True)
+    next_scheduled_scrape_at = Column(DateTime, nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
@@ -1,5 +1,5 @@
 from app.core.database import Base, engine
-from app.models import hook_model
+from app.models import hook_model, watermark_model
 
 print("🛠 Creating database tables...")
 Base.metadata.create_all(bind=engine)
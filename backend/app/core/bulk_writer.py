@@ -0,0 +1,265 @@
+"""
+Bulk writer for scraped hooks.
+
+Hooks are written in chunks with executemany-style Core inserts instead of
+one ORM object per post. On PostgreSQL (psycopg2) the rows are streamed
+with COPY, which skips per-row statement overhead entirely.
+
+Every write is an ``ON CONFLICT DO NOTHING`` upsert on
+``(platform, content_hash)``, so re-scraping the same posts is a no-op.
+
+Reprocessing needs the opposite: re-derived rows must overwrite what is
+stored. bulk_replace_hooks matches rows on ``(platform, source_id)`` and
+updates the existing hooks in place (their ids, and anything pointing at
+them, are kept), inserting only the rows whose source_id is new.
+"""
+
+import csv
+import io
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.database import engine as default_engine
+from app.core.dedupe import content_hash
+from app.models.hook_model import Hook
+
+HOOK_COLUMNS = ("text", "tone", "niche", "platform", "content_hash", "source_id", "engagement", "created_at")
+CONFLICT_COLUMNS = ["platform", "content_hash"]
+REPLACE_COLUMNS = ("text", "content_hash", "engagement")  # always rewritten by bulk_replace_hooks
+
+
+class BulkInsertStats:
+    """Throughput numbers for one bulk insert."""
+
+    def __init__(self, rows: int, seconds: float, method: str, chunks: int, skipped: int = 0, updated: int = 0):
+        self.rows = rows
+        self.seconds = seconds
+        self.method = method
+        self.chunks = chunks
+        self.skipped = skipped  # duplicates dropped by the upsert
+        self.updated = updated  # existing hooks rewritten by bulk_replace_hooks
+
+    @property
+    def rows_per_sec(self) -> float:
+        if self.seconds <= 0:
+            return float(self.rows)
+        return self.rows / self.seconds
+
+    def to_dict(self) -> Dict:
+        """Convert stats to dictionary."""
+        return {
+            "rows": self.rows,
+            "skipped": self.skipped,
+            "updated": self.updated,
+            "seconds": round(self.seconds, 4),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+            "method": self.method,
+            "chunks": self.chunks,
+        }
+
+
+def _chunks(rows: List[Dict], size: int) -> Iterable[List[Dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _prepare_rows(rows: Iterable[Dict]) -> List[Dict]:
+    """Fill in content hashes and drop duplicates within the batch itself."""
+    prepared = []
+    seen = set()
+    now = datetime.utcnow()
+    for row in rows:
+        row = {col: row.get(col) for col in HOOK_COLUMNS}
+        row["content_hash"] = row["content_hash"] or content_hash(row["text"])
+        row["created_at"] = row["created_at"] or now
+        key = (row["platform"], row["content_hash"])
+        if key in seen:
+            continue
+        seen.add(key)
+        prepared.append(row)
+    return prepared
+
+
+def _upsert_statement(dialect_name: str):
+    """INSERT ... ON CONFLICT DO NOTHING for the current dialect."""
+    table = Hook.__table__
+    if dialect_name == "postgresql":
+        return pg_insert(table).on_conflict_do_nothing(index_elements=CONFLICT_COLUMNS)
+    if dialect_name == "sqlite":
+        return sqlite_insert(table).on_conflict_do_nothing(index_elements=CONFLICT_COLUMNS)
+    return insert(table)
+
+
+def _copy_chunk(cursor, chunk: List[Dict]) -> int:
+    """
+    COPY one chunk into a staging table, then upsert it into hooks.
+
+    COPY itself cannot skip conflicting rows, hence the staging table.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in chunk:
+        writer.writerow([row.get(col) for col in HOOK_COLUMNS])
+    buf.seek(0)
+
+    columns = ", ".join(HOOK_COLUMNS)
+    cursor.execute("TRUNCATE hooks_staging")
+    cursor.copy_expert(f"COPY hooks_staging ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
+    cursor.execute(
+        f"INSERT INTO {Hook.__tablename__} ({columns}) "
+        f"SELECT {columns} FROM hooks_staging "
+        f"ON CONFLICT ({', '.join(CONFLICT_COLUMNS)}) DO NOTHING"
+    )
+    return cursor.rowcount
+
+
+def bulk_insert_hooks(
+    rows: List[Dict],
+    chunk_size: Optional[int] = None,
+    bind: Optional[Engine] = None,
+) -> BulkInsertStats:
+    """
+    Upsert hook rows in chunks inside a single transaction.
+
+    Args:
+        rows: Dicts with text, tone, niche and platform keys, optionally
+            source_id and engagement
+        chunk_size: Rows per statement (defaults to HOOK_INSERT_CHUNK_SIZE)
+        bind: Engine to write through (defaults to the app engine)
+
+    Returns:
+        BulkInsertStats with inserted/skipped counts, elapsed time and rows/sec
+    """
+    bind = bind or default_engine
+    chunk_size = chunk_size or settings.HOOK_INSERT_CHUNK_SIZE
+    total = len(rows)
+    rows = _prepare_rows(rows)
+
+    started = time.perf_counter()
+    chunks = 0
+    inserted = 0
+    method = "executemany"
+
+    if rows:
+        with bind.begin() as conn:
+            if bind.dialect.driver == "psycopg2":
+                method = "copy"
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS hooks_staging "
+                        "(text TEXT, tone TEXT, niche TEXT, platform TEXT, content_hash VARCHAR(64), "
+                        "source_id VARCHAR(64), engagement INTEGER, created_at TIMESTAMP) "
+                        "ON COMMIT DROP"
+                    )
+                    for chunk in _chunks(rows, chunk_size):
+                        inserted += _copy_chunk(cursor, chunk)
+                        chunks += 1
+                finally:
+                    cursor.close()
+            else:
+                stmt = _upsert_statement(bind.dialect.name)
+                for chunk in _chunks(rows, chunk_size):
+                    result = conn.execute(stmt, chunk)
+                    inserted += result.rowcount if result.rowcount >= 0 else len(chunk)
+                    chunks += 1
+
+    return BulkInsertStats(inserted, time.perf_counter() - started, method, chunks, total - inserted)
+
+
+def _replace_chunk(conn, chunk: List[Dict], columns: List[str]):
+    """Update the chunk's hooks that already exist, then insert the rest. Returns (inserted, updated)."""
+    table = Hook.__table__
+    existing: Dict[tuple, int] = {}   # (platform, source_id) -> id
+    taken: Dict[tuple, int] = {}      # (platform, content_hash) -> id
+    for platform in {row["platform"] for row in chunk}:
+        rows = [row for row in chunk if row["platform"] == platform]
+        source_ids = [row["source_id"] for row in rows if row["source_id"]]
+        for hook_id, source_id in conn.execute(
+            select(table.c.id, table.c.source_id)
+            .where(table.c.platform == platform, table.c.source_id.in_(source_ids))
+            .order_by(table.c.id)
+        ):
+            existing.setdefault((platform, source_id), hook_id)
+        for hook_id, hash_ in conn.execute(
+            select(table.c.id, table.c.content_hash)
+            .where(table.c.platform == platform, table.c.content_hash.in_([row["content_hash"] for row in rows]))
+        ):
+            taken[(platform, hash_)] = hook_id
+
+    keep_text = [col for col in columns if col not in ("text", "content_hash")]
+    batches: Dict[tuple, List[Dict]] = {tuple(columns): [], tuple(keep_text): []}
+    inserts = []
+    for row in chunk:
+        hook_id = existing.get((row["platform"], row["source_id"]))
+        if hook_id is None:
+            inserts.append(row)
+            continue
+        # If another hook already holds this text, rewrite everything but the text
+        owner = taken.get((row["platform"], row["content_hash"]), hook_id)
+        cols = columns if owner == hook_id else keep_text
+        batches[tuple(cols)].append(dict({f"new_{col}": row[col] for col in cols}, row_id=hook_id))
+
+    updated = 0
+    for cols, params in batches.items():
+        if params:
+            stmt = (
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values({col: bindparam(f"new_{col}") for col in cols})
+            )
+            conn.execute(stmt, params)
+            updated += len(params)
+
+    inserted = 0
+    if inserts:
+        result = conn.execute(_upsert_statement(conn.dialect.name), inserts)
+        inserted = result.rowcount if result.rowcount >= 0 else len(inserts)
+    return inserted, updated
+
+
+def bulk_replace_hooks(
+    rows: List[Dict],
+    chunk_size: Optional[int] = None,
+    bind: Optional[Engine] = None,
+    update_labels: bool = False,
+) -> BulkInsertStats:
+    """
+    Overwrite hooks matched on ``(platform, source_id)`` and insert the rest.
+
+    Args:
+        rows: Same shape as bulk_insert_hooks; rows without a source_id can
+            only be inserted
+        chunk_size: Rows per statement (defaults to HOOK_INSERT_CHUNK_SIZE)
+        bind: Engine to write through (defaults to the app engine)
+        update_labels: Also overwrite tone and niche (when the rows carry
+            fresh labels rather than the "unknown" placeholder)
+
+    Returns:
+        BulkInsertStats with inserted, updated and skipped counts
+    """
+    bind = bind or default_engine
+    chunk_size = chunk_size or settings.HOOK_INSERT_CHUNK_SIZE
+    columns = list(REPLACE_COLUMNS) + (["tone", "niche"] if update_labels else [])
+    total = len(rows)
+    rows = _prepare_rows(rows)
+
+    started = time.perf_counter()
+    chunks = inserted = updated = 0
+    if rows:
+        with bind.begin() as conn:
+            for chunk in _chunks(rows, chunk_size):
+                chunk_inserted, chunk_updated = _replace_chunk(conn, chunk, columns)
+                inserted += chunk_inserted
+                updated += chunk_updated
+                chunks += 1
+
+    return BulkInsertStats(inserted, time.perf_counter() - started, "replace", chunks,
+                           total - inserted - updated, updated)
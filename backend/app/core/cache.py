@@ -0,0 +1,98 @@
+"""
+Thread-safe TTL + LRU cache with hit/miss statistics.
+
+Entries expire ``ttl`` seconds after they were stored, and once the cache
+holds ``max_entries`` the least recently used entry is evicted. Stats are
+kept per cache so TTLs and sizes can be tuned from real hit rates.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+MISSING = object()  # returned by get() on a miss when no default is given
+
+
+class CacheStats:
+    """Counters for one cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # dropped because the cache was full
+        self.expirations = 0  # dropped because the TTL passed
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert stats to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries also expire after a TTL.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted
+        ttl: Default lifetime of an entry in seconds
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value, or ``default`` on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._entries[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store a value, evicting the least recently used entry if full."""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def to_dict(self) -> Dict:
+        """Size, limits and counters."""
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries, "ttl_seconds": self.ttl,
+                    **self.stats.to_dict()}
@@ -0,0 +1,195 @@
+"""
+Lazily initialised platform clients with an explicit warmup hook.
+
+Scraper modules used to build their clients (praw, instaloader, the YouTube
+discovery document) at import time, so every worker paid for them at boot
+and a missing credential crashed the whole app. Each client is now a
+``LazyClient``, built on first use, in one of two modes:
+
+- shared: one instance from ``get()`` for every thread. Only for objects
+  that are safe to share (the parsed YouTube discovery document).
+- pooled (``pool_size``): praw.Reddit and Instaloader must not be used
+  from two threads at once, and fan_out, the job workers and the refresh
+  loop all scrape on their own threads. Callers take an instance for
+  their exclusive use with ``checkout()``. Idle instances are kept (up to
+  ``pool_size``) so the next scrape reuses their session. ``get()`` is
+  refused for pooled clients.
+
+``start_warmup()`` runs from the FastAPI startup hook and builds every
+registered client on a background thread after CLIENT_WARMUP_DELAY seconds,
+once the server is already accepting traffic. A client that fails to build
+(e.g. missing credentials) only breaks requests for its own platform.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from app.core.config import settings
+
+
+class LazyClient:
+    """
+    Lazily built client with build timing, shared or pooled.
+
+    Args:
+        name: Registry and log name
+        factory: Builds one instance
+        pool_size: Pool non-thread-safe instances, keeping up to this many
+            idle; None shares a single instance
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], pool_size: Optional[int] = None):
+        self.name = name
+        self.factory = factory
+        self.pool_size = pool_size
+        self.build_seconds: Optional[float] = None
+        self.built_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.builds = 0
+        self._client = None
+        self._idle: "LifoQueue" = LifoQueue()
+        self._lock = threading.Lock()
+
+    @property
+    def pooled(self) -> bool:
+        return self.pool_size is not None
+
+    @property
+    def ready(self) -> bool:
+        return self.builds > 0 if self.pooled else self._client is not None
+
+    def _build(self):
+        started = time.perf_counter()
+        try:
+            client = self.factory()
+        except Exception as e:
+            self.error = str(e)
+            raise
+        self.build_seconds = time.perf_counter() - started
+        self.built_at = time.time()
+        self.error = None
+        self.builds += 1
+        return client
+
+    @contextmanager
+    def checkout(self):
+        """
+        An instance for the caller's exclusive use (pooled clients only).
+
+        Usage:
+            with _reddit.checkout() as reddit:
+                reddit.subreddit("Business").hot(limit=10)
+        """
+        if not self.pooled:
+            yield self.get()
+            return
+        try:
+            client = self._idle.get_nowait()
+        except Empty:
+            client = self._build()
+        try:
+            yield client
+        finally:
+            if self._idle.qsize() < self.pool_size:
+                self._idle.put(client)
+
+    def get(self):
+        """Return the shared client, building it on first use."""
+        if self.pooled:
+            raise RuntimeError(f"{self.name} client is not thread-safe; use checkout()")
+        client = self._client
+        if client is not None:
+            return client
+        with self._lock:
+            if self._client is None:
+                self._client = self._build()
+            return self._client
+
+    def warm(self) -> bool:
+        """Build the client (one idle instance if pooled) now; returns False (and records why) on failure."""
+        try:
+            if self.pooled:
+                with self.checkout():
+                    pass
+            else:
+                self.get()
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not warm {self.name} client: {e}")
+            return False
+
+    def reset(self):
+        """Drop the client so the next ``get()`` rebuilds it."""
+        with self._lock:
+            self._client = None
+            self.build_seconds = self.built_at = None
+            self.builds = 0
+        while True:
+            try:
+                self._idle.get_nowait()
+            except Empty:
+                break
+
+    def to_dict(self) -> Dict:
+        """Convert client state to dictionary."""
+        return {
+            "ready": self.ready,
+            "pooled": self.pooled,
+            "builds": self.builds,
+            "idle": self._idle.qsize() if self.pooled else None,
+            "build_seconds": round(self.build_seconds, 4) if self.build_seconds is not None else None,
+            "built_at": self.built_at,
+            "error": self.error,
+        }
+
+
+_registry: Dict[str, LazyClient] = {}
+_warmup: Dict[str, Any] = {}
+_warmup_thread: Optional[threading.Thread] = None
+
+
+def lazy_client(name: str, factory: Callable[[], Any], pool_size: Optional[int] = None) -> LazyClient:
+    """Create a LazyClient (pooled when ``pool_size`` is given) and register it for warmup."""
+    client = _registry[name] = LazyClient(name, factory, pool_size)
+    return client
+
+
+def warm_clients(names: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    """
+    Build the given registered clients (all by default).
+
+    Returns:
+        Dictionary mapping client name to whether it is ready
+    """
+    started = time.perf_counter()
+    results = {name: _registry[name].warm() for name in (names or list(_registry))}
+    _warmup.update(finished_at=time.time(), seconds=round(time.perf_counter() - started, 4), results=results)
+    ready = sum(results.values())
+    print(f"🔥 Warmed {ready}/{len(results)} platform clients in {_warmup['seconds']:.3f}s")
+    return results
+
+
+def start_warmup(delay: Optional[float] = None):
+    """Warm every registered client on a background thread after ``delay`` seconds."""
+    global _warmup_thread
+    if not settings.CLIENT_WARMUP_ENABLED or (_warmup_thread and _warmup_thread.is_alive()):
+        return
+    delay = settings.CLIENT_WARMUP_DELAY if delay is None else delay
+
+    def _run():
+        time.sleep(delay)
+        warm_clients()
+
+    _warmup_thread = threading.Thread(target=_run, name="client-warmup", daemon=True)
+    _warmup_thread.start()
+
+
+def get_client_status() -> Dict:
+    """State of every registered client and of the last warmup."""
+    return {
+        "clients": {name: client.to_dict() for name, client in _registry.items()},
+        "warmup": dict(_warmup) or None,
+    }
@@ -2,16 +2,112 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     # Reddit API
-    REDDIT_CLIENT_ID: str
-    REDDIT_CLIENT_SECRET: str
-    REDDIT_USER_AGENT: str
+    REDDIT_CLIENT_ID: str | None = None  # Reddit scraping is unavailable until these are set
+    REDDIT_CLIENT_SECRET: str | None = None
+    REDDIT_USER_AGENT: str | None = None
+    REDDIT_OAUTH_URL: str | None = None  # override to point praw at a stand-in server
+    REDDIT_URL: str | None = None
+    REDDIT_LISTINGS: str = "hot,new,top:day,top:week,rising"  # pulled concurrently on full scrapes
+    REDDIT_SESSION_POOL_SIZE: int = 16  # praw.Reddit sessions / threads for concurrent listings
 
     # YouTube API
     YOUTUBE_API_KEY: str | None = None
+    YOUTUBE_API_ENDPOINT: str | None = None  # override to point the client at a stand-in server
+
+    # Instagram (optional login + on-disk profile / cursor cache)
+    INSTAGRAM_USERNAME: str | None = None
+    INSTAGRAM_SESSION_FILE: str | None = None
+    INSTAGRAM_CACHE_DIR: str = ".cache/instagram"
+    INSTAGRAM_PROFILE_CACHE_TTL: int = 86400  # seconds
+    INSTAGRAM_SLEEP: bool = True  # instaloader's randomised politeness delay between requests
 
     # Database
     DATABASE_URL: str = "sqlite:///./hooks.db"
 
+    # Concurrent scrape engine
+    SCRAPE_TARGET_TIMEOUT: float = 60.0  # seconds allowed per target
+    REDDIT_SCRAPE_CONCURRENCY: int = 4
+    YOUTUBE_SCRAPE_CONCURRENCY: int = 4
+    INSTAGRAM_SCRAPE_CONCURRENCY: int = 2
+
+    # Platform rate limits (token bucket per platform + credential; 0 = unlimited)
+    REDDIT_REQUESTS_PER_MINUTE: int = 100
+    YOUTUBE_DAILY_QUOTA: int = 10000  # quota units
+    YOUTUBE_CLIENT_POOL_SIZE: int = 8  # idle YouTube clients kept for reuse
+    INSTAGRAM_REQUESTS_PER_HOUR: int = 200
+    RATE_LIMIT_MAX_RETRIES: int = 5
+
+    # Platform clients are built lazily; warmup builds them once the server is up
+    CLIENT_WARMUP_ENABLED: bool = True
+    CLIENT_WARMUP_DELAY: float = 1.0  # seconds after startup
+
+    # /internal/* diagnostics (rate limits, caches, metrics); unauthenticated, so off by default
+    INTERNAL_ROUTES_ENABLED: bool = False
+
+    # Background scrape jobs
+    SCRAPE_JOB_WORKERS: int = 4
+
+    # Scheduled scraping
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_POLL_SECONDS: float = 60.0
+    SCHEDULER_JITTER_SECONDS: int = 900  # spread users over this window after their time_of_day
+
+    # Engagement refresh for ingested hooks (app/services/engagement_refresh.py)
+    ENGAGEMENT_REFRESH_ENABLED: bool = True
+    ENGAGEMENT_REFRESH_POLL_SECONDS: float = 900.0
+    ENGAGEMENT_REFRESH_RECENT_HOURS: int = 48  # hooks younger than this are refreshed more often
+    ENGAGEMENT_REFRESH_RECENT_SECONDS: int = 3600
+    ENGAGEMENT_REFRESH_STALE_SECONDS: int = 86400
+    ENGAGEMENT_REFRESH_MAX_AGE_DAYS: int = 30  # stop refreshing after this
+    ENGAGEMENT_REFRESH_MAX_PER_RUN: int = 5000  # hooks per platform per run
+
+    # Cross-user scrape result cache (0 disables a platform)
+    SCRAPE_CACHE_TTL_REDDIT: float = 300.0
+    SCRAPE_CACHE_TTL_YOUTUBE: float = 900.0
+    SCRAPE_CACHE_TTL_INSTAGRAM: float = 1800.0
+    SCRAPE_CACHE_MAX_ENTRIES: int = 512  # per platform
+
+    # Streaming scrape responses
+    SCRAPE_STREAM_BATCH_SIZE: int = 25  # posts committed per micro-batch
+
+    # Ingest pipeline (app/core/scraper.py)
+    PIPELINE_QUEUE_SIZE: int = 200       # items buffered between two stages
+    PIPELINE_BATCH_SIZE: int = 100       # rows per label / store batch
+    PIPELINE_BATCH_TIMEOUT: float = 1.0  # seconds before a partial batch is flushed
+    SCRAPE_AUTO_LABEL: bool = False      # run the zero-shot labeler inside the pipeline
+
+    # Scrape timing metrics (app/core/metrics.py)
+    METRICS_RUN_LOG: str | None = ".cache/metrics/scrape_runs.jsonl"  # None disables the run log
+    METRICS_RUN_HISTORY: int = 500  # recent runs kept in memory
+    METRICS_MAX_TARGETS: int = 1000  # per-target histograms kept (least recently scraped dropped)
+
+    # Raw payload archive (app/core/raw_archive.py)
+    RAW_ARCHIVE_DIR: str | None = ".cache/raw-archive"  # None disables archiving
+    RAW_ARCHIVE_PART_BYTES: int = 64 * 1024 * 1024  # rotate part files past this size
+    RAW_ARCHIVE_FLUSH_RECORDS: int = 500
+    RAW_ARCHIVE_FLUSH_SECONDS: float = 30.0
+    RAW_ARCHIVE_PRESET: int = 6  # xz compression level
+
+    # Bulk hook writer
+    HOOK_INSERT_CHUNK_SIZE: int = 1000
+
+    # Hook explorer pages (GET /hooks)
+    HOOK_PAGE_SIZE: int = 50
+    HOOK_PAGE_MAX: int = 200
+    HOOK_CACHE_TTL: float = 30.0  # seconds a cached page is served (0 disables the cache)
+    HOOK_CACHE_MAX_ENTRIES: int = 1024
+    HOOK_CACHE_COUNTER_FLUSH_SECONDS: float = 5.0  # counter-ordered pages lag counter writes by up to this
+
+    # Niche search without pg_trgm (app/services/niche_search.py)
+    NICHE_INDEX_REFRESH_SECONDS: float = 60.0  # how often new niches are picked up
+
+    # Typeahead inverted index (app/EssentialFeatures/EssentialFeaturesIndex.py)
+    HOOK_INDEX_ENABLED: bool = True  # load at startup; otherwise on the first typeahead (503 until ready)
+    HOOK_INDEX_SNAPSHOT: str | None = ".cache/hook-index.bin"  # None disables snapshots
+    HOOK_INDEX_SYNC_SECONDS: float = 30.0  # how often hooks inserted by other workers are picked up
+    HOOK_INDEX_SYNC_OVERLAP: int = 1000  # ids below the synced high-water mark re-read each sync
+    HOOK_INDEX_REBUILD_SECONDS: float = 3600.0  # full rebuild, for other workers' edits and deletes (0 = never)
+
     class Config:
         env_file = ".env"
         extra = "ignore"  # ✅ Ignore extra env variables
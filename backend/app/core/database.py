@@ -1,5 +1,5 @@
-from typing import Generator
-from sqlalchemy import create_engine
+from typing import Dict, Generator, Iterable, List
+from sqlalchemy import Table, create_engine, inspect, text
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -48,4 +48,38 @@ def init_db() -> None:
         print("✅ Tables created successfully!")
     except SQLAlchemyError as exc:
         print("❌ Failed to create tables:", exc)
-        raise
\ No newline at end of file
+        raise
+
+
+def ensure_columns(table: Table, columns: Dict[str, str], indexes: Iterable[str] = (), bind=None) -> List[str]:
+    """
+    Bring a table that predates new model columns up to date.
+
+    create_all() only creates missing tables, so columns added to an
+    existing model have to be added with ALTER TABLE. Tables that don't
+    exist yet are left to create_all().
+
+    Args:
+        table: Model table, e.g. ``Hook.__table__``
+        columns: Column name -> DDL type for the columns that may be missing
+        indexes: Names of the table's model indexes to create if missing
+        bind: Engine to migrate (defaults to the app engine)
+
+    Returns:
+        Names of the columns that were added
+    """
+    bind = bind or engine
+    if not inspect(bind).has_table(table.name):
+        return []
+    existing = {c["name"] for c in inspect(bind).get_columns(table.name)}
+    missing = [name for name in columns if name not in existing]
+    if missing:
+        print(f"🛠 Adding {table.name} columns: {', '.join(missing)}...")
+        with bind.begin() as conn:
+            for name in missing:
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {columns[name]}"))
+    indexes = set(indexes)
+    for index in table.indexes:
+        if index.name in indexes:
+            index.create(bind, checkfirst=True)
+    return missing
@@ -0,0 +1,21 @@
+"""
+Content hashing used to de-duplicate hooks.
+
+Two hooks are considered the same when their text matches after Unicode
+normalization, case folding and whitespace collapsing.
+"""
+
+import hashlib
+import unicodedata
+from typing import Optional
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Normalize hook text so trivial variations hash to the same value."""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return " ".join(text.split())
+
+
+def content_hash(text: Optional[str]) -> str:
+    """Return the hex sha256 of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
@@ -0,0 +1,329 @@
+"""
+Per-stage timing for the scrape-to-DB path.
+
+Every scrape_and_store / scrape_stream call runs inside ``scrape_run()``,
+which times four spans:
+
+    fetch      platform API calls and paging
+    transform  mapping posts to hook rows (normalize, dedupe, label)
+    persist    bulk inserts and commits
+    log        printing the run summary
+
+The ingest pipeline already measures busy time per stage, so for pipeline
+runs the spans come from its PipelineReport; streaming scrapes time their
+own fetch / persist calls. Finished runs feed latency histograms labelled
+by platform, target and span (served by ``GET /internal/metrics``), and
+are appended to a JSONL log that the CLI summarises:
+
+    python -m app.core.metrics --last 200 --top 10
+"""
+
+import argparse
+import bisect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+SPANS = ("fetch", "transform", "persist", "log")
+# Pipeline stage -> span
+PIPELINE_SPANS = {"fetch": "fetch", "normalize": "transform", "dedupe": "transform",
+                  "label": "transform", "store": "persist"}
+# Upper bounds in seconds; the last bucket is +Inf
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets.
+
+    ``counts[i]`` holds only the observations that fell into bucket ``i``
+    (the last one is +Inf); they are not cumulative. ``to_prometheus()``
+    sums them into the cumulative ``le`` series Prometheus expects.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        """Convert histogram to dictionary."""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 4),
+            "mean": round(self.sum / self.count, 4) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "max": round(self.max, 4),
+            "buckets": {str(b): n for b, n in zip(self.buckets + ("+Inf",), self.counts)},
+        }
+
+
+class ScrapeRun:
+    """Span timings for one scrape of one target."""
+
+    def __init__(self, platform: str, target: str, mode: str = "pipeline"):
+        self.platform = platform
+        self.target = target
+        self.mode = mode
+        self.started_at = time.time()
+        self.spans: Dict[str, float] = {}
+        self.items = 0
+        self.error: Optional[str] = None
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, span: str, seconds: float):
+        with self._lock:
+            self.spans[span] = self.spans.get(span, 0.0) + seconds
+
+    @contextmanager
+    def span(self, name: str):
+        """Time a block into span ``name``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add_pipeline(self, report):
+        """Fold a PipelineReport's per-stage busy time into the spans."""
+        for stage in report.stages:
+            self.add(PIPELINE_SPANS.get(stage.name, stage.name), stage.busy_seconds)
+        fetch = report.stage("fetch")
+        self.items = fetch.items_out if fetch else self.items
+
+    def to_dict(self) -> Dict:
+        """Convert run to dictionary."""
+        return {
+            "platform": self.platform,
+            "target": self.target,
+            "mode": self.mode,
+            "started_at": self.started_at,
+            "total": round(self.total, 4),
+            "items": self.items,
+            "error": self.error,
+            "spans": {name: round(seconds, 4) for name, seconds in self.spans.items()},
+        }
+
+
+class ScrapeMetrics:
+    """Histograms by (platform, target, span) plus a window of recent runs."""
+
+    def __init__(self, max_targets: int, history: int, log_file: Optional[str] = None):
+        self.max_targets = max_targets
+        self.log_file = log_file
+        self.runs: "deque[Dict]" = deque(maxlen=history)
+        # (platform, span) -> histogram, over all targets
+        self.platform_histograms: Dict[Tuple[str, str], Histogram] = {}
+        # (platform, target) -> span -> histogram, least recently used first
+        self.target_histograms: "OrderedDict[Tuple[str, str], Dict[str, Histogram]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, run: ScrapeRun):
+        entry = run.to_dict()
+        spans = dict(run.spans, total=run.total)
+        with self._lock:
+            self.runs.append(entry)
+            key = (run.platform, run.target)
+            per_target = self.target_histograms.pop(key, None) or {}
+            self.target_histograms[key] = per_target
+            while len(self.target_histograms) > self.max_targets:
+                self.target_histograms.popitem(last=False)
+            for name, seconds in spans.items():
+                self.platform_histograms.setdefault((run.platform, name), Histogram()).observe(seconds)
+                per_target.setdefault(name, Histogram()).observe(seconds)
+            if self.log_file:
+                self._append(entry)
+
+    def _append(self, entry: Dict):
+        try:
+            os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+            with open(self.log_file, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry) + "\n")
+        except OSError as e:
+            print(f"⚠️ Could not write scrape metrics log: {e}")
+
+    def to_dict(self, recent: int = 20) -> Dict:
+        """Histograms per platform and per target, plus the latest runs."""
+        with self._lock:
+            return {
+                "platforms": {
+                    f"{platform}:{span}": h.to_dict() for (platform, span), h in self.platform_histograms.items()
+                },
+                "targets": [
+                    {"platform": platform, "target": target,
+                     "spans": {span: h.to_dict() for span, h in spans.items()}}
+                    for (platform, target), spans in reversed(self.target_histograms.items())
+                ],
+                "recent_runs": list(self.runs)[-recent:],
+            }
+
+    def to_prometheus(self) -> str:
+        """Render the per-target histograms in Prometheus text format."""
+        name = "hook_scrape_span_seconds"
+        lines = [f"# HELP {name} Time spent per scrape span", f"# TYPE {name} histogram"]
+        with self._lock:
+            for (platform, target), spans in self.target_histograms.items():
+                for span, h in spans.items():
+                    labels = f'platform="{platform}",target="{_escape(target)}",span="{span}"'
+                    cumulative = 0
+                    for bound, n in zip(h.buckets + ("+Inf",), h.counts):
+                        cumulative += n
+                        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f"{name}_sum{{{labels}}} {h.sum:.6f}")
+                    lines.append(f"{name}_count{{{labels}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_metrics = ScrapeMetrics(settings.METRICS_MAX_TARGETS, settings.METRICS_RUN_HISTORY, settings.METRICS_RUN_LOG)
+
+
+@contextmanager
+def scrape_run(platform: str, target: str, mode: str = "pipeline") -> Iterator[ScrapeRun]:
+    """
+    Time one scrape and record it when the block exits.
+
+    Usage:
+        with scrape_run("reddit", "Business") as run:
+            posts, report = ingest(..., run=run)
+    """
+    run = ScrapeRun(platform, target, mode)
+    started = time.perf_counter()
+    try:
+        yield run
+    except GeneratorExit:
+        run.error = "aborted"  # streaming client went away
+        raise
+    except Exception as e:
+        run.error = str(e)
+        raise
+    finally:
+        run.total = time.perf_counter() - started
+        _metrics.record(run)
+
+
+def get_scrape_metrics(recent: int = 20) -> Dict:
+    return _metrics.to_dict(recent)
+
+
+def get_scrape_metrics_prometheus() -> str:
+    return _metrics.to_prometheus()
+
+
+# ---------------------------------------------------------------------------
+# CLI: summarise the run log
+def load_runs(path: str, last: int) -> List[Dict]:
+    """Read the last ``last`` runs from a JSONL run log."""
+    runs: "deque[Dict]" = deque(maxlen=last)
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+    return list(runs)
+
+
+def summarize_runs(runs: List[Dict], top: int = 10) -> Dict:
+    """
+    Slowest targets and per-span totals over a list of runs.
+
+    Returns:
+        Dictionary with "targets" (slowest first by mean total) and "spans"
+        (share of all scrape time per span)
+    """
+    targets: Dict[Tuple[str, str], Dict] = {}
+    span_totals: Dict[str, float] = {}
+    for run in runs:
+        entry = targets.setdefault((run["platform"], run["target"]), {"runs": 0, "total": 0.0, "max": 0.0,
+                                                                       "errors": 0, "spans": {}})
+        entry["runs"] += 1
+        entry["total"] += run["total"]
+        entry["max"] = max(entry["max"], run["total"])
+        entry["errors"] += 1 if run.get("error") else 0
+        for span, seconds in run.get("spans", {}).items():
+            entry["spans"][span] = entry["spans"].get(span, 0.0) + seconds
+            span_totals[span] = span_totals.get(span, 0.0) + seconds
+
+    ranked = sorted(targets.items(), key=lambda kv: kv[1]["total"] / kv[1]["runs"], reverse=True)
+    all_spans = sum(span_totals.values()) or 1.0
+    return {
+        "runs": len(runs),
+        "targets": [
+            {
+                "platform": platform,
+                "target": target,
+                "runs": e["runs"],
+                "mean": round(e["total"] / e["runs"], 3),
+                "max": round(e["max"], 3),
+                "errors": e["errors"],
+                "slowest_span": max(e["spans"], key=e["spans"].get) if e["spans"] else None,
+            }
+            for (platform, target), e in ranked[:top]
+        ],
+        "spans": {
+            span: {"seconds": round(seconds, 3), "share": round(seconds / all_spans, 3)}
+            for span, seconds in sorted(span_totals.items(), key=lambda kv: kv[1], reverse=True)
+        },
+    }
+
+
+def print_summary(summary: Dict):
+    print(f"📊 {summary['runs']} scrape runs")
+    print("🐢 Slowest targets (mean total):")
+    for t in summary["targets"]:
+        print(f"   {t['platform']:<10} {t['target']:<30} {t['mean']:>8.3f}s mean  {t['max']:>8.3f}s max  "
+              f"x{t['runs']}  slowest span: {t['slowest_span']}" + (f"  ❌ {t['errors']} errors" if t["errors"] else ""))
+    print("⏱️ Time by span:")
+    for span, s in summary["spans"].items():
+        print(f"   {span:<10} {s['seconds']:>10.3f}s  {s['share'] * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarise the slowest scrape targets and spans.")
+    parser.add_argument("--log", default=settings.METRICS_RUN_LOG, help="JSONL run log (default: METRICS_RUN_LOG)")
+    parser.add_argument("--last", type=int, default=100, help="Number of most recent runs to include")
+    parser.add_argument("--top", type=int, default=10, help="Targets to list")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+    if not args.log or not os.path.exists(args.log):
+        parser.error(f"no run log at {args.log!r}")
+
+    summary = summarize_runs(load_runs(args.log, args.last), args.top)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary)
@@ -0,0 +1,193 @@
+"""
+Process-wide rate limiting for platform API clients.
+
+Every platform client (praw, the YouTube service, instaloader) draws from a
+token bucket keyed by ``(platform, credential)``, so concurrent scrapes from
+many users share one budget instead of each hammering the API on its own.
+Server retry hints pause the whole bucket, and retries use jittered
+exponential backoff.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from app.core.config import settings
+
+
+# (tokens per second, burst capacity) per platform
+PLATFORM_LIMITS: Dict[str, Tuple[float, float]] = {
+    # Reddit OAuth: N requests per minute per client id
+    "reddit": (settings.REDDIT_REQUESTS_PER_MINUTE / 60.0, float(settings.REDDIT_REQUESTS_PER_MINUTE)),
+    # YouTube: daily quota in units, refilled evenly across the day
+    "youtube": (settings.YOUTUBE_DAILY_QUOTA / 86400.0, float(settings.YOUTUBE_DAILY_QUOTA)),
+    # Instagram: undocumented, keep well below the 429 threshold
+    "instagram": (settings.INSTAGRAM_REQUESTS_PER_HOUR / 3600.0, 10.0),
+}
+DEFAULT_LIMIT = (1.0, 5.0)
+
+BACKOFF_BASE = 1.0   # seconds
+BACKOFF_CAP = 120.0  # seconds
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with a pause switch for server retry hints.
+
+    A rate of 0 (e.g. a limit configured as 0) means unlimited: tokens are
+    handed out immediately and only server pauses are honoured.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate < 0:
+            raise ValueError(f"Token bucket rate must be >= 0, got {rate}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.created = time.monotonic()
+        self._updated = self.created
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.acquired = 0.0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+        self.retries = 0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """Block until ``cost`` tokens are available; return seconds waited."""
+        cost = min(cost, self.capacity) if self.rate else cost
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                delay = max(0.0, self._paused_until - now)
+                if delay == 0.0:
+                    if self.rate == 0:
+                        self.acquired += cost
+                        self.wait_seconds += waited
+                        return waited
+                    if self.tokens >= cost:
+                        self.tokens -= cost
+                        self.acquired += cost
+                        self.wait_seconds += waited
+                        return waited
+                    delay = (cost - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float, retry: bool = False):
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429)."""
+        with self._lock:
+            self.throttled += 1
+            if retry:
+                self.retries += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def drain(self, remaining: float, reset_in: float):
+        """Sync the bucket with server-reported remaining calls and reset time."""
+        with self._lock:
+            if remaining <= 0:
+                self._paused_until = max(self._paused_until, time.monotonic() + reset_in)
+            self.tokens = min(self.tokens, remaining)
+
+    def to_dict(self) -> Dict:
+        """Convert bucket metrics to dictionary."""
+        with self._lock:
+            self._refill(time.monotonic())
+            elapsed = max(time.monotonic() - self.created, 1e-9)
+            ceiling = self.capacity + elapsed * self.rate
+            return {
+                "rate_per_sec": round(self.rate, 4) if self.rate else None,  # None: unlimited
+                "capacity": self.capacity,
+                "tokens": round(self.tokens, 2),
+                "acquired": round(self.acquired, 2),
+                "utilization": round(self.acquired / ceiling, 4) if self.rate else None,
+                "wait_seconds": round(self.wait_seconds, 3),
+                "throttled": self.throttled,
+                "retries": self.retries,
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 2),
+            }
+
+
+_buckets: Dict[Tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(platform: str, credential: Optional[str] = None) -> TokenBucket:
+    """Return the shared bucket for a platform + credential, creating it on first use."""
+    key = (platform, credential or "default")
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            rate, capacity = PLATFORM_LIMITS.get(platform, DEFAULT_LIMIT)
+            bucket = _buckets[key] = TokenBucket(rate, capacity)
+        return bucket
+
+
+def acquire(platform: str, credential: Optional[str] = None, cost: float = 1.0) -> float:
+    """Take ``cost`` tokens from the shared bucket, blocking if needed."""
+    return get_bucket(platform, credential).acquire(cost)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before retry number ``attempt`` (0-based).
+
+    A server hint wins; otherwise "full jitter" exponential backoff.
+    """
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+def record_throttle(platform: str, credential: Optional[str], attempt: int,
+                    retry_after: Optional[float] = None) -> float:
+    """
+    Register a throttled response: pause the shared bucket and count a retry.
+
+    Returns:
+        Seconds the caller should sleep before retrying
+    """
+    delay = backoff_delay(attempt, retry_after)
+    get_bucket(platform, credential).pause(delay, retry=True)
+    return delay
+
+
+def get_rate_limit_metrics() -> Dict:
+    """Metrics for every bucket, keyed by ``platform:credential``."""
+    with _buckets_lock:
+        buckets = list(_buckets.items())
+    return {
+        f"{platform}:{_mask(credential)}": bucket.to_dict()
+        for (platform, credential), bucket in buckets
+    }
+
+
+def _mask(credential: str) -> str:
+    """Don't leak API keys through the metrics endpoint."""
+    if credential == "default" or len(credential) <= 6:
+        return credential
+    return credential[:4] + "…"
@@ -0,0 +1,190 @@
+"""
+Append-only archive of raw platform payloads.
+
+Hooks only keep the derived text, so changing the extraction logic used to
+mean scraping everything again. Every raw item the scrapers receive (a
+Reddit submission, a YouTube video resource, an Instagram media node) is
+now also appended here, and app/services/raw_reprocessor.py can re-derive
+hooks from it offline.
+
+Layout, partitioned by platform and UTC date::
+
+    RAW_ARCHIVE_DIR/<platform>/<YYYY-MM-DD>/part-<pid>-<n>.jsonl.xz
+
+One JSON record per line::
+
+    {"platform": "reddit", "target": "Business", "kind": "submission",
+     "fetched_at": "2026-10-17T09:00:00", "payload": {...}}
+
+Records are buffered per platform and written every
+RAW_ARCHIVE_FLUSH_RECORDS records, RAW_ARCHIVE_FLUSH_SECONDS, or at exit.
+Each flush appends one complete xz stream to the current part file
+(readers see concatenated streams as one file). A crash therefore loses at
+most the unflushed buffer and never corrupts what is already on disk.
+Parts rotate once they pass RAW_ARCHIVE_PART_BYTES or the date changes.
+"""
+
+import atexit
+import json
+import lzma
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from app.core.config import settings
+
+SUFFIX = ".jsonl.xz"
+
+
+class _PlatformWriter:
+    """Buffer and rotating part file for one platform."""
+
+    def __init__(self, root: str, platform: str):
+        self.root = root
+        self.platform = platform
+        self.buffer: List[str] = []
+        self.last_flush = time.monotonic()
+        self.part: Optional[str] = None
+        self.part_date: Optional[str] = None
+        self.sequence = 0
+        self.records = 0
+        self.bytes_written = 0
+        self.lock = threading.Lock()
+
+    def _part_path(self, date: str) -> str:
+        if self.part is None or self.part_date != date or os.path.getsize(self.part) >= settings.RAW_ARCHIVE_PART_BYTES:
+            directory = os.path.join(self.root, self.platform, date)
+            os.makedirs(directory, exist_ok=True)
+            while True:
+                self.sequence += 1
+                path = os.path.join(directory, f"part-{os.getpid()}-{self.sequence:05d}{SUFFIX}")
+                if not os.path.exists(path):
+                    break
+            self.part, self.part_date = path, date
+        return self.part
+
+    def flush(self):
+        """Compress the buffer into the current part file. Caller holds the lock."""
+        if not self.buffer:
+            return
+        data = lzma.compress("".join(self.buffer).encode("utf-8"), preset=settings.RAW_ARCHIVE_PRESET)
+        path = self._part_path(datetime.utcnow().strftime("%Y-%m-%d"))
+        with open(path, "ab") as fh:
+            fh.write(data)
+        self.records += len(self.buffer)
+        self.bytes_written += len(data)
+        self.buffer = []
+        self.last_flush = time.monotonic()
+
+
+_writers: Dict[str, _PlatformWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _writer(platform: str) -> _PlatformWriter:
+    with _writers_lock:
+        writer = _writers.get(platform)
+        if writer is None:
+            writer = _writers[platform] = _PlatformWriter(settings.RAW_ARCHIVE_DIR, platform)
+        return writer
+
+
+def archive_raw(platform: str, target: str, kind: str, payload: Dict):
+    """
+    Queue one raw payload for the archive (no-op when RAW_ARCHIVE_DIR is unset).
+
+    Args:
+        platform: "reddit", "youtube" or "instagram"
+        target: Subreddit, keyword / channel id or username the item came from
+        kind: Payload type, used by the reprocessor to pick an extractor
+        payload: JSON-serialisable raw item as returned by the API
+    """
+    if not settings.RAW_ARCHIVE_DIR:
+        return
+    line = json.dumps(
+        {"platform": platform, "target": target, "kind": kind,
+         "fetched_at": datetime.utcnow().isoformat(timespec="seconds"), "payload": payload},
+        default=str,
+    ) + "\n"
+    writer = _writer(platform)
+    with writer.lock:
+        writer.buffer.append(line)
+        if (len(writer.buffer) >= settings.RAW_ARCHIVE_FLUSH_RECORDS
+                or time.monotonic() - writer.last_flush >= settings.RAW_ARCHIVE_FLUSH_SECONDS):
+            try:
+                writer.flush()
+            except OSError as e:
+                print(f"⚠️ Could not write raw archive for {platform}: {e}")
+
+
+def flush_archive():
+    """Write every buffered record to disk."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        with writer.lock:
+            try:
+                writer.flush()
+            except OSError as e:
+                print(f"⚠️ Could not write raw archive for {writer.platform}: {e}")
+
+
+atexit.register(flush_archive)
+
+
+def get_archive_stats() -> Dict:
+    """Records and compressed bytes written per platform by this process."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    return {
+        w.platform: {"records": w.records, "bytes": w.bytes_written, "buffered": len(w.buffer), "part": w.part}
+        for w in writers
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+def iter_archive_files(root: Optional[str] = None, platforms: Optional[List[str]] = None,
+                       since: Optional[str] = None, until: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield archive part files, oldest date first.
+
+    Args:
+        root: Archive directory (defaults to RAW_ARCHIVE_DIR)
+        platforms: Only these platforms (default: all)
+        since / until: Inclusive ``YYYY-MM-DD`` bounds on the partition date
+    """
+    root = root or settings.RAW_ARCHIVE_DIR
+    if not root or not os.path.isdir(root):
+        return
+    for platform in sorted(os.listdir(root)):
+        if platforms and platform not in platforms:
+            continue
+        platform_dir = os.path.join(root, platform)
+        if not os.path.isdir(platform_dir):
+            continue
+        for date in sorted(os.listdir(platform_dir)):
+            if (since and date < since) or (until and date > until):
+                continue
+            date_dir = os.path.join(platform_dir, date)
+            for name in sorted(os.listdir(date_dir)):
+                if name.endswith(SUFFIX):
+                    yield os.path.join(date_dir, name)
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """Decompress one part file as a stream and yield its records (a truncated tail is skipped)."""
+    try:
+        with lzma.open(path, "rt", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+    except (EOFError, lzma.LZMAError) as e:
+        print(f"⚠️ {path}: stopped at damaged data ({e})")
@@ -0,0 +1,191 @@
+"""
+Concurrent fan-out engine for scraping many targets of one platform.
+
+Targets (subreddits, keywords, usernames) are handed to a bounded pool of
+worker threads. Each platform has its own concurrency cap and every target
+gets its own timeout, so a single slow target only costs its own slot and
+never stalls the rest of the run.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+
+
+# Max targets scraped at the same time, per platform
+PLATFORM_CONCURRENCY: Dict[str, int] = {
+    "reddit": settings.REDDIT_SCRAPE_CONCURRENCY,
+    "youtube": settings.YOUTUBE_SCRAPE_CONCURRENCY,
+    "instagram": settings.INSTAGRAM_SCRAPE_CONCURRENCY,
+}
+DEFAULT_CONCURRENCY = 2
+
+
+class TargetResult:
+    """Outcome of scraping a single target."""
+
+    def __init__(self, target: str):
+        self.target = target
+        self.status = "pending"  # "success", "error" or "timeout"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.elapsed = 0.0
+
+    def to_dict(self) -> Dict:
+        """Convert result to dictionary (the raw scrape result is omitted)."""
+        return {
+            "target": self.target,
+            "status": self.status,
+            "error": self.error,
+            "elapsed_seconds": round(self.elapsed, 3),
+        }
+
+
+class FanOutReport:
+    """Per-target timings for one fan-out run plus the overall speedup."""
+
+    def __init__(self, platform: str, results: List[TargetResult], wall_time: float, workers: int):
+        self.platform = platform
+        self.results = results
+        self.wall_time = wall_time
+        self.workers = workers
+
+    @property
+    def sequential_time(self) -> float:
+        """Time the old one-target-at-a-time loop would roughly have taken."""
+        return sum(r.elapsed for r in self.results)
+
+    @property
+    def speedup(self) -> float:
+        if self.wall_time <= 0:
+            return 1.0
+        return self.sequential_time / self.wall_time
+
+    def succeeded(self) -> List[TargetResult]:
+        return [r for r in self.results if r.status == "success"]
+
+    def to_dict(self) -> Dict:
+        """Convert report to dictionary."""
+        return {
+            "platform": self.platform,
+            "workers": self.workers,
+            "wall_time_seconds": round(self.wall_time, 3),
+            "sequential_time_seconds": round(self.sequential_time, 3),
+            "speedup": round(self.speedup, 2),
+            "targets": [r.to_dict() for r in self.results],
+        }
+
+    def print_summary(self):
+        for r in self.results:
+            icon = {"success": "✅", "timeout": "⏱️"}.get(r.status, "❌")
+            detail = f" ({r.error})" if r.error else ""
+            print(f"{icon} [{self.platform}] {r.target}: {r.status} in {r.elapsed:.2f}s{detail}")
+        print(
+            f"🏁 [{self.platform}] {len(self.results)} targets in {self.wall_time:.2f}s "
+            f"with {self.workers} workers (sequential ≈ {self.sequential_time:.2f}s, "
+            f"speedup x{self.speedup:.1f})"
+        )
+
+
+def fan_out(
+    platform: str,
+    targets: Iterable[str],
+    scrape_fn: Callable[[str], Any],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> FanOutReport:
+    """
+    Run ``scrape_fn(target)`` for every target concurrently.
+
+    Args:
+        platform: Platform key used to look up the concurrency cap
+        targets: Targets to scrape
+        scrape_fn: Callable doing the fetch + save for one target
+        max_workers: Override for the platform concurrency cap
+        timeout: Seconds allowed per target (defaults to SCRAPE_TARGET_TIMEOUT)
+
+    Returns:
+        FanOutReport with one TargetResult per target, in input order
+
+    Note:
+        Python threads cannot be killed, so a timed-out target keeps running
+        in the background and its late result is discarded. Until it
+        actually finishes it still holds its slot, so no more than
+        ``workers`` scrapes ever hit the platform at once. A target that
+        can't get a slot within ``timeout`` is reported as timed out.
+    """
+    targets = list(targets)
+    cap = max_workers or PLATFORM_CONCURRENCY.get(platform, DEFAULT_CONCURRENCY)
+    workers = max(1, min(cap, len(targets) or 1))
+    timeout = settings.SCRAPE_TARGET_TIMEOUT if timeout is None else timeout
+
+    results = [TargetResult(t) for t in targets]
+    finished: "queue.Queue" = queue.Queue()
+
+    def _worker(index: int, target: str):
+        started = time.perf_counter()
+        try:
+            value = scrape_fn(target)
+            finished.put((index, "success", value, None, time.perf_counter() - started))
+        except Exception as e:
+            finished.put((index, "error", None, str(e), time.perf_counter() - started))
+
+    running: Dict[int, float] = {}  # index -> start time
+    orphaned: Set[int] = set()  # timed out, thread still running
+    next_index = 0
+    run_started = time.perf_counter()
+    slot_wait_started: Optional[float] = None  # when the next target started waiting on orphans
+
+    while next_index < len(targets) or running:
+        # Fill free slots
+        while next_index < len(targets) and len(running) + len(orphaned) < workers:
+            running[next_index] = time.perf_counter()
+            threading.Thread(
+                target=_worker,
+                args=(next_index, targets[next_index]),
+                name=f"scrape-{platform}-{next_index}",
+                daemon=True,
+            ).start()
+            next_index += 1
+            slot_wait_started = None
+
+        # Wait until something finishes or the earliest deadline passes
+        now = time.perf_counter()
+        if running:
+            wait_for = max(0.0, min(start + timeout for start in running.values()) - now)
+        else:
+            # Every slot is held by a timed-out thread: wait for one to finish
+            slot_wait_started = slot_wait_started or now
+            wait_for = max(0.0, slot_wait_started + timeout - now)
+        try:
+            index, status, value, error, elapsed = finished.get(timeout=wait_for)
+            orphaned.discard(index)  # a late result frees the slot
+            if index in running:  # ignore late results of timed-out targets
+                del running[index]
+                results[index].status = status
+                results[index].result = value
+                results[index].error = error
+                results[index].elapsed = elapsed
+        except queue.Empty:
+            pass
+
+        now = time.perf_counter()
+        for index, start in list(running.items()):
+            if now - start >= timeout:
+                del running[index]
+                orphaned.add(index)
+                results[index].status = "timeout"
+                results[index].error = f"timed out after {timeout:.0f}s"
+                results[index].elapsed = now - start
+
+        if not running and slot_wait_started is not None and now - slot_wait_started >= timeout:
+            results[next_index].status = "timeout"
+            results[next_index].error = f"no free slot within {timeout:.0f}s"
+            results[next_index].elapsed = now - slot_wait_started
+            next_index += 1
+            slot_wait_started = now if next_index < len(targets) else None
+
+    return FanOutReport(platform, results, time.perf_counter() - run_started, workers)
@@ -0,0 +1,468 @@
+"""
+Staged ingest pipeline for scraped posts.
+
+A scrape is a chain of stages::
+
+    fetch -> normalize -> dedupe -> label -> store
+
+Every stage runs in its own thread(s) and hands items to the next one
+through a bounded queue, so a slow stage (DB writes, ML labeling) applies
+backpressure instead of serializing the whole run: the fetcher keeps paging
+while the previous batch is being written. Stages that work better on
+batches (store, label) pull up to ``batch_size`` items at a time, flushing
+early after ``batch_timeout`` seconds so results never sit in a half-full
+batch.
+
+Each stage keeps throughput counters, reported per run in PipelineReport.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.bulk_writer import bulk_insert_hooks
+from app.core.config import settings
+from app.core.dedupe import content_hash
+
+_DONE = object()     # end-of-stream marker passed down the queues
+_TIMEOUT = object()  # no item arrived within batch_timeout
+
+
+class StageStats:
+    """Throughput counters for one stage."""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = workers
+        self.items_in = 0
+        self.items_out = 0
+        self.batches = 0
+        self.busy_seconds = 0.0     # time spent in process()
+        self.blocked_seconds = 0.0  # time waiting on a full downstream queue
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, items_in: int, items_out: int, busy: float):
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.batches += 1
+            self.busy_seconds += busy
+
+    def add_blocked(self, seconds: float):
+        with self._lock:
+            self.blocked_seconds += seconds
+
+    def incr(self, key: str, n: int = 1):
+        """Bump a stage-specific counter (e.g. rows saved, duplicates dropped)."""
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + n
+
+    @property
+    def items_per_sec(self) -> float:
+        """Items processed per second of work, per worker."""
+        if self.busy_seconds <= 0:
+            return float(self.items_in)
+        return self.items_in / self.busy_seconds * self.workers
+
+    def to_dict(self) -> Dict:
+        """Convert stats to dictionary."""
+        with self._lock:
+            return {
+                "stage": self.name,
+                "workers": self.workers,
+                "items_in": self.items_in,
+                "items_out": self.items_out,
+                "batches": self.batches,
+                "busy_seconds": round(self.busy_seconds, 4),
+                "blocked_seconds": round(self.blocked_seconds, 4),
+                "items_per_sec": round(self.items_per_sec, 1),
+                **self.counters,
+            }
+
+
+class Stage:
+    """
+    One pipeline step. Subclass and implement ``process`` (batch in, batch
+    out; returning fewer items filters them), or wrap a plain function with
+    FunctionStage.
+    """
+
+    name = "stage"
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        batch_size: int = 1,
+        workers: int = 1,
+        batch_timeout: Optional[float] = None,
+    ):
+        self.name = name or self.name
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+        self.batch_timeout = settings.PIPELINE_BATCH_TIMEOUT if batch_timeout is None else batch_timeout
+        self.stats = StageStats(self.name, self.workers)
+
+    def process(self, batch: List[Any]) -> List[Any]:
+        raise NotImplementedError
+
+
+class FunctionStage(Stage):
+    """Stage backed by a ``fn(batch) -> batch`` callable."""
+
+    def __init__(self, name: str, fn: Callable[[List[Any]], List[Any]], **kwargs):
+        super().__init__(name, **kwargs)
+        self.fn = fn
+
+    def process(self, batch: List[Any]) -> List[Any]:
+        return self.fn(batch)
+
+
+class PipelineReport:
+    """Per-stage counters and wall time for one pipeline run."""
+
+    def __init__(self, name: str, stages: List[StageStats], wall_time: float, error: Optional[str] = None):
+        self.name = name
+        self.stages = stages
+        self.wall_time = wall_time
+        self.error = error
+
+    def stage(self, name: str) -> Optional[StageStats]:
+        return next((s for s in self.stages if s.name == name), None)
+
+    @property
+    def bottleneck(self) -> Optional[str]:
+        """Stage that spent the most time working, per worker."""
+        if not self.stages:
+            return None
+        return max(self.stages, key=lambda s: s.busy_seconds / s.workers).name
+
+    def to_dict(self) -> Dict:
+        """Convert report to dictionary."""
+        return {
+            "pipeline": self.name,
+            "wall_time_seconds": round(self.wall_time, 3),
+            "bottleneck": self.bottleneck,
+            "error": self.error,
+            "stages": [s.to_dict() for s in self.stages],
+        }
+
+    def print_summary(self):
+        for s in self.stages:
+            print(
+                f"   ↳ [{self.name}] {s.name}: {s.items_in} in / {s.items_out} out, "
+                f"{s.busy_seconds:.2f}s busy, {s.blocked_seconds:.2f}s blocked"
+            )
+        print(f"🏁 [{self.name}] pipeline finished in {self.wall_time:.2f}s (bottleneck: {self.bottleneck})")
+
+
+class Pipeline:
+    """
+    Source iterator plus a chain of stages connected by bounded queues.
+
+    Args:
+        name: Label used in logs and reports
+        source: Iterable of raw items (the fetch stage), typically a generator
+            that pages through a platform API
+        stages: Stages applied in order
+        queue_size: Capacity of each inter-stage queue (defaults to PIPELINE_QUEUE_SIZE)
+    """
+
+    def __init__(self, name: str, source: Iterable[Any], stages: List[Stage], queue_size: Optional[int] = None):
+        self.name = name
+        self.source = source
+        self.stages = stages
+        self.queue_size = queue_size or settings.PIPELINE_QUEUE_SIZE
+        self.fetch_stats = StageStats("fetch")
+        self.report: Optional[PipelineReport] = None
+        self._abort = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    def _fail(self, e: BaseException):
+        with self._error_lock:
+            if self._error is None:
+                self._error = e
+        self._abort.set()
+
+    def _put(self, q: "queue.Queue", item: Any, stats: StageStats):
+        started = time.perf_counter()
+        q.put(item)
+        stats.add_blocked(time.perf_counter() - started)
+
+    def _fetch(self, q_out: "queue.Queue"):
+        stats = self.fetch_stats
+        items = iter(self.source)
+        try:
+            while not self._abort.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    break
+                stats.record(1, 1, time.perf_counter() - started)
+                self._put(q_out, item, stats)
+        except Exception as e:
+            print(f"❌ [{self.name}] fetch failed: {e}")
+            self._fail(e)
+        finally:
+            q_out.put(_DONE)
+
+    def _work(self, stage: Stage, q_in: "queue.Queue", q_out: "queue.Queue", remaining: List[int], lock: threading.Lock):
+        batch: List[Any] = []
+        upstream_done = False
+        while not upstream_done:
+            try:
+                item = q_in.get(timeout=stage.batch_timeout if batch else None)
+            except queue.Empty:
+                item = _TIMEOUT  # flush the partial batch
+            if item is _DONE:
+                upstream_done = True
+                q_in.put(_DONE)  # let sibling workers see it too
+            elif item is not _TIMEOUT:
+                batch.append(item)
+
+            if batch and (upstream_done or item is _TIMEOUT or len(batch) >= stage.batch_size):
+                if not self._abort.is_set():
+                    started = time.perf_counter()
+                    try:
+                        out = stage.process(batch) or []
+                        stage.stats.record(len(batch), len(out), time.perf_counter() - started)
+                        for result in out:
+                            self._put(q_out, result, stage.stats)
+                    except Exception as e:
+                        print(f"❌ [{self.name}] stage '{stage.name}' failed: {e}")
+                        self._fail(e)
+                batch = []
+
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            q_out.put(_DONE)
+
+    def run_iter(self) -> Iterator[Any]:
+        """
+        Start every stage and yield the last stage's output as it arrives.
+
+        Raises the first stage error once the pipeline has drained. Closing
+        the iterator early aborts the run.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        started = time.perf_counter()
+        threads = [threading.Thread(target=self._fetch, args=(queues[0],), name=f"{self.name}-fetch", daemon=True)]
+        for i, stage in enumerate(self.stages):
+            remaining, lock = [stage.workers], threading.Lock()
+            for n in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[i], queues[i + 1], remaining, lock),
+                    name=f"{self.name}-{stage.name}-{n}",
+                    daemon=True,
+                ))
+        for t in threads:
+            t.start()
+
+        out = queues[-1]
+        finished = False
+        try:
+            while True:
+                item = out.get()
+                if item is _DONE:
+                    finished = True
+                    break
+                yield item
+        finally:
+            if not finished:
+                # Consumer went away: stop fetching and drain so no stage blocks
+                self._abort.set()
+                while out.get() is not _DONE:
+                    pass
+            for t in threads:
+                t.join()
+            error = str(self._error) if self._error else None
+            self.report = PipelineReport(
+                self.name,
+                [self.fetch_stats] + [s.stats for s in self.stages],
+                time.perf_counter() - started,
+                error,
+            )
+        if self._error:
+            raise self._error
+
+    def run(self) -> List[Any]:
+        """Run to completion and return the last stage's output."""
+        return list(self.run_iter())
+
+
+# ---------------------------------------------------------------------------
+# Hook ingest stages
+# ---------------------------------------------------------------------------
+
+class NormalizeStage(Stage):
+    """
+    Map a platform post to a hook row; posts without text are dropped.
+
+    ``to_meta(post)`` may add extra hook columns (source_id, engagement).
+    """
+
+    name = "normalize"
+
+    def __init__(self, to_text: Callable[[Dict], str], platform: str, niche: str,
+                 to_meta: Optional[Callable[[Dict], Dict]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.to_text = to_text
+        self.platform = platform
+        self.niche = niche
+        self.to_meta = to_meta
+
+    def process(self, batch: List[Dict]) -> List[Dict]:
+        rows = []
+        for post in batch:
+            text = (self.to_text(post) or "").strip()
+            if not text:
+                self.stats.incr("empty")
+                continue
+            row = {"text": text, "tone": "unknown", "niche": self.niche, "platform": self.platform, "post": post}
+            if self.to_meta:
+                row.update(self.to_meta(post))
+            rows.append(row)
+        return rows
+
+
+class DedupeStage(Stage):
+    """Hash each row and drop repeats within the run (the DB upsert catches the rest)."""
+
+    name = "dedupe"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def process(self, batch: List[Dict]) -> List[Dict]:
+        rows = []
+        for row in batch:
+            row["content_hash"] = content_hash(row["text"])
+            with self._lock:
+                if row["content_hash"] in self._seen:
+                    self.stats.incr("duplicates")
+                    continue
+                self._seen.add(row["content_hash"])
+            rows.append(row)
+        return rows
+
+
+class LabelStage(Stage):
+    """Fill in tone/niche with a ``labeler(rows) -> rows`` callable."""
+
+    name = "label"
+
+    def __init__(self, labeler: Callable[[List[Dict]], List[Dict]], **kwargs):
+        kwargs.setdefault("batch_size", settings.PIPELINE_BATCH_SIZE)
+        super().__init__(**kwargs)
+        self.labeler = labeler
+
+    def process(self, batch: List[Dict]) -> List[Dict]:
+        return self.labeler(batch)
+
+
+class StoreStage(Stage):
+    """Upsert rows through the bulk writer, one transaction per batch."""
+
+    name = "store"
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("batch_size", settings.PIPELINE_BATCH_SIZE)
+        super().__init__(**kwargs)
+
+    def process(self, batch: List[Dict]) -> List[Dict]:
+        stats = bulk_insert_hooks(batch)
+        self.stats.incr("saved", stats.rows)
+        self.stats.incr("skipped", stats.skipped)
+        return batch
+
+
+def _default_labeler() -> Optional[Callable[[List[Dict]], List[Dict]]]:
+    if not settings.SCRAPE_AUTO_LABEL:
+        return None
+    from app.services.auto_labeler import label_rows
+    return label_rows
+
+
+def hook_pipeline(
+    name: str,
+    source: Iterable[Dict],
+    to_text: Callable[[Dict], str],
+    platform: str,
+    niche: str,
+    labeler: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+    to_meta: Optional[Callable[[Dict], Dict]] = None,
+) -> Pipeline:
+    """
+    Standard fetch -> normalize -> dedupe -> [label] -> store pipeline.
+
+    Args:
+        name: Label for logs and reports (e.g. "reddit:r/Business")
+        source: Iterator of platform posts
+        to_text: Extracts the hook text from a post
+        platform: Hook.platform value ("Reddit", "YouTube", "Instagram")
+        niche: Hook.niche value
+        labeler: Optional batch labeler (defaults to the auto labeler when
+            SCRAPE_AUTO_LABEL is enabled)
+        to_meta: Optional extra hook columns for a post (source_id, engagement)
+
+    Returns:
+        Pipeline whose output rows keep the original post under "post"
+    """
+    labeler = labeler or _default_labeler()
+    stages: List[Stage] = [NormalizeStage(to_text, platform, niche, to_meta), DedupeStage()]
+    if labeler:
+        stages.append(LabelStage(labeler))
+    stages.append(StoreStage())
+    return Pipeline(name, source, stages)
+
+
+def ingest(
+    name: str,
+    posts: Iterable[Dict],
+    to_text: Callable[[Dict], str],
+    platform: str,
+    niche: str,
+    on_progress: Optional[Callable[[str, int], None]] = None,
+    labeler: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+    run=None,
+    to_meta: Optional[Callable[[Dict], Dict]] = None,
+) -> Tuple[List[Dict], PipelineReport]:
+    """
+    Run posts through the hook pipeline; shared by all platform scrapers.
+
+    ``on_progress(stage, count)`` is called with "fetched" as soon as the
+    source is exhausted (storing may still be in flight) and with "saved"
+    at the end. Stage timings are added to ``run`` (a metrics ScrapeRun)
+    when given, also when the pipeline fails.
+
+    Returns:
+        The fetched posts (in source order) and the PipelineReport
+    """
+    fetched: List[Dict] = []
+
+    def _source():
+        for post in posts:
+            fetched.append(post)
+            yield post
+        if on_progress:
+            on_progress("fetched", len(fetched))
+
+    pipeline = hook_pipeline(name, _source(), to_text, platform, niche, labeler=labeler, to_meta=to_meta)
+    try:
+        for _ in pipeline.run_iter():
+            pass
+    finally:
+        if run is not None and pipeline.report:
+            run.add_pipeline(pipeline.report)
+    report = pipeline.report
+    if on_progress:
+        on_progress("saved", report.stage("store").counters.get("saved", 0))
+    return fetched, report
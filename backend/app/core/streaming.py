@@ -0,0 +1,117 @@
+"""
+Streaming scrape responses.
+
+Instead of building the full post list and answering after the DB commit,
+a streaming scrape yields each post as soon as the platform returns it and
+commits them behind the stream in small batches. The event stream looks
+like::
+
+    {"event": "post",  "data": {...}}          one per fetched post
+    {"event": "saved", "data": {"rows": 25, ...}}  after each micro-batch
+    {"event": "done",  "data": {"fetched": 80, "saved": 74}}
+    {"event": "error", "data": {"detail": "..."}}  if the scrape fails
+
+and is encoded as NDJSON (one JSON object per line) or Server-Sent Events.
+"""
+
+import json
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def stream_with_commits(
+    items: Iterable[Dict],
+    save_fn: Callable[[List[Dict]], object],
+    batch_size: Optional[int] = None,
+    run=None,
+) -> Iterator[Dict]:
+    """
+    Yield a "post" event per item and save them in micro-batches.
+
+    Args:
+        items: Posts, ideally a generator fed straight from the platform API
+        save_fn: Called with each batch; returns BulkInsertStats
+        batch_size: Posts per commit (defaults to SCRAPE_STREAM_BATCH_SIZE)
+        run: Optional metrics ScrapeRun; time spent fetching and saving is
+            added to its "fetch" and "persist" spans (not time spent waiting
+            on the client)
+
+    Returns:
+        Iterator of event dicts, ending with "done"
+    """
+    batch_size = batch_size or settings.SCRAPE_STREAM_BATCH_SIZE
+    batch: List[Dict] = []
+    fetched = saved = skipped = 0
+
+    def _flush():
+        nonlocal batch, saved, skipped
+        started = time.perf_counter()
+        stats = save_fn(batch)
+        if run is not None:
+            run.add("persist", time.perf_counter() - started)
+        saved += stats.rows
+        skipped += stats.skipped
+        batch = []
+        return {"event": "saved", "data": {"rows": stats.rows, "skipped": stats.skipped, "total": saved}}
+
+    completed = False
+    items = iter(items)
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                break
+            if run is not None:
+                run.add("fetch", time.perf_counter() - started)
+                run.items += 1
+            fetched += 1
+            batch.append(item)
+            yield {"event": "post", "data": item}
+            if len(batch) >= batch_size:
+                yield _flush()
+        completed = True
+    finally:
+        # Client disconnected or the fetch failed: keep what was already fetched
+        if batch and not completed:
+            _flush()
+    if batch:
+        yield _flush()
+    yield {"event": "done", "data": {"fetched": fetched, "saved": saved, "skipped": skipped}}
+
+
+def encode_event(event: Dict, fmt: str) -> str:
+    """Serialize one event as an NDJSON line or an SSE frame."""
+    payload = json.dumps(event["data"], default=str)
+    if fmt == "sse":
+        return f"event: {event['event']}\ndata: {payload}\n\n"
+    return json.dumps({"event": event["event"], "data": event["data"]}, default=str) + "\n"
+
+
+def streaming_response(events: Iterator[Dict], fmt: str) -> StreamingResponse:
+    """Wrap an event iterator in a StreamingResponse, reporting failures in-band."""
+
+    def _body():
+        try:
+            for event in events:
+                yield encode_event(event, fmt)
+        except Exception as e:
+            # Headers are already sent, so the error has to travel in the stream
+            print(f"❌ Streaming scrape failed: {e}")
+            yield encode_event({"event": "error", "data": {"detail": str(e)}}, fmt)
+
+    return StreamingResponse(
+        _body(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,111 @@
+"""
+In-process trigram index for substring and fuzzy matching of short strings.
+
+Mirrors PostgreSQL's pg_trgm so both backends rank the same way: a string
+is lowercased, split into words on non-alphanumerics, each word is padded
+with two spaces in front and one behind, and its trigrams are every
+3-character window. Similarity is the Jaccard index of two trigram sets.
+
+The index maps each trigram to the values containing it, so a lookup only
+scores values sharing at least one trigram with the query instead of every
+value. It is meant for low-cardinality columns (niches, usernames) that fit
+in memory, not for hook text.
+
+    index = TrigramIndex(["Entrepreneur", "smallbusiness", "Business"])
+    index.search("busines")  # [("Business", 0.7), ("smallbusiness", 0.29)]
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+SIMILARITY_THRESHOLD = 0.3  # pg_trgm's default for the % operator
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def trigrams(value: str) -> FrozenSet[str]:
+    """pg_trgm-style trigram set of ``value``."""
+    grams: Set[str] = set()
+    for word in _WORD_RE.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the trigram sets of ``a`` and ``b`` (0..1)."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
+
+
+class TrigramIndex:
+    """Trigram postings over a set of strings, rebuilt or extended in place."""
+
+    def __init__(self, values: Optional[Iterable[str]] = None):
+        self._values: Dict[str, FrozenSet[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        if values:
+            self.add_many(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._values
+
+    def add_many(self, values: Iterable[str]):
+        """Index every new non-empty value."""
+        with self._lock:
+            for value in values:
+                if value and value not in self._values:
+                    grams = trigrams(value)
+                    self._values[value] = grams
+                    for gram in grams:
+                        self._postings.setdefault(gram, set()).add(value)
+
+    def search(self, query: str, threshold: float = SIMILARITY_THRESHOLD,
+               limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Values containing ``query`` as a substring or at least ``threshold`` similar.
+
+        Args:
+            query: Text to look up (case-insensitive)
+            threshold: Minimum similarity for a non-substring match
+            limit: Max results
+
+        Returns:
+            (value, similarity) pairs, most similar first, ties by value
+        """
+        needle = query.strip().lower()
+        grams = trigrams(needle)
+        if not grams:
+            return []
+
+        with self._lock:
+            # Shared-trigram counts give |A ∩ B| for every candidate in one pass
+            shared: Counter = Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+            if len(needle) < 3:
+                # Too short to share a trigram with every value containing it
+                for value in self._values:
+                    if value not in shared and needle in value.lower():
+                        shared[value] = 0
+            sizes = {value: len(self._values[value]) for value in shared}
+
+        matches = []
+        for value, common in shared.items():
+            score = common / (len(grams) + sizes[value] - common)
+            if score >= threshold or needle in value.lower():
+                matches.append((value, score))
+        matches.sort(key=lambda m: (-m[1], m[0]))
+        return matches[:limit] if limit else matches
+
+    def to_dict(self) -> Dict:
+        """Convert index size to dictionary."""
+        return {"values": len(self._values), "trigrams": len(self._postings)}
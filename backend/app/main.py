@@ -1,8 +1,12 @@
 # main.py
 
+import time
+
+_boot_started = time.perf_counter()
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import reddit, youtube, instagram
+from app.routers import reddit, youtube, instagram, jobs, internal
 from app.EssentialFeatures.EssentialFeaturesRoutes import (
     essential_features_bp,
     metrics_bp,
@@ -12,6 +16,21 @@ from app.EssentialFeatures.EssentialFeaturesRoutes import (
 from app.UserProfile.userprofileroutes import router as user_profile_router
 from app.Settings.Settingsreportsroutes import router as settings_reports_router
 from app.Auth.authroutes import router as auth_router
+from app.services.scheduler import ensure_schedule_columns, start_scheduler, stop_scheduler
+from app.core.clients import start_warmup
+from app.core.raw_archive import flush_archive
+from app.core.config import settings
+from app.core.database import engine
+from app.EssentialFeatures.EssentialFeaturesService import ensure_hook_sort_indexes
+from app.EssentialFeatures.EssentialFeaturesSearch import ensure_search_index
+from app.EssentialFeatures.EssentialFeaturesIndex import start_hook_index, stop_hook_index, save_hook_index
+from app.services.niche_search import ensure_niche_trigram_index
+from app.services.dedupe_backfill import ensure_content_hash
+from app.services.engagement_refresh import (
+    ensure_engagement_columns,
+    start_engagement_refresh,
+    stop_engagement_refresh,
+)
 
 app = FastAPI(title="Hook Library API")
 
@@ -22,12 +41,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # paginated search results
 )
 
 # Routers
 app.include_router(reddit.router, prefix="/reddit", tags=["reddit"])
 app.include_router(youtube.router, prefix="/youtube", tags=["YouTube"])
 app.include_router(instagram.router, prefix="/instagram", tags=["Instagram"])
+app.include_router(jobs.router)
+if settings.INTERNAL_ROUTES_ENABLED:
+    app.include_router(internal.router)
 app.include_router(auth_router)
 app.include_router(user_profile_router)
 app.include_router(settings_reports_router)
@@ -38,6 +61,49 @@ app.include_router(metrics_bp)
 app.add_exception_handler(404, metrics_not_found)
 app.add_exception_handler(500, metrics_internal_error)
 
+@app.on_event("startup")
+def migrate_hooks_table():
+    # Older hooks tables lack these columns and the upsert's unique index;
+    # runs first so no scrape starts before they exist
+    ensure_content_hash(engine)
+    ensure_engagement_columns(engine)
+
+
+@app.on_event("startup")
+def start_background_scheduler():
+    ensure_schedule_columns(engine)
+    start_scheduler()
+
+
+@app.on_event("startup")
+def warm_platform_clients():
+    # Clients build in the background so the first requests aren't held up
+    print(f"🚀 App ready in {time.perf_counter() - _boot_started:.2f}s")
+    start_warmup()
+
+
+@app.on_event("startup")
+def create_hook_explorer_indexes():
+    ensure_hook_sort_indexes(engine)
+    ensure_search_index(engine)
+    ensure_niche_trigram_index(engine)
+    start_hook_index()
+
+
+@app.on_event("startup")
+def start_engagement_refresh_job():
+    start_engagement_refresh()
+
+
+@app.on_event("shutdown")
+def stop_background_scheduler():
+    stop_scheduler()
+    stop_engagement_refresh()
+    flush_archive()
+    stop_hook_index()
+    save_hook_index()
+
+
 @app.get("/")
 def root():
     return {"message": "Welcome to The Hook Library API"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from app.core.database import Base
 from datetime import datetime
 
@@ -10,3 +10,14 @@ class Hook(Base):
     tone = Column(String, index=True)
     niche = Column(String, index=True)
     platform = Column(String, index=True)
+    content_hash = Column(String(64), nullable=True)  # sha256 of normalized text
+    source_id = Column(String(64), nullable=True)  # Reddit fullname, YouTube video id, Instagram shortcode
+    engagement = Column(Integer, nullable=True)  # Reddit score, YouTube views, Instagram likes
+    engagement_updated_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=True, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("uq_hooks_platform_content_hash", "platform", "content_hash", unique=True),
+        Index("ix_hooks_platform_source_id", "platform", "source_id"),
+        Index("ix_hooks_platform_created_at", "platform", "created_at"),
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from app.core.database import Base
+from datetime import datetime
+
+class ScrapeWatermark(Base):
+    """Newest item already ingested for one (platform, target) pair."""
+    __tablename__ = "scrape_watermarks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    platform = Column(String(32), nullable=False)
+    target = Column(String(255), nullable=False)
+    cursor = Column(String(255), nullable=False)  # fullname / publishedAt / shortcode
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("platform", "target", name="uq_scrape_watermark_target"),
+    )
@@ -1,17 +1,33 @@
-from fastapi import APIRouter, Query
-from app.services.instagram_scaper import scrape_and_store, scrape_instagram_all
+from fastapi import APIRouter, Query, Depends
+from fastapi.responses import JSONResponse
+from typing import Literal, Optional
+from app.services.instagram_scaper import scrape_instagram_all, scrape_stream
+from app.services.scrape_jobs import enqueue_scrape
+from app.core.streaming import streaming_response
+from app.Auth.authroutes import get_optional_current_user
 
 router = APIRouter(prefix="/instagram", tags=["Instagram"])
 
-@router.post("/scrape")
+@router.post("/scrape", status_code=202)
 def scrape_user(
     username: str = Query(..., description="Instagram username"),
-    limit: int = Query(5, description="Number of posts")
+    limit: int = Query(5, description="Number of posts"),
+    stream: Optional[Literal["ndjson", "sse"]] = Query(None, description="Stream posts as they are fetched instead of queueing a job"),
+    current_user: Optional[dict] = Depends(get_optional_current_user),
 ):
-    scrape_and_store(username, limit)
-    return {"message": f"✅ Scraped {limit} posts from @{username}"}
+    if stream:
+        return streaming_response(scrape_stream(username, limit), stream)
+    job = enqueue_scrape("instagram", username, limit, user_id=current_user["id"] if current_user else None)
+    return JSONResponse(
+        status_code=202,
+        content={
+            "message": f"⏳ Queued scrape of {limit} posts from @{username}",
+            "job_id": job.id,
+            "data": job.to_dict(),
+        },
+    )
 
 @router.post("/scrape-all")
 def scrape_all():
-    scrape_instagram_all()
-    return {"message": "✅ Scraped all default Instagram accounts"}
+    report = scrape_instagram_all()
+    return {"message": "✅ Scraped all default Instagram accounts", "report": report.to_dict()}
@@ -0,0 +1,93 @@
+"""
+Process diagnostics: rate limits, caches, client pools and scrape metrics.
+
+These routes have no authentication, so main.py only mounts them when
+INTERNAL_ROUTES_ENABLED is set. Enable it where ``/internal`` is not
+reachable from outside (e.g. a private metrics port or a sidecar scrape).
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.clients import get_client_status
+from app.core.metrics import get_scrape_metrics, get_scrape_metrics_prometheus
+from app.core.rate_limit import get_rate_limit_metrics
+from app.core.raw_archive import get_archive_stats
+from app.EssentialFeatures.EssentialFeaturesCache import get_hook_cache_stats
+from app.EssentialFeatures.EssentialFeaturesIndex import get_hook_index_status
+from app.services.engagement_refresh import get_engagement_refresh_status
+from app.services.niche_search import get_niche_index_stats
+from app.services.scheduler import get_scheduler_status
+from app.services.scrape_cache import get_scrape_cache_stats
+from app.services.youtube_scraper import get_youtube_client_stats
+
+router = APIRouter(prefix="/internal", tags=["Internal"])
+
+
+# ✅ Token bucket state per platform + credential
+@router.get("/rate-limits")
+def rate_limits():
+    return get_rate_limit_metrics()
+
+
+# ✅ Scheduled-scrape loop state and last tick
+@router.get("/scheduler")
+def scheduler_status():
+    return get_scheduler_status()
+
+
+# ✅ Scrape result cache hit/miss counters per platform
+@router.get("/scrape-cache")
+def scrape_cache_stats():
+    return get_scrape_cache_stats()
+
+
+# ✅ Pooled YouTube clients and build time saved
+@router.get("/youtube-client")
+def youtube_client_stats():
+    return get_youtube_client_stats()
+
+
+# ✅ Lazy platform clients and the startup warmup
+@router.get("/clients")
+def client_status():
+    return get_client_status()
+
+
+# ✅ Fetch / transform / persist / log timing histograms per platform and target
+@router.get("/metrics")
+def scrape_metrics(format: Literal["json", "prometheus"] = "json", recent: int = 20):
+    if format == "prometheus":
+        return PlainTextResponse(get_scrape_metrics_prometheus(), media_type="text/plain; version=0.0.4")
+    return get_scrape_metrics(recent)
+
+
+# ✅ Engagement refresh loop and its last run
+@router.get("/engagement-refresh")
+def engagement_refresh_status():
+    return get_engagement_refresh_status()
+
+
+# ✅ Raw payloads archived by this process
+@router.get("/raw-archive")
+def raw_archive_stats():
+    return get_archive_stats()
+
+
+# ✅ In-process niche trigram index (used when pg_trgm isn't available)
+@router.get("/niche-index")
+def niche_index_stats():
+    return get_niche_index_stats()
+
+
+# ✅ In-memory typeahead index over essential hooks
+@router.get("/hook-index")
+def hook_index_status():
+    return get_hook_index_status()
+
+
+# ✅ Explorer page cache hit rate and invalidation generations
+@router.get("/hook-cache")
+def hook_cache_stats():
+    return get_hook_cache_stats()
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, HTTPException
+from app.services.scrape_jobs import get_job_status
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+# ✅ Poll a queued scrape
+@router.get("/{job_id}")
+def get_scrape_job(job_id: str):
+    status = get_job_status(job_id)
+    if not status:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return status
@@ -1,29 +1,38 @@
-from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi import APIRouter, Query, Depends, HTTPException, Response
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 
-from app.services.reddit_scraper import scrape_and_store, scrape_reddit_all
+from app.services.reddit_scraper import scrape_reddit_all, scrape_stream
+from app.services.scrape_jobs import enqueue_scrape
+from app.core.streaming import streaming_response
+from app.Auth.authroutes import get_optional_current_user
 from app.core.database import get_db
 from app.models.hook_model import Hook
-from app.schemas.hook_schemas import HookResponse
+from app.schemas.hook_schemas import HookResponse, HookSearchResult
+from app.services.niche_search import search_hooks_by_niche
 
 router = APIRouter(prefix="/reddit", tags=["Reddit"])
 
 
-# ✅ Scrape a single subreddit
-@router.post("/scrape")
+# ✅ Queue a scrape of a single subreddit
+@router.post("/scrape", status_code=202)
 def scrape_single(
     subreddit: str = Query(..., description="Subreddit name"),
     limit: int = Query(50, description="Number of posts"),
+    stream: Optional[Literal["ndjson", "sse"]] = Query(None, description="Stream posts as they are fetched instead of queueing a job"),
+    current_user: Optional[dict] = Depends(get_optional_current_user),
 ):
-    posts = scrape_and_store(subreddit, limit)
+    if stream:
+        return streaming_response(scrape_stream(subreddit, limit), stream)
+    job = enqueue_scrape("reddit", subreddit, limit, user_id=current_user["id"] if current_user else None)
     return JSONResponse(
-        status_code=200,
+        status_code=202,
         content={
-            "status": "success",
-            "message": f"✅ Scraped {len(posts)} posts from r/{subreddit}",
-            "data": posts,
+            "status": "queued",
+            "message": f"⏳ Queued scrape of r/{subreddit}",
+            "job_id": job.id,
+            "data": job.to_dict(),
         },
     )
 
@@ -31,21 +40,50 @@ def scrape_single(
 # ✅ Scrape all default subreddits
 @router.post("/scrape-all")
 def scrape_all():
-    scrape_reddit_all()
-    return {"message": "✅ Scraped all default subreddits"}
+    report = scrape_reddit_all()
+    return {"message": "✅ Scraped all default subreddits", "report": report.to_dict()}
 
 
 # ✅ Get all hooks from DB
+# Engagement is a Reddit score, YouTube view count or Instagram like count,
+# so sorting by it only makes sense within one platform
 @router.get("/hooks", response_model=List[HookResponse])
-def get_hooks(db: Session = Depends(get_db)):
-    hooks = db.query(Hook).all()
+def get_hooks(
+    sort: Literal["id", "engagement"] = Query("id", description="Order by insertion or by refreshed engagement"),
+    platform: Optional[Literal["Reddit", "YouTube", "Instagram"]] = Query(
+        None, description="Only this platform's hooks; required with sort=engagement"
+    ),
+    db: Session = Depends(get_db),
+):
+    query = db.query(Hook)
+    if platform:
+        query = query.filter(Hook.platform == platform)
+    if sort == "engagement":
+        if not platform:
+            raise HTTPException(
+                status_code=400,
+                detail="sort=engagement needs a platform: scores, views and likes are not comparable",
+            )
+        # Hooks not refreshed yet have no engagement; they go last instead of being dropped
+        query = query.order_by(Hook.engagement.is_(None), Hook.engagement.desc(), Hook.id.desc())
+    hooks = query.all()
     return hooks
 
 
-# ✅ Search hooks by niche
-@router.get("/hooks/search", response_model=List[HookResponse])
-def search_hooks(niche: str, db: Session = Depends(get_db)):
-    results = db.query(Hook).filter(Hook.niche.ilike(f"%{niche}%")).all()
-    if not results:
-        raise HTTPException(status_code=404, detail="No Hooks Found For This Niche.")
+# ✅ Search hooks by niche (substring or fuzzy), most similar niche first
+# The next page's cursor comes back in the X-Next-Cursor header
+@router.get("/hooks/search", response_model=List[HookSearchResult])
+def search_hooks(
+    response: Response,
+    niche: str = Query(..., min_length=1, description="Niche text, matched as a substring or by similarity"),
+    limit: int = Query(50, ge=1, le=200, description="Hooks per page"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    db: Session = Depends(get_db),
+):
+    try:
+        results, next_cursor = search_hooks_by_niche(db, niche, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return results
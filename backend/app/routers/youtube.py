@@ -1,19 +1,40 @@
-from fastapi import APIRouter, Query
-from app.services.youtube_scraper import scrape_and_store, scrape_youtube_all
+from fastapi import APIRouter, Query, Depends
+from fastapi.responses import JSONResponse
+from typing import Literal, Optional
+from app.services.youtube_scraper import scrape_youtube_all, scrape_stream
+from app.services.scrape_jobs import enqueue_scrape
+from app.core.streaming import streaming_response
+from app.Auth.authroutes import get_optional_current_user
 
 router = APIRouter(prefix="/youtube", tags=["YouTube"])
 
-@router.post("/scrape")
+@router.post("/scrape", status_code=202)
 def scrape_youtube(
     channel_id: str = Query(..., description="YouTube Channel ID"),
-    limit: int = Query(10, description="Number of videos to fetch")
+    limit: int = Query(10, description="Number of videos to fetch"),
+    stream: Optional[Literal["ndjson", "sse"]] = Query(None, description="Stream posts as they are fetched instead of queueing a job"),
+    current_user: Optional[dict] = Depends(get_optional_current_user),
 ):
-    """Scrape a specific YouTube channel and save videos as hooks."""
-    scrape_and_store(channel_id, limit)
-    return {"message": f"✅ Scraped {limit} YouTube videos from channel {channel_id}"}
+    """
+    Queue a scrape of a channel's uploads (or a keyword); poll /jobs/{job_id} for status.
+
+    With ``stream=ndjson`` or ``stream=sse`` the videos are streamed back as they
+    are fetched and committed in micro-batches instead.
+    """
+    if stream:
+        return streaming_response(scrape_stream(channel_id, limit), stream)
+    job = enqueue_scrape("youtube", channel_id, limit, user_id=current_user["id"] if current_user else None)
+    return JSONResponse(
+        status_code=202,
+        content={
+            "message": f"⏳ Queued scrape of {limit} YouTube videos from channel {channel_id}",
+            "job_id": job.id,
+            "data": job.to_dict(),
+        },
+    )
 
 @router.post("/scrape-all")
 def scrape_youtube_default():
     """Scrape a set of predefined YouTube channels."""
-    scrape_youtube_all()
-    return {"message": "✅ Scraped all default YouTube channels"}
+    report = scrape_youtube_all()
+    return {"message": "✅ Scraped all default YouTube channels", "report": report.to_dict()}
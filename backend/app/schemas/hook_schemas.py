@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 
 class HookBase(BaseModel):
     text: str
@@ -12,6 +13,13 @@ class HookCreate(BaseModel):
 
 class HookResponse(BaseModel):
     id: int
+    engagement: Optional[int] = None
 
     class Config:
-        orm_model = True
\ No newline at end of file
+        orm_model = True
+
+class HookSearchResult(HookResponse):
+    text: Optional[str] = None
+    niche: Optional[str] = None
+    platform: Optional[str] = None
+    similarity: float  # trigram similarity of the niche to the query
\ No newline at end of file
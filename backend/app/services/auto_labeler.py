@@ -1,19 +1,41 @@
-from transformers import pipeline
-from backend.app.core.database import SessionLocal
-from backend.app.models.hook_model import Hook
+from typing import Dict, List
+from app.core.database import SessionLocal
+from app.models.hook_model import Hook
 
-classifier = pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+TONE_LABELS = ["motivational", "educational", "relatable", "shock", "funny"]
+NICHE_LABELS = ["business", "fitness", "self-improvement", "tech", "finance", "general"]
+
+_classifier = None
+
+def get_classifier():
+    """Load the zero-shot model on first use; it takes a while and a lot of memory."""
+    global _classifier
+    if _classifier is None:
+        from transformers import pipeline
+        _classifier = pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+    return _classifier
+
+def label_rows(rows: List[Dict]) -> List[Dict]:
+    """Label a batch of hook rows in place (used as the ingest pipeline's label stage)."""
+    if not rows:
+        return rows
+    classifier = get_classifier()
+    texts = [row["text"] for row in rows]
+    tone_results = classifier(texts, TONE_LABELS)
+    niche_results = classifier(texts, NICHE_LABELS)
+    for row, tone_result, niche_result in zip(rows, tone_results, niche_results):
+        row["tone"] = tone_result["labels"][0]
+        row["niche"] = niche_result["labels"][0]
+    return rows
 
 def label_hooks():
     db = SessionLocal()
     hooks = db.query(Hook).filter(Hook.tone == "unknown").limit(20).all()
 
-    tone_labels = ["motivational", "educational", "relatable", "shock", "funny"]
-    niche_labels = ["business", "fitness", "self-improvement", "tech", "finance", "general"]
-
+    classifier = get_classifier()
     for hook in hooks:
-        tone_result = classifier(hook.text, tone_labels)
-        niche_result = classifier(hook.text, niche_labels)
+        tone_result = classifier(hook.text, TONE_LABELS)
+        niche_result = classifier(hook.text, NICHE_LABELS)
         hook.tone = tone_result["labels"][0]
         hook.niche = niche_result["labels"][0]
         print(f"Labeled: {hook.text[:50]}... → Tone={hook.tone}, Niche={hook.niche}")
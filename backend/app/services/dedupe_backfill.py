@@ -0,0 +1,112 @@
+"""
+Backfill: hash existing hooks and collapse duplicates.
+
+The scrapers' upserts need the content_hash column and the unique
+``(platform, content_hash)`` index, which create_all() never adds to an
+existing hooks table. App startup runs ensure_content_hash(), which does
+the full backfill whenever that index is missing. It can also be run by
+hand:
+
+    python -m app.services.dedupe_backfill
+
+Steps (each done in batches so the table is never locked for long):
+  1. add the content_hash column if the table predates it
+  2. compute content_hash for every row that has none
+  3. delete duplicates per (platform, content_hash), keeping the oldest id
+  4. create the unique index that makes scraper upserts skip duplicates
+"""
+
+from typing import Optional
+
+from sqlalchemy import inspect, select, text, update, bindparam
+
+from app.core.database import engine, ensure_columns
+from app.core.dedupe import content_hash
+from app.models.hook_model import Hook
+
+BATCH_SIZE = 5000
+UNIQUE_INDEX = "uq_hooks_platform_content_hash"
+
+
+def _hash_missing(bind, batch_size: int) -> int:
+    """Fill content_hash in id order, one batch per transaction."""
+    table = Hook.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(content_hash=bindparam("hash"))
+    )
+    hashed = 0
+    last_id = 0
+    while True:
+        with bind.begin() as conn:
+            batch = conn.execute(
+                select(table.c.id, table.c.text)
+                .where(table.c.content_hash.is_(None), table.c.id > last_id)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                return hashed
+            conn.execute(stmt, [{"row_id": row.id, "hash": content_hash(row.text)} for row in batch])
+        hashed += len(batch)
+        last_id = batch[-1].id
+        print(f"🔑 Hashed {hashed} hooks...")
+
+
+def _delete_duplicates(bind, batch_size: int) -> int:
+    """Delete every row that is not the lowest id of its (platform, content_hash) group."""
+    table = Hook.__table__
+    duplicate_ids = text(f"""
+        SELECT h.id FROM {Hook.__tablename__} h
+        JOIN (
+            SELECT platform, content_hash, MIN(id) AS keep_id
+            FROM {Hook.__tablename__}
+            WHERE content_hash IS NOT NULL
+            GROUP BY platform, content_hash
+            HAVING COUNT(*) > 1
+        ) d ON h.platform = d.platform AND h.content_hash = d.content_hash AND h.id <> d.keep_id
+        LIMIT :batch_size
+    """)
+    deleted = 0
+    while True:
+        with bind.begin() as conn:
+            ids = [row.id for row in conn.execute(duplicate_ids, {"batch_size": batch_size})]
+            if not ids:
+                return deleted
+            conn.execute(table.delete().where(table.c.id.in_(ids)))
+        deleted += len(ids)
+        print(f"🧹 Removed {deleted} duplicate hooks...")
+
+
+def backfill_content_hashes(bind=None, batch_size: int = BATCH_SIZE) -> dict:
+    """Run the full backfill and return counts of hashed and deleted rows."""
+    bind = bind or engine
+    ensure_columns(Hook.__table__, {"content_hash": "VARCHAR(64)"}, bind=bind)
+    hashed = _hash_missing(bind, batch_size)
+    deleted = _delete_duplicates(bind, batch_size)
+    ensure_columns(Hook.__table__, {}, (UNIQUE_INDEX,), bind)
+    print(f"✅ Backfill done: {hashed} hashed, {deleted} duplicates removed.")
+    return {"hashed": hashed, "deleted": deleted}
+
+
+
+def ensure_content_hash(bind=None, batch_size: int = BATCH_SIZE) -> Optional[dict]:
+    """
+    Startup migration: run the backfill if the hooks table lacks the unique index.
+
+    Returns:
+        The backfill counts, or None if the table was already up to date
+    """
+    bind = bind or engine
+    inspector = inspect(bind)
+    if not inspector.has_table(Hook.__tablename__):
+        return None
+    if UNIQUE_INDEX in {index["name"] for index in inspector.get_indexes(Hook.__tablename__)}:
+        return None
+    print("🛠 hooks table predates content hashing, backfilling...")
+    return backfill_content_hashes(bind, batch_size)
+
+
+if __name__ == "__main__":
+    backfill_content_hashes()
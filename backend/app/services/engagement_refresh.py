@@ -0,0 +1,303 @@
+"""
+Background engagement refresh for already-ingested hooks.
+
+Scrapers store each hook's platform id (``source_id``) and engagement at
+ingest time: the Reddit score, YouTube view count or Instagram like count.
+Those numbers keep moving after ingest. This job re-polls them in the
+largest batches each API allows:
+
+    Reddit   reddit.info(fullnames=...)   100 fullnames per call
+    YouTube  videos.list(id=...)          50 ids per call (1 quota unit)
+
+Instagram has no batch lookup, so its likes are only captured at ingest.
+
+Recently ingested hooks come first. Hooks younger than
+ENGAGEMENT_REFRESH_RECENT_HOURS are re-polled every
+ENGAGEMENT_REFRESH_RECENT_SECONDS. Older ones are re-polled every
+ENGAGEMENT_REFRESH_STALE_SECONDS, up to ENGAGEMENT_REFRESH_MAX_AGE_DAYS
+old. Each run handles at most ENGAGEMENT_REFRESH_MAX_PER_RUN hooks per
+platform, newest first. Calls go through the same clients and shared rate
+limits as the scrapers. Every app worker runs the loop; each run claims
+the hooks it polls (see claim_due), so workers split the due hooks instead
+of all polling the same ones.
+
+Existing databases need the new hook columns first:
+
+    python -m app.services.engagement_refresh --migrate
+    python -m app.services.engagement_refresh --platform reddit --limit 1000
+"""
+
+import argparse
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import and_, bindparam, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import engine, ensure_columns
+from app.models.hook_model import Hook
+
+REDDIT_BATCH = 100   # reddit.info() fullnames per call
+YOUTUBE_BATCH = 50   # videos.list ids per call
+
+# Columns added to hooks for engagement tracking, with their DDL types
+ENGAGEMENT_COLUMNS = {
+    "source_id": "VARCHAR(64)",
+    "engagement": "INTEGER",
+    "engagement_updated_at": "TIMESTAMP",
+    "created_at": "TIMESTAMP",
+}
+
+_thread: Optional[threading.Thread] = None
+_stop = threading.Event()
+_last_run: Dict = {}
+
+
+def ensure_engagement_columns(bind=None):
+    """Add the engagement columns and indexes if the hooks table predates them."""
+    ensure_columns(
+        Hook.__table__,
+        ENGAGEMENT_COLUMNS,
+        ("ix_hooks_platform_source_id", "ix_hooks_platform_created_at"),
+        bind or engine,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Platform fetchers: list of source ids -> {source_id: engagement}
+# ---------------------------------------------------------------------------
+def fetch_reddit_scores(fullnames: List[str]) -> Dict[str, int]:
+    """Current scores for up to 100 submissions in one info() call."""
+    from app.services.reddit_scraper import reddit_client
+
+    with reddit_client() as reddit:
+        return {submission.fullname: submission.score for submission in reddit.info(fullnames=fullnames)}
+
+
+def fetch_youtube_views(video_ids: List[str]) -> Dict[str, int]:
+    """Current view counts for up to 50 videos in one videos.list call."""
+    from app.services.youtube_scraper import youtube_client
+
+    with youtube_client() as youtube:
+        response = youtube.videos().list(
+            part="statistics",
+            id=",".join(video_ids),  # maxResults is not allowed with id
+        ).execute()
+    return {
+        item["id"]: int(item.get("statistics", {}).get("viewCount", 0))
+        for item in response.get("items", [])
+    }
+
+
+# platform key -> (Hook.platform value, batch size, fetcher)
+REFRESHERS: Dict[str, tuple] = {
+    "reddit": ("Reddit", REDDIT_BATCH, fetch_reddit_scores),
+    "youtube": ("YouTube", YOUTUBE_BATCH, fetch_youtube_views),
+}
+
+
+def _due(table, now: datetime):
+    """Where-clause for hooks whose engagement is due for a refresh at ``now``."""
+    recent_since = now - timedelta(hours=settings.ENGAGEMENT_REFRESH_RECENT_HOURS)
+    oldest = now - timedelta(days=settings.ENGAGEMENT_REFRESH_MAX_AGE_DAYS)
+    recent_stale = now - timedelta(seconds=settings.ENGAGEMENT_REFRESH_RECENT_SECONDS)
+    old_stale = now - timedelta(seconds=settings.ENGAGEMENT_REFRESH_STALE_SECONDS)
+    updated = table.c.engagement_updated_at
+    return and_(
+        table.c.source_id.isnot(None),
+        table.c.created_at >= oldest,
+        or_(
+            updated.is_(None),
+            and_(table.c.created_at >= recent_since, updated < recent_stale),
+            updated < old_stale,
+        ),
+    )
+
+
+def select_due(platform: str, limit: int, now: Optional[datetime] = None, bind=None) -> List[tuple]:
+    """
+    Hooks of one platform whose engagement is due for a refresh, newest first.
+
+    Returns:
+        List of (hook id, source_id) tuples
+    """
+    bind = bind or engine
+    now = now or datetime.utcnow()
+    table = Hook.__table__
+    stmt = (
+        select(table.c.id, table.c.source_id)
+        .where(table.c.platform == REFRESHERS[platform][0], _due(table, now))
+        .order_by(table.c.created_at.desc(), table.c.id.desc())
+        .limit(limit)
+    )
+    with bind.connect() as conn:
+        return [(row.id, row.source_id) for row in conn.execute(stmt)]
+
+
+def claim_due(platform: str, limit: int, now: Optional[datetime] = None, bind=None) -> List[tuple]:
+    """
+    Select the due hooks of one platform and claim them for this run.
+
+    Every app worker runs the refresh loop against the same DB. A hook is
+    claimed by stamping ``engagement_updated_at`` with a conditional UPDATE
+    that only matches hooks that are still due, so a hook another worker
+    claimed first is left to that worker and polled once.
+
+    Returns:
+        List of (hook id, source_id) tuples this run owns
+    """
+    bind = bind or engine
+    now = now or datetime.utcnow()
+    due = select_due(platform, limit, now, bind)
+    if not due:
+        return []
+    table = Hook.__table__
+    ids = [hook_id for hook_id, _ in due]
+    with bind.begin() as conn:
+        conn.execute(
+            update(table).where(table.c.id.in_(ids), _due(table, now)).values(engagement_updated_at=now)
+        )
+        claimed = {
+            row.id for row in conn.execute(
+                select(table.c.id).where(table.c.id.in_(ids), table.c.engagement_updated_at == now)
+            )
+        }
+    return [hook for hook in due if hook[0] in claimed]
+
+
+def _release(bind, hooks: List[tuple]):
+    """Hand claimed hooks back after a failed fetch so the next run retries them."""
+    table = Hook.__table__
+    with bind.begin() as conn:
+        conn.execute(
+            update(table).where(table.c.id.in_([hook_id for hook_id, _ in hooks]))
+            .values(engagement_updated_at=None)
+        )
+
+
+def _write_engagement(bind, hooks: List[tuple], values: Dict[str, int], now: datetime) -> int:
+    """Store fetched engagement; hooks the API no longer returns just get a new timestamp."""
+    table = Hook.__table__
+    found = [{"row_id": hook_id, "value": values[sid]} for hook_id, sid in hooks if sid in values]
+    gone = [{"row_id": hook_id} for hook_id, sid in hooks if sid not in values]
+    with bind.begin() as conn:
+        if found:
+            conn.execute(
+                update(table).where(table.c.id == bindparam("row_id"))
+                .values(engagement=bindparam("value"), engagement_updated_at=now),
+                found,
+            )
+        if gone:
+            conn.execute(
+                update(table).where(table.c.id == bindparam("row_id")).values(engagement_updated_at=now),
+                gone,
+            )
+    return len(found)
+
+
+def refresh_platform(platform: str, limit: Optional[int] = None, bind=None,
+                     fetcher: Optional[Callable[[List[str]], Dict[str, int]]] = None) -> Dict:
+    """
+    Refresh engagement for the due hooks of one platform.
+
+    Args:
+        platform: "reddit" or "youtube"
+        limit: Max hooks this run (defaults to ENGAGEMENT_REFRESH_MAX_PER_RUN)
+        bind: Engine to use (defaults to the app engine)
+        fetcher: Override the API call (source ids -> engagement)
+
+    Returns:
+        Dictionary with selected, updated, missing, calls and seconds
+    """
+    bind = bind or engine
+    _, batch_size, default_fetcher = REFRESHERS[platform]
+    fetcher = fetcher or default_fetcher
+    started = time.perf_counter()
+    due = claim_due(platform, limit or settings.ENGAGEMENT_REFRESH_MAX_PER_RUN, bind=bind)
+
+    updated = calls = failed = 0
+    for start in range(0, len(due), batch_size):
+        batch = due[start:start + batch_size]
+        try:
+            values = fetcher([sid for _, sid in batch])
+        except Exception as e:
+            failed += len(batch)
+            _release(bind, batch)
+            print(f"⚠️ Engagement refresh for {platform} failed on a batch: {e}")
+            continue
+        calls += 1
+        updated += _write_engagement(bind, batch, values, datetime.utcnow())
+
+    result = {
+        "selected": len(due),
+        "updated": updated,
+        "missing": len(due) - updated - failed,
+        "failed": failed,
+        "calls": calls,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    if due:
+        print(f"📈 Refreshed engagement for {updated}/{len(due)} {platform} hooks in {calls} calls ({result['seconds']}s)")
+    return result
+
+
+def refresh_engagement(platforms: Optional[Iterable[str]] = None, limit: Optional[int] = None) -> Dict:
+    """Refresh every platform that supports batch lookups."""
+    results = {}
+    for platform in platforms or REFRESHERS:
+        try:
+            results[platform] = refresh_platform(platform, limit)
+        except (SQLAlchemyError, RuntimeError) as e:
+            print(f"❌ Engagement refresh for {platform} failed: {e}")
+            results[platform] = {"error": str(e)}
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Background loop
+# ---------------------------------------------------------------------------
+def _loop():
+    while not _stop.wait(settings.ENGAGEMENT_REFRESH_POLL_SECONDS):
+        try:
+            _last_run.update(platforms=refresh_engagement(), at=datetime.utcnow().isoformat())
+        except Exception as e:
+            print(f"❌ Engagement refresh run failed: {e}")
+
+
+def start_engagement_refresh():
+    """Start the refresh thread once per process."""
+    global _thread
+    if not settings.ENGAGEMENT_REFRESH_ENABLED or (_thread and _thread.is_alive()):
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_loop, name="engagement-refresh", daemon=True)
+    _thread.start()
+    print(f"📈 Engagement refresh started (every {settings.ENGAGEMENT_REFRESH_POLL_SECONDS:.0f}s)")
+
+
+def stop_engagement_refresh():
+    _stop.set()
+
+
+def get_engagement_refresh_status() -> Dict:
+    """Whether the loop is running and what its last run did."""
+    return {
+        "running": bool(_thread and _thread.is_alive()),
+        "poll_seconds": settings.ENGAGEMENT_REFRESH_POLL_SECONDS,
+        "last_run": dict(_last_run) or None,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-poll engagement for already-ingested hooks.")
+    parser.add_argument("--platform", choices=list(REFRESHERS), action="append", help="Platform(s) to refresh (default: all)")
+    parser.add_argument("--limit", type=int, default=None, help="Max hooks per platform")
+    parser.add_argument("--migrate", action="store_true", help="Only add the engagement columns to an existing hooks table")
+    args = parser.parse_args()
+
+    ensure_engagement_columns()
+    if not args.migrate:
+        print(refresh_engagement(args.platform, args.limit))
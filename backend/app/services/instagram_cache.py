@@ -0,0 +1,103 @@
+"""
+Disk-backed cache for instaloader profiles and pagination cursors.
+
+Resolving ``Profile.from_username`` costs a request on every scrape, and
+``profile.get_posts()`` always restarts from the newest post. This module
+keeps both on disk, keyed by username:
+
+  - ``<username>.profile.json.xz``: resolved profile metadata, reused until
+    INSTAGRAM_PROFILE_CACHE_TTL expires
+  - ``<username>.cursor.json.xz``: instaloader's frozen post iterator, so
+    the next scrape can resume where the last one stopped
+"""
+
+import os
+import threading
+import time
+from typing import Dict
+
+import instaloader
+from instaloader.exceptions import InvalidArgumentException
+
+from app.core.config import settings
+
+# username -> lock serialising its cache files
+_locks: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def _lock(username: str) -> threading.Lock:
+    with _locks_lock:
+        return _locks.setdefault(username.lower(), threading.Lock())
+
+
+def _path(username: str, kind: str) -> str:
+    return os.path.join(settings.INSTAGRAM_CACHE_DIR, f"{username.lower()}.{kind}.json.xz")
+
+
+def _save(structure, path: str):
+    """Write atomically so a crash never leaves a truncated cache file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp.json.xz"
+    instaloader.save_structure_to_file(structure, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _load(context, path: str):
+    try:
+        return instaloader.load_structure_from_file(context, path)
+    except (OSError, ValueError, EOFError, InvalidArgumentException):
+        return None
+
+
+def get_profile(context, username: str) -> instaloader.Profile:
+    """Return the profile from disk if it is fresh, otherwise resolve and cache it."""
+    path = _path(username, "profile")
+    with _lock(username):
+        if os.path.exists(path) and time.time() - os.path.getmtime(path) < settings.INSTAGRAM_PROFILE_CACHE_TTL:
+            profile = _load(context, path)
+            if isinstance(profile, instaloader.Profile):
+                return profile
+        profile = instaloader.Profile.from_username(context, username)
+        _save(profile, path)
+        return profile
+
+
+def save_cursor(username: str, iterator):
+    """Persist where a get_posts() iteration stopped."""
+    with _lock(username):
+        _save(iterator.freeze(), _path(username, "cursor"))
+
+
+def resume_cursor(context, username: str, iterator) -> bool:
+    """
+    Fast-forward a fresh get_posts() iterator to the saved position.
+
+    Returns:
+        True if the iterator was resumed, False if there was nothing usable
+        (no cursor, expired cursor or one from a different query)
+    """
+    path = _path(username, "cursor")
+    with _lock(username):
+        frozen = _load(context, path) if os.path.exists(path) else None
+        if frozen is None:
+            return False
+        try:
+            iterator.thaw(frozen)
+        except InvalidArgumentException:
+            os.remove(path)
+            return False
+        # instaloader freezes *at* the last post handed out, so an
+        # interrupted post would be retried. Every post we hand out has been
+        # processed, so step past it.
+        next(iterator, None)
+        return True
+
+
+def clear(username: str):
+    """Drop everything cached for a username."""
+    with _lock(username):
+        for kind in ("profile", "cursor"):
+            path = _path(username, kind)
+            if os.path.exists(path):
+                os.remove(path)
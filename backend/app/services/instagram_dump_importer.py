@@ -0,0 +1,174 @@
+"""
+Offline importer for instaloader ``.json.xz`` dumps.
+
+Walks a directory tree of instaloader output (e.g. ``backend/beerbiceps/``),
+decompresses each file as a stream, extracts captions and like counts and
+bulk-loads them into the hooks table without touching Instagram:
+
+    python -m app.services.instagram_dump_importer ./dumps --workers 8
+
+Files are parsed in a process pool; the parent only batches rows and writes
+them, so memory stays flat however many files there are.
+"""
+
+import argparse
+import json
+import lzma
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional
+
+from app.core.bulk_writer import bulk_insert_hooks
+from app.core.config import settings
+
+DUMP_SUFFIXES = (".json.xz", ".json")
+
+
+def iter_dump_files(root: str) -> Iterator[str]:
+    """Yield every instaloader JSON dump under ``root``."""
+    for dirpath, _, filenames in os.walk(root):
+        for name in sorted(filenames):
+            if name.endswith(DUMP_SUFFIXES):
+                yield os.path.join(dirpath, name)
+
+
+def _open_dump(path: str):
+    if path.endswith(".xz"):
+        return lzma.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def node_caption(node: Dict) -> str:
+    """Caption from either the GraphQL or the iPhone API node layout."""
+    edges = node.get("edge_media_to_caption", {}).get("edges", [])
+    if edges:
+        return edges[0].get("node", {}).get("text") or ""
+    caption = node.get("caption")
+    if isinstance(caption, dict):
+        return caption.get("text") or ""
+    return caption or ""
+
+
+def node_likes(node: Dict) -> Optional[int]:
+    for key in ("edge_media_preview_like", "edge_liked_by"):
+        if key in node:
+            return node[key].get("count")
+    return node.get("like_count")
+
+
+def _post_row(node: Dict, username: str) -> Optional[Dict]:
+    caption = node_caption(node).strip()
+    if not caption:
+        return None
+    return {
+        "text": caption,
+        "tone": "unknown",
+        "niche": node.get("owner", {}).get("username") or username,
+        "platform": "Instagram",
+        "engagement": node_likes(node),
+        "source_id": node.get("shortcode") or node.get("code"),
+    }
+
+
+def parse_dump_file(path: str) -> List[Dict]:
+    """
+    Extract hook rows from one dump file.
+
+    Post dumps yield one row; profile dumps yield any timeline posts they
+    embed. Unreadable files yield nothing.
+    """
+    username = os.path.basename(os.path.dirname(path))
+    try:
+        with _open_dump(path) as fh:
+            data = json.load(fh)
+    except (OSError, ValueError, lzma.LZMAError) as e:
+        print(f"⚠️ Skipping {path}: {e}")
+        return []
+
+    node = data.get("node", data)
+    node_type = data.get("instaloader", {}).get("node_type")
+    rows = []
+    if node_type == "Profile":
+        username = node.get("username") or username
+        edges = node.get("edge_owner_to_timeline_media", {}).get("edges", [])
+        for edge in edges:
+            row = _post_row(edge.get("node", {}), username)
+            if row:
+                rows.append(row)
+    elif node_type in (None, "Post"):
+        row = _post_row(node, username)
+        if row:
+            rows.append(row)
+    return rows
+
+
+def import_dumps(root: str, workers: Optional[int] = None, chunk_size: Optional[int] = None) -> Dict:
+    """
+    Import every dump under ``root`` into the hooks table.
+
+    Returns:
+        Dictionary with files, parsed rows, inserted rows and rows/sec
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or settings.HOOK_INSERT_CHUNK_SIZE
+    max_in_flight = workers * 4
+
+    started = time.perf_counter()
+    files = parsed = inserted = skipped = 0
+    buffer: List[Dict] = []
+
+    def _flush():
+        nonlocal inserted, skipped, buffer
+        if buffer:
+            stats = bulk_insert_hooks(buffer, chunk_size=chunk_size)
+            inserted += stats.rows
+            skipped += stats.skipped
+            buffer = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        paths = iter_dump_files(root)
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            # Keep a bounded number of files in flight
+            while not exhausted and len(pending) < max_in_flight:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(parse_dump_file, path))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rows = future.result()
+                files += 1
+                parsed += len(rows)
+                buffer.extend(rows)
+            if len(buffer) >= chunk_size:
+                _flush()
+                print(f"📦 {files} files, {inserted} hooks imported...")
+        _flush()
+
+    elapsed = time.perf_counter() - started
+    result = {
+        "files": files,
+        "parsed": parsed,
+        "inserted": inserted,
+        "skipped": skipped,
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(parsed / elapsed, 1) if elapsed > 0 else float(parsed),
+    }
+    print(f"✅ Imported {inserted} hooks from {files} dump files ({result['rows_per_sec']} rows/sec).")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import instaloader .json.xz dumps into the hooks table.")
+    parser.add_argument("root", help="Directory tree containing instaloader output")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Rows per bulk insert")
+    args = parser.parse_args()
+    import_dumps(args.root, workers=args.workers, chunk_size=args.chunk_size)
@@ -1,56 +1,242 @@
+import itertools
+import os
+import time
 import instaloader
-from app.models.hook_model import Hook
-from app.core.database import SessionLocal
-
-L = instaloader.Instaloader()
-
-def fetch_instagram_posts(username: str, limit: int = 10):
-    """Fetch recent Instagram posts for a given public account."""
-    profile = instaloader.Profile.from_username(L.context, username)
-    posts = []
-    
-    for i, post in enumerate(profile.get_posts()):
-        if i >= limit:
+from typing import Optional
+from app.core.config import settings
+from app.core.bulk_writer import bulk_insert_hooks
+from app.core.clients import lazy_client
+from app.core.scrape_engine import fan_out
+from app.core.metrics import scrape_run
+from app.core.raw_archive import archive_raw
+from app.core.scraper import ingest
+from app.core.streaming import stream_with_commits
+from app.services.watermarks import get_watermark, set_watermark
+from app.core.rate_limit import acquire, record_throttle
+from app.services import instagram_cache
+from app.services.instagram_dump_importer import node_caption, node_likes
+
+class SharedRateController(instaloader.RateController):
+    """
+    Instaloader rate controller that also draws from the shared Instagram
+    bucket, so parallel scrapes coordinate instead of triggering 429s.
+    """
+
+    THROTTLE_WINDOW = 600  # seconds of 429 history used to scale the backoff
+
+    def __init__(self, context):
+        super().__init__(context)
+        self._recent_429s = []
+
+    def _credential(self):
+        return self._context.username or "anonymous"
+
+    def wait_before_query(self, query_type: str):
+        acquire("instagram", self._credential())
+        super().wait_before_query(query_type)
+
+    def handle_429(self, query_type: str):
+        now = time.monotonic()
+        self._recent_429s = [t for t in self._recent_429s if now - t < self.THROTTLE_WINDOW]
+        record_throttle("instagram", self._credential(), len(self._recent_429s))
+        self._recent_429s.append(now)
+        super().handle_429(query_type)
+
+
+def _build_instaloader():
+    loader = instaloader.Instaloader(sleep=settings.INSTAGRAM_SLEEP, rate_controller=SharedRateController)
+    if settings.INSTAGRAM_USERNAME and settings.INSTAGRAM_SESSION_FILE and os.path.exists(settings.INSTAGRAM_SESSION_FILE):
+        try:
+            loader.load_session_from_file(settings.INSTAGRAM_USERNAME, settings.INSTAGRAM_SESSION_FILE)
+            print(f"🔐 Loaded Instagram session for @{settings.INSTAGRAM_USERNAME}")
+        except Exception as e:
+            print(f"⚠️ Could not load Instagram session: {e}")
+    return loader
+
+
+# Instaloader is not thread-safe: instances (each with the saved session) are
+# pooled and checked out per scrape, built on first use (or by the startup warmup)
+_instaloader = lazy_client("instagram", _build_instaloader, pool_size=settings.INSTAGRAM_SCRAPE_CONCURRENCY)
+
+
+def instagram_client():
+    """An Instaloader for the calling thread's exclusive use (see reddit_client)."""
+    return _instaloader.checkout()
+
+
+def _persist_session(loader: instaloader.Instaloader):
+    """Write the (possibly refreshed) login session back so restarts reuse it."""
+    if not settings.INSTAGRAM_SESSION_FILE:
+        return
+    if loader.context.is_logged_in:
+        try:
+            loader.save_session_to_file(settings.INSTAGRAM_SESSION_FILE)
+        except Exception as e:
+            print(f"⚠️ Could not save Instagram session: {e}")
+
+
+def post_from_raw(node, is_backfill: bool = False):
+    """Post dict from a raw media node (from the raw archive)."""
+    shortcode = node.get("shortcode") or node.get("code")
+    return {
+        "caption": node_caption(node),
+        "likes": node_likes(node),
+        "url": f"https://www.instagram.com/p/{shortcode}/",
+        "shortcode": shortcode,
+        "is_pinned": bool(node.get("pinned_for_users")),
+        "is_backfill": is_backfill,
+    }
+
+
+def _post_dict(post, is_backfill: bool = False, target: Optional[str] = None):
+    if target:
+        archive_raw("instagram", target, "media", post._node)
+    return {
+        "caption": post.caption if post.caption else "",
+        "likes": post.likes,
+        "url": f"https://www.instagram.com/p/{post.shortcode}/",
+        "shortcode": post.shortcode,
+        "is_pinned": post.is_pinned,
+        "is_backfill": is_backfill,
+    }
+
+
+def iter_instagram_posts(username: str, limit: int = 10, since: Optional[str] = None, resume: bool = True):
+    """
+    Yield recent Instagram posts for a given public account as they load.
+
+    Posts come newest first, so with ``since`` (the shortcode of the newest
+    post already ingested) iteration stops as soon as it is reached. Pinned
+    posts are out of order and never end the iteration.
+
+    The profile lookup is served from the on-disk cache, and the position
+    where the first scrape stopped is saved. When a later scrape catches up
+    with the watermark before ``limit``, the rest of the budget resumes that
+    saved cursor to backfill older posts (marked ``is_backfill``).
+    """
+    with instagram_client() as loader:
+        yield from _iter_posts(loader, username, limit, since, resume)
+        _persist_session(loader)
+
+
+def _iter_posts(loader: instaloader.Instaloader, username: str, limit: int, since: Optional[str], resume: bool):
+    """iter_instagram_posts with the loader already checked out."""
+    context = loader.context
+    profile = instagram_cache.get_profile(context, username)
+    count = 0
+    reached_watermark = False
+
+    # islice stops before pulling post limit+1, so the saved cursor points
+    # right after the last post yielded
+    newest_first = profile.get_posts()
+    for post in itertools.islice(newest_first, limit):
+        if since and post.shortcode == since and not post.is_pinned:
+            reached_watermark = True
             break
-        posts.append({
-            "caption": post.caption if post.caption else "",
-            "likes": post.likes,
-            "url": f"https://www.instagram.com/p/{post.shortcode}/"
-        })
-    return posts
+        count += 1
+        yield _post_dict(post, target=username)
+
+    older = None
+    try:
+        if not since:
+            instagram_cache.save_cursor(username, newest_first)
+        elif resume and reached_watermark and count < limit:
+            older = profile.get_posts()
+            if not instagram_cache.resume_cursor(context, username, older):
+                older = None
+    except Exception as e:
+        # The cursor is an optimisation; never fail the scrape over it
+        print(f"⚠️ Instagram cursor cache unavailable for @{username}: {e}")
+
+    if older is not None:
+        for post in itertools.islice(older, limit - count):
+            count += 1
+            yield _post_dict(post, is_backfill=True, target=username)
+        try:
+            instagram_cache.save_cursor(username, older)
+        except Exception as e:
+            print(f"⚠️ Instagram cursor cache unavailable for @{username}: {e}")
+
+
+def fetch_instagram_posts(username: str, limit: int = 10, since: Optional[str] = None, resume: bool = True):
+    """Fetch recent Instagram posts for a given public account (see iter_instagram_posts)."""
+    return list(iter_instagram_posts(username, limit, since=since, resume=resume))
+
+def hook_text(post):
+    return post["caption"]
+
+
+def hook_meta(post):
+    return {"source_id": post["shortcode"], "engagement": post["likes"]}
+
 
 def save_hooks_to_db(posts, niche: str):
     """Save scraped Instagram captions as hooks in DB."""
-    db = SessionLocal()
-    try:
-        for p in posts:
-            if p["caption"]:
-                hook = Hook(
-                    text=p["caption"],
-                    tone="unknown",
-                    niche=niche,
-                    platform="Instagram"
-                )
-                db.add(hook)
-        db.commit()
-        print(f"✅ Saved {len(posts)} hooks from @{niche}")
-    finally:
-        db.close()
-
-def scrape_and_store(username: str, limit: int = 10):
-    """End-to-end: fetch and save Instagram posts."""
-    posts = fetch_instagram_posts(username, limit)
-    if posts:
-        save_hooks_to_db(posts, niche=username)
-    else:
-        print(f"⚠️ No posts found for @{username}")
+    rows = [
+        {"text": p["caption"], "tone": "unknown", "niche": niche, "platform": "Instagram", **hook_meta(p)}
+        for p in posts
+        if p["caption"]
+    ]
+    stats = bulk_insert_hooks(rows)
+    print(f"✅ Saved {stats.rows} new hooks from @{niche}, {stats.skipped} duplicates skipped ({stats.rows_per_sec:.0f} rows/sec)")
+    return stats
+
+def scrape_and_store(username: str, limit: int = 10, incremental: bool = True, on_progress=None):
+    """
+    End-to-end: fetch and save Instagram posts through the ingest pipeline.
+
+    ``on_progress(stage, count)`` is called with "fetched" and "saved".
+    """
+    since = get_watermark("instagram", username) if incremental else None
+    with scrape_run("instagram", username) as run:
+        posts, report = ingest(
+            f"instagram:@{username}",
+            iter_instagram_posts(username, limit, since=since),
+            hook_text,
+            platform="Instagram",
+            niche=username,
+            on_progress=on_progress,
+            run=run,
+            to_meta=hook_meta,
+        )
+        with run.span("log"):
+            if posts:
+                report.print_summary()
+            else:
+                print(f"⚠️ No posts found for @{username}")
+    newest = next((p["shortcode"] for p in posts if not p["is_pinned"] and not p["is_backfill"]), None)
+    if newest:
+        set_watermark("instagram", username, newest)
+    return posts
+
+def scrape_stream(username: str, limit: int = 10, incremental: bool = True):
+    """
+    Streaming variant of scrape_and_store: yields events as posts arrive and
+    commits them in micro-batches. The watermark only advances once the
+    stream completes.
+    """
+    since = get_watermark("instagram", username) if incremental else None
+    newest = None
+
+    def _tracked():
+        nonlocal newest
+        for post in iter_instagram_posts(username, limit, since=since):
+            if newest is None and not post["is_pinned"] and not post["is_backfill"]:
+                newest = post["shortcode"]
+            yield post
+
+    with scrape_run("instagram", username, mode="stream") as run:
+        yield from stream_with_commits(_tracked(), lambda batch: save_hooks_to_db(batch, niche=username), run=run)
+    if newest:
+        set_watermark("instagram", username, newest)
 
 def scrape_instagram_all():
-    """Scrape a few default public accounts."""
+    """Scrape a few default public accounts concurrently."""
     accounts = ["garyvee", "garimakalraaa", "hubspot", "marketingharry", "creators", "themodernimbecile"]
-    for acc in accounts:
-        print(f"📸 Scraping Instagram user: {acc}")
-        scrape_and_store(acc, 5)
+    print(f"📸 Scraping {len(accounts)} Instagram users ...")
+    report = fan_out("instagram", accounts, lambda acc: scrape_and_store(acc, 5))
+    report.print_summary()
+    return report
 
 if __name__ == "__main__":
     scrape_instagram_all()
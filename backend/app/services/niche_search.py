@@ -0,0 +1,185 @@
+"""
+Substring and fuzzy niche search for ``GET /reddit/hooks/search``.
+
+``Hook.niche.ilike('%niche%')`` can't use the b-tree index on niche, and
+the endpoint returned every match at once. Niches are now matched by
+trigrams, ranked by similarity, and paginated:
+
+- PostgreSQL: pg_trgm with a GIN ``gin_trgm_ops`` index on hooks.niche.
+  Rows match on ``ILIKE`` or the ``%`` similarity operator and are
+  ordered by ``similarity(niche, query)``.
+- Other databases: niches are few compared to hooks, so the distinct
+  niches live in an in-process TrigramIndex (app/core/trigram.py),
+  refreshed every NICHE_INDEX_REFRESH_SECONDS. Matching niches are
+  walked most similar first, each through the b-tree niche index.
+
+Both backends order by (similarity desc, niche, id desc) and page with an
+opaque cursor over that key, so pages stay cheap however deep they go.
+"""
+
+import base64
+import binascii
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, and_, cast, func, or_, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.trigram import TrigramIndex
+from app.models.hook_model import Hook
+
+TRIGRAM_INDEX = "ix_hooks_niche_trgm"
+
+_POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX} ON hooks USING GIN (niche gin_trgm_ops)",
+]
+
+# Engine URL -> True when pg_trgm is available
+_pg_trgm: Dict[str, bool] = {}
+
+_niche_index = TrigramIndex()
+_niche_index_refreshed = 0.0
+_refresh_lock = threading.Lock()
+
+Cursor = Tuple[float, str, int]  # (similarity, niche, hook id) of the last row served
+
+
+def encode_search_cursor(score: float, niche: str, hook_id: int) -> str:
+    raw = json.dumps([score, niche, hook_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Cursor:
+    """Decode a search cursor; raises ValueError when it is malformed."""
+    try:
+        score, niche, hook_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not (isinstance(score, (int, float)) and isinstance(niche, str) and isinstance(hook_id, int)):
+        raise ValueError("Invalid cursor")
+    return float(score), niche, hook_id
+
+
+def ensure_niche_trigram_index(bind) -> bool:
+    """
+    Enable pg_trgm and index hooks.niche on PostgreSQL.
+
+    Returns:
+        Whether the pg_trgm backend can be used (False on other databases
+        or when the extension can't be created)
+    """
+    key = str(bind.url)
+    if key not in _pg_trgm:
+        available = False
+        if bind.dialect.name == "postgresql":
+            try:
+                with bind.begin() as conn:
+                    for ddl in _POSTGRES_DDL:
+                        conn.execute(text(ddl))
+                available = True
+            except SQLAlchemyError as e:
+                print(f"⚠️ pg_trgm unavailable, using the in-process niche index: {e}")
+        _pg_trgm[key] = available
+    return _pg_trgm[key]
+
+
+def get_niche_index(db: Session) -> TrigramIndex:
+    """The in-process niche index, topped up with new niches when stale."""
+    global _niche_index_refreshed
+
+    def _stale():
+        return not _niche_index_refreshed or time.monotonic() - _niche_index_refreshed >= settings.NICHE_INDEX_REFRESH_SECONDS
+
+    if _stale():
+        with _refresh_lock:
+            if _stale():
+                _niche_index.add_many(niche for (niche,) in db.query(Hook.niche).distinct())
+                _niche_index_refreshed = time.monotonic()
+    return _niche_index
+
+
+def _result(hook: Hook, score: float) -> Dict:
+    return {
+        "id": hook.id,
+        "text": hook.text,
+        "niche": hook.niche,
+        "platform": hook.platform,
+        "engagement": hook.engagement,
+        "similarity": round(score, 4),
+    }
+
+
+def _search_postgres(db: Session, query: str, limit: int, after: Optional[Cursor]) -> List[Tuple[Hook, float]]:
+    # similarity() is float4; float8 round-trips through the cursor exactly
+    score = cast(func.similarity(Hook.niche, query), Float(53))
+    pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    q = db.query(Hook, score).filter(or_(Hook.niche.ilike(pattern, escape="\\"), Hook.niche.op("%")(query)))
+    if after:
+        last_score, last_niche, last_id = after
+        q = q.filter(or_(
+            score < last_score,
+            and_(score == last_score, or_(
+                Hook.niche > last_niche,
+                and_(Hook.niche == last_niche, Hook.id < last_id),
+            )),
+        ))
+    return q.order_by(score.desc(), Hook.niche, Hook.id.desc()).limit(limit).all()
+
+
+def _search_in_process(db: Session, query: str, limit: int, after: Optional[Cursor]) -> List[Tuple[Hook, float]]:
+    rows: List[Tuple[Hook, float]] = []
+    for niche, score in get_niche_index(db).search(query):
+        q = db.query(Hook).filter(Hook.niche == niche)
+        if after:
+            last_score, last_niche, last_id = after
+            if (-score, niche) < (-last_score, last_niche):
+                continue  # served on earlier pages
+            if niche == last_niche:
+                q = q.filter(Hook.id < last_id)
+        rows.extend((hook, score) for hook in q.order_by(Hook.id.desc()).limit(limit - len(rows)))
+        if len(rows) >= limit:
+            break
+    return rows
+
+
+def search_hooks_by_niche(db: Session, query: str, limit: int = 50,
+                          cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of hooks whose niche contains or resembles ``query``.
+
+    Args:
+        db: Database session
+        query: Niche text to look for
+        limit: Page size
+        cursor: Next cursor of the previous page
+
+    Returns:
+        The page (dicts with a ``similarity`` score, most similar niche
+        first) and the next cursor, or None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    after = decode_search_cursor(cursor) if cursor else None
+    if ensure_niche_trigram_index(db.get_bind()):
+        rows = _search_postgres(db, query, limit + 1, after)
+    else:
+        rows = _search_in_process(db, query, limit + 1, after)
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        hook, score = rows[-1]
+        next_cursor = encode_search_cursor(score, hook.niche, hook.id)
+    return [_result(hook, score) for hook, score in rows], next_cursor
+
+
+def get_niche_index_stats() -> Dict:
+    """Size of the in-process niche index and when it was last topped up."""
+    age = round(time.monotonic() - _niche_index_refreshed, 1) if _niche_index_refreshed else None
+    return dict(_niche_index.to_dict(), refreshed_seconds_ago=age)
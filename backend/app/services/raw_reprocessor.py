@@ -0,0 +1,194 @@
+"""
+Rebuild hooks from the raw payload archive without touching the platforms.
+
+Every item the scrapers fetch is also written to the raw archive
+(app/core/raw_archive.py). When the extraction logic changes, this tool
+replays the archive through the scrapers' own ``post_from_raw`` /
+``hook_text`` / ``hook_meta`` functions and bulk-loads the result:
+
+    python -m app.services.raw_reprocessor --platform reddit --since 2026-10-01
+    python -m app.services.raw_reprocessor --replace --label
+    python -m app.services.raw_reprocessor --dry-run --workers 4
+
+By default only hooks that are not stored yet are added. ``--replace``
+rewrites the stored hooks matched on (platform, source_id) with the newly
+extracted text and engagement (and tone / niche with ``--label``), which is
+what a changed extractor or labeler needs.
+
+Like the instaloader dump importer, part files are decompressed and parsed
+in a process pool while the parent only batches rows and writes them, so
+memory stays flat however large the archive is.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from app.core.bulk_writer import bulk_insert_hooks, bulk_replace_hooks
+from app.core.config import settings
+from app.core.raw_archive import iter_archive_files, iter_records
+
+
+def _extractors() -> Dict[str, tuple]:
+    """
+    Platform key -> (Hook.platform value, {kind: post_from_raw}, hook_text, hook_meta).
+
+    Imported lazily so a worker only loads the scrapers when it parses a file.
+    """
+    from app.services import instagram_scaper, reddit_scraper, youtube_scraper
+
+    return {
+        "reddit": ("Reddit", {"submission": reddit_scraper.post_from_raw},
+                   reddit_scraper.hook_text, reddit_scraper.hook_meta),
+        "youtube": ("YouTube", {"search_result": youtube_scraper.video_from_raw,
+                                "video": youtube_scraper.video_from_raw},
+                    youtube_scraper.hook_text, youtube_scraper.hook_meta),
+        "instagram": ("Instagram", {"media": instagram_scaper.post_from_raw},
+                      instagram_scaper.hook_text, instagram_scaper.hook_meta),
+    }
+
+
+def _record_row(record: Dict, extractors: Dict[str, tuple]) -> Optional[Dict]:
+    platform, kinds, to_text, to_meta = extractors[record["platform"]]
+    from_raw: Optional[Callable] = kinds.get(record["kind"])
+    if from_raw is None:
+        return None
+    post = from_raw(record["payload"])
+    text = (to_text(post) or "").strip()
+    if not text:
+        return None
+    return {"text": text, "tone": "unknown", "niche": record["target"], "platform": platform, **to_meta(post)}
+
+
+def parse_archive_file(path: str) -> List[Dict]:
+    """
+    Extract hook rows from one archive part file.
+
+    Records of unknown platforms or kinds, and payloads the extractors
+    cannot handle, are skipped.
+    """
+    extractors = _extractors()
+    rows = []
+    bad = 0
+    for record in iter_records(path):
+        try:
+            row = _record_row(record, extractors)
+        except (KeyError, TypeError, ValueError):
+            bad += 1
+            continue
+        if row:
+            rows.append(row)
+    if bad:
+        print(f"⚠️ {path}: skipped {bad} malformed records")
+    return rows
+
+
+def reprocess_archive(root: Optional[str] = None, platforms: Optional[List[str]] = None,
+                      since: Optional[str] = None, until: Optional[str] = None,
+                      workers: Optional[int] = None, chunk_size: Optional[int] = None,
+                      label: bool = False, replace: bool = False, dry_run: bool = False) -> Dict:
+    """
+    Re-derive hooks from archived payloads and insert (or rewrite) them.
+
+    Args:
+        root: Archive directory (defaults to RAW_ARCHIVE_DIR)
+        platforms: Only these platforms (default: all)
+        since / until: Inclusive ``YYYY-MM-DD`` partition bounds
+        workers: Parser processes (default: CPU count)
+        chunk_size: Rows per bulk insert (defaults to HOOK_INSERT_CHUNK_SIZE)
+        label: Run the zero-shot labeler on each batch before inserting
+        replace: Overwrite hooks already stored for the same source_id
+            instead of skipping them
+        dry_run: Parse and count rows without writing them
+
+    Returns:
+        Dictionary with files, parsed rows, inserted / updated rows and rows/sec
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or settings.HOOK_INSERT_CHUNK_SIZE
+    max_in_flight = workers * 4
+
+    started = time.perf_counter()
+    files = parsed = inserted = updated = skipped = 0
+    buffer: List[Dict] = []
+
+    def _flush():
+        nonlocal inserted, updated, skipped, buffer
+        if buffer and not dry_run:
+            if label:
+                from app.services.auto_labeler import label_rows
+                label_rows(buffer)
+            if replace:
+                stats = bulk_replace_hooks(buffer, chunk_size=chunk_size, update_labels=label)
+            else:
+                stats = bulk_insert_hooks(buffer, chunk_size=chunk_size)
+            inserted += stats.rows
+            updated += stats.updated
+            skipped += stats.skipped
+        buffer = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        paths = iter_archive_files(root, platforms, since, until)
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            # Keep a bounded number of files in flight
+            while not exhausted and len(pending) < max_in_flight:
+                path = next(paths, None)
+                if path is None:
+                    exhausted = True
+                    break
+                pending.add(pool.submit(parse_archive_file, path))
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rows = future.result()
+                files += 1
+                parsed += len(rows)
+                buffer.extend(rows)
+            if len(buffer) >= chunk_size:
+                _flush()
+                print(f"📦 {files} archive files, {parsed} hooks parsed...")
+        _flush()
+
+    elapsed = time.perf_counter() - started
+    result = {
+        "files": files,
+        "parsed": parsed,
+        "inserted": inserted,
+        "updated": updated,
+        "skipped": skipped,
+        "dry_run": dry_run,
+        "seconds": round(elapsed, 2),
+        "rows_per_sec": round(parsed / elapsed, 1) if elapsed > 0 else float(parsed),
+    }
+    if dry_run:
+        verb = "Parsed"
+    elif replace:
+        verb = f"Inserted {inserted} and updated {updated} of"
+    else:
+        verb = f"Inserted {inserted} of"
+    print(f"✅ {verb} {parsed} hooks from {files} archive files ({result['rows_per_sec']} rows/sec).")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild hooks from the raw payload archive.")
+    parser.add_argument("--root", default=None, help="Archive directory (default: RAW_ARCHIVE_DIR)")
+    parser.add_argument("--platform", choices=["reddit", "youtube", "instagram"], action="append",
+                        help="Platform(s) to reprocess (default: all)")
+    parser.add_argument("--since", default=None, help="First partition date, YYYY-MM-DD")
+    parser.add_argument("--until", default=None, help="Last partition date, YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Rows per bulk insert")
+    parser.add_argument("--label", action="store_true", help="Run the zero-shot labeler before inserting")
+    parser.add_argument("--replace", action="store_true",
+                        help="Overwrite stored hooks with the same source_id instead of skipping them")
+    parser.add_argument("--dry-run", action="store_true", help="Parse without writing")
+    args = parser.parse_args()
+    reprocess_archive(args.root, args.platform, args.since, args.until, workers=args.workers,
+                      chunk_size=args.chunk_size, label=args.label, replace=args.replace, dry_run=args.dry_run)
@@ -0,0 +1,173 @@
+"""
+Concurrent multi-listing Reddit fetcher.
+
+The hot listing alone only shows one slice of a subreddit. This module
+pulls hot, new, top (day / week) and rising for a subreddit at the same
+time, and many subreddits at once. Everything is merged into one
+de-duplicated stream as the pages arrive, so a scrape covers far more
+hooks in about the wall time of a single listing.
+
+praw is synchronous, and one praw.Reddit instance must not be used from
+two threads at once. So each listing runs on a thread from a shared
+executor, with a praw.Reddit checked out of the reddit client pool
+(``reddit_client()``, up to REDDIT_SESSION_POOL_SIZE idle). Each pooled
+instance keeps its own requests session and OAuth token alive between
+scrapes. They all use RateLimitedRequestor, so the whole fan-out draws
+from the one shared Reddit token bucket.
+
+    posts = fetch_reddit_listings("Business", limit=50)
+    by_sub = asyncio.run(afetch_subreddits(["Business", "startups"], limit=50))
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.reddit_scraper import post_dict, reddit_client, walk_listing
+
+Listing = Tuple[str, Optional[str]]  # (listing name, time filter)
+
+# One thread per session; shared by every event loop (the default executor is
+# sized by CPU count, which would serialise the listings on small hosts)
+_executor = ThreadPoolExecutor(max_workers=settings.REDDIT_SESSION_POOL_SIZE, thread_name_prefix="reddit-listing")
+_DONE = object()  # a listing thread finished
+
+
+def parse_listings(spec: Optional[str] = None) -> List[Listing]:
+    """
+    Parse a listing spec such as ``"hot,new,top:day,top:week,rising"``.
+
+    Args:
+        spec: Comma separated listings, ``top`` / ``controversial`` take a
+            ``:time_filter``. Defaults to REDDIT_LISTINGS.
+    """
+    listings = []
+    for part in (spec or settings.REDDIT_LISTINGS).split(","):
+        name, _, time_filter = part.strip().partition(":")
+        if name:
+            listings.append((name, time_filter or None))
+    return listings
+
+
+def _label(listing: Listing) -> str:
+    name, time_filter = listing
+    return f"{name}:{time_filter}" if time_filter else name
+
+
+def _drain_listing(loop, queue: asyncio.Queue, subreddit_name: str, listing: Listing, limit: int,
+                   stop: threading.Event, since: Optional[str] = None):
+    """Worker thread: walk one listing and hand each post to the event loop."""
+    name, time_filter = listing
+    try:
+        with reddit_client() as reddit:
+            method = getattr(reddit.subreddit(subreddit_name), name)
+            submissions = method(time_filter=time_filter, limit=limit) if time_filter else method(limit=limit)
+            for submission in walk_listing(name, submissions, since):
+                if stop.is_set():
+                    break
+                post = dict(post_dict(submission, subreddit_name), listing=_label(listing))
+                loop.call_soon_threadsafe(queue.put_nowait, post)
+    finally:
+        loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+
+async def aiter_subreddit(subreddit_name: str, limit: int = 50,
+                          listings: Optional[Iterable[Listing]] = None,
+                          since: Optional[str] = None) -> AsyncIterator[Dict]:
+    """
+    Yield posts from several listings of one subreddit as they arrive.
+
+    Args:
+        subreddit_name: Subreddit without the ``r/``
+        limit: Posts yielded in total; each listing is asked for up to this many
+        listings: ``(name, time_filter)`` pairs, default REDDIT_LISTINGS
+        since: Watermark; already-ingested posts are left out (see walk_listing)
+
+    Each post is yielded once, tagged with the first listing it came from.
+    The listings still running are stopped once ``limit`` posts are out.
+    A failing listing is reported and skipped unless every listing fails.
+    """
+    listings = list(listings or parse_listings())
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    tasks = [
+        loop.run_in_executor(_executor, _drain_listing, loop, queue, subreddit_name, listing, limit, stop, since)
+        for listing in listings
+    ]
+    seen = set()
+    try:
+        running = len(tasks)
+        while running and len(seen) < limit:
+            post = await queue.get()
+            if post is _DONE:
+                running -= 1
+            elif post["fullname"] not in seen:
+                seen.add(post["fullname"])
+                yield post
+    finally:
+        stop.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = [(listing, r) for listing, r in zip(listings, results) if isinstance(r, Exception)]
+    if errors and len(errors) == len(tasks):
+        raise errors[0][1]
+    for listing, error in errors:
+        print(f"⚠️ r/{subreddit_name} {_label(listing)} listing failed: {error}")
+
+
+async def afetch_subreddit(subreddit_name: str, limit: int = 50,
+                           listings: Optional[Iterable[Listing]] = None) -> List[Dict]:
+    """Collect aiter_subreddit into a list."""
+    return [post async for post in aiter_subreddit(subreddit_name, limit, listings)]
+
+
+async def afetch_subreddits(subreddit_names: Iterable[str], limit: int = 50,
+                            listings: Optional[Iterable[Listing]] = None,
+                            concurrency: Optional[int] = None) -> Dict[str, List[Dict]]:
+    """
+    Fetch several subreddits concurrently, at most ``concurrency`` at a time.
+
+    Returns:
+        Dictionary mapping subreddit to its merged posts (empty on failure)
+    """
+    listings = list(listings or parse_listings())
+    semaphore = asyncio.Semaphore(concurrency or settings.REDDIT_SCRAPE_CONCURRENCY)
+
+    async def _one(name: str):
+        async with semaphore:
+            try:
+                return name, await afetch_subreddit(name, limit, listings)
+            except Exception as e:
+                print(f"❌ r/{name}: {e}")
+                return name, []
+
+    return dict(await asyncio.gather(*(_one(name) for name in subreddit_names)))
+
+
+def iter_reddit_listings(subreddit_name: str, limit: int = 50, listings: Optional[Iterable[Listing]] = None,
+                         since: Optional[str] = None):
+    """
+    Synchronous bridge over aiter_subreddit for the threaded scrape paths.
+
+    Runs a private event loop in the calling thread, so it can be used from
+    fan_out workers and background jobs but not from inside a running loop.
+    """
+    loop = asyncio.new_event_loop()
+    posts = aiter_subreddit(subreddit_name, limit, listings, since)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(posts.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(posts.aclose())
+        loop.close()
+
+
+def fetch_reddit_listings(subreddit_name: str, limit: int = 50, listings: Optional[Iterable[Listing]] = None):
+    """Fetch and merge several listings of one subreddit (see aiter_subreddit)."""
+    return list(iter_reddit_listings(subreddit_name, limit, listings))
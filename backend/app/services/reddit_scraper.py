@@ -1,65 +1,233 @@
+import itertools
 import os
-import praw
+import time
+import prawcore
+from typing import Optional
 from dotenv import load_dotenv
-from app.models.hook_model import Hook
-from app.core.database import SessionLocal
+from app.core.bulk_writer import bulk_insert_hooks
+from app.core.clients import lazy_client
 from app.core.config import settings  # Make sure you have a config.py file
+from app.core.scrape_engine import fan_out
+from app.core.metrics import scrape_run
+from app.core.raw_archive import archive_raw
+from app.core.scraper import ingest
+from app.core.streaming import stream_with_commits
+from app.core.rate_limit import acquire, get_bucket, parse_retry_after, record_throttle
+from app.services.watermarks import get_watermark, set_watermark, skip_known
 
 # Load benvironment variables
 load_dotenv()
 
-# Initialize Reddit client once
-reddit = praw.Reddit(
-    client_id=settings.REDDIT_CLIENT_ID,
-    client_secret=settings.REDDIT_CLIENT_SECRET,
-    user_agent=settings.REDDIT_USER_AGENT,
-)
-
-def fetch_reddit_posts(subreddit_name: str, limit: int = 50):
-    """Fetch hot posts from a given subreddit."""
-    subreddit = reddit.subreddit(subreddit_name)
-    posts = []
-
-    for submission in subreddit.hot(limit=limit):
-        if not submission.stickied:  # Skip pinned posts
-            posts.append({
-                "title": submission.title,
-                "score": submission.score,
-                "url": submission.url
-            })
-    return posts
+# prawcore already retries 5xx itself; retrying those here too would multiply
+# one call into many, so only throttling is handled at this level
+RETRYABLE_STATUS = {429}
+
+
+class RateLimitedRequestor(prawcore.Requestor):
+    """prawcore requestor that draws every HTTP call from the shared Reddit bucket."""
+
+    def __init__(self, *args, credential: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.credential = credential
+
+    def request(self, *args, **kwargs):
+        for attempt in range(settings.RATE_LIMIT_MAX_RETRIES + 1):
+            acquire("reddit", self.credential)
+            response = super().request(*args, **kwargs)
+
+            # Reddit reports the remaining budget on every response
+            remaining = response.headers.get("x-ratelimit-remaining")
+            reset = response.headers.get("x-ratelimit-reset")
+            if remaining is not None and reset is not None:
+                get_bucket("reddit", self.credential).drain(float(remaining), float(reset))
+
+            if response.status_code not in RETRYABLE_STATUS or attempt == settings.RATE_LIMIT_MAX_RETRIES:
+                return response
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            time.sleep(record_throttle("reddit", self.credential, attempt, retry_after))
+
+
+def build_reddit():
+    """A new praw.Reddit using the shared rate-limited requestor."""
+    if not (settings.REDDIT_CLIENT_ID and settings.REDDIT_CLIENT_SECRET and settings.REDDIT_USER_AGENT):
+        raise RuntimeError("Reddit credentials are not configured (REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT)")
+    import praw  # deferred: only paid by processes that actually scrape Reddit
+
+    return praw.Reddit(
+        client_id=settings.REDDIT_CLIENT_ID,
+        client_secret=settings.REDDIT_CLIENT_SECRET,
+        user_agent=settings.REDDIT_USER_AGENT,
+        requestor_class=RateLimitedRequestor,
+        requestor_kwargs={"credential": settings.REDDIT_CLIENT_ID},
+        **{
+            key: value
+            for key, value in (("oauth_url", settings.REDDIT_OAUTH_URL), ("reddit_url", settings.REDDIT_URL))
+            if value
+        },
+    )
+
+
+# praw.Reddit is not thread-safe: instances are pooled and checked out per
+# scrape, built on first use (or by the startup warmup)
+_reddit = lazy_client("reddit", build_reddit, pool_size=settings.REDDIT_SESSION_POOL_SIZE)
+
+
+def reddit_client():
+    """
+    A praw.Reddit for the calling thread's exclusive use.
+
+    Usage:
+        with reddit_client() as reddit:
+            reddit.subreddit("Business").hot(limit=10)
+    """
+    return _reddit.checkout()
+
+def _fullname_to_int(fullname: str) -> int:
+    """Reddit ids are increasing base36 numbers, so they order by age."""
+    return int(fullname.split("_", 1)[-1], 36)
+
+
+def raw_submission(submission) -> dict:
+    """The submission's listing data as returned by the API (praw internals dropped)."""
+    return {key: value for key, value in vars(submission).items() if not key.startswith("_")}
+
+
+def post_from_raw(raw: dict) -> dict:
+    """Post dict from a raw submission payload (live or from the raw archive)."""
+    return {
+        "title": raw["title"],
+        "score": raw["score"],
+        "url": raw["url"],
+        "fullname": raw["name"],
+    }
+
+
+def post_dict(submission, target: Optional[str] = None):
+    """Post dict from a praw submission, archiving its raw payload under ``target``."""
+    raw = raw_submission(submission)
+    if target:
+        archive_raw("reddit", target, "submission", raw)
+    return post_from_raw(raw)
+
+
+def walk_listing(name: str, submissions, since: Optional[str] = None):
+    """
+    Non-stickied submissions of one listing, minus what was already ingested.
+
+    With ``since`` the chronological ``new`` listing stops at the
+    watermark. Ranked listings (hot, top, rising) keep their order and skip
+    posts already stored, stopping after a page of known posts.
+    """
+    submissions = (s for s in submissions if not s.stickied)  # Skip pinned posts
+    if not since:
+        return submissions
+    if name == "new":
+        since_id = _fullname_to_int(since)
+        return itertools.takewhile(lambda s: _fullname_to_int(s.fullname) > since_id, submissions)
+    return skip_known("Reddit", submissions, lambda s: s.fullname)
+
+
+def iter_reddit_posts(subreddit_name: str, limit: int = 50, since: Optional[str] = None):
+    """
+    Yield posts from a given subreddit as the listing pages arrive.
+
+    This pulls every listing in REDDIT_LISTINGS concurrently and merges
+    them, or just the hot listing when only one is configured. With
+    ``since`` (the fullname of the newest submission already ingested) the
+    same listings are walked, but already-ingested posts are left out (see
+    walk_listing).
+    """
+    if len(settings.REDDIT_LISTINGS.split(",")) > 1:
+        # Full scrape: hot, new, top and rising at once, merged (app/services/reddit_async.py)
+        from app.services.reddit_async import iter_reddit_listings
+
+        yield from iter_reddit_listings(subreddit_name, limit, since=since)
+        return
+
+    with reddit_client() as reddit:
+        subreddit = reddit.subreddit(subreddit_name)
+        for submission in walk_listing("hot", subreddit.hot(limit=limit), since):
+            yield post_dict(submission, subreddit_name)
+
+
+def fetch_reddit_posts(subreddit_name: str, limit: int = 50, since: Optional[str] = None):
+    """Fetch posts from a given subreddit (see iter_reddit_posts)."""
+    return list(iter_reddit_posts(subreddit_name, limit, since=since))
+
+
+def hook_text(post):
+    return post["title"]
+
+
+def hook_meta(post):
+    return {"source_id": post["fullname"], "engagement": post["score"]}
 
 
 def save_hooks_to_db(posts, niche: str):
     """Save scraped posts as hooks in the database."""
-    db = SessionLocal()
-    try:
-        for p in posts:
-            hook = Hook(
-                text=p["title"],
-                tone="unknown",
-                niche=niche,
-                platform="Reddit"
-            )
-            db.add(hook)
-        db.commit()
-        print(f"✅ Saved {len(posts)} hooks from r/{niche} into DB.")
-    finally:
-        db.close()
-
-
-def scrape_and_store(subreddit_name: str, limit: int = 50):
-    """End-to-end: fetch from Reddit and save to DB."""
-    posts = fetch_reddit_posts(subreddit_name, limit)
+    rows = [
+        {"text": p["title"], "tone": "unknown", "niche": niche, "platform": "Reddit", **hook_meta(p)}
+        for p in posts
+    ]
+    stats = bulk_insert_hooks(rows)
+    print(f"✅ Saved {stats.rows} new hooks from r/{niche} into DB, {stats.skipped} duplicates skipped ({stats.rows_per_sec:.0f} rows/sec).")
+    return stats
+
+
+def scrape_and_store(subreddit_name: str, limit: int = 50, incremental: bool = True, on_progress=None):
+    """
+    End-to-end: fetch from Reddit and save to DB through the ingest pipeline.
+
+    ``on_progress(stage, count)`` is called with "fetched" and "saved".
+    """
+    since = get_watermark("reddit", subreddit_name) if incremental else None
+    with scrape_run("reddit", subreddit_name) as run:
+        posts, report = ingest(
+            f"reddit:r/{subreddit_name}",
+            iter_reddit_posts(subreddit_name, limit, since=since),
+            hook_text,
+            platform="Reddit",
+            niche=subreddit_name,
+            on_progress=on_progress,
+            run=run,
+            to_meta=hook_meta,
+        )
+        with run.span("log"):
+            if posts:
+                report.print_summary()
+            else:
+                print(f"⚠️ No posts found for r/{subreddit_name}")
     if posts:
-        save_hooks_to_db(posts, niche=subreddit_name)
-        return posts
-    else:
-        return[f"⚠️ No posts found for r/{subreddit_name}"]
+        newest = max((p["fullname"] for p in posts), key=_fullname_to_int)
+        if not since or _fullname_to_int(newest) > _fullname_to_int(since):
+            set_watermark("reddit", subreddit_name, newest)
+    return posts
+
+
+def scrape_stream(subreddit_name: str, limit: int = 50, incremental: bool = True):
+    """
+    Streaming variant of scrape_and_store: yields events as posts arrive and
+    commits them in micro-batches. The watermark only advances once the
+    stream completes, so an aborted stream is simply re-fetched next time.
+    """
+    since = get_watermark("reddit", subreddit_name) if incremental else None
+    newest = None
+
+    def _tracked():
+        nonlocal newest
+        for post in iter_reddit_posts(subreddit_name, limit, since=since):
+            if newest is None or _fullname_to_int(post["fullname"]) > _fullname_to_int(newest):
+                newest = post["fullname"]
+            yield post
+
+    with scrape_run("reddit", subreddit_name, mode="stream") as run:
+        yield from stream_with_commits(_tracked(), lambda batch: save_hooks_to_db(batch, niche=subreddit_name), run=run)
+    if newest and (not since or _fullname_to_int(newest) > _fullname_to_int(since)):
+        set_watermark("reddit", subreddit_name, newest)
 
 
 def scrape_reddit_all():
-    """Scrape multiple subreddits and save results."""
+    """Scrape multiple subreddits concurrently and save results."""
     subreddits = [
         "Business",
         "ContentCreators",
@@ -70,9 +238,10 @@ def scrape_reddit_all():
     ]
     limit = 50  # number of posts per subreddit
 
-    for sub in subreddits:
-        print(f"🔍 Scraping r/{sub} ...")
-        scrape_and_store(sub, limit)
+    print(f"🔍 Scraping {len(subreddits)} subreddits ...")
+    report = fan_out("reddit", subreddits, lambda sub: scrape_and_store(sub, limit))
+    report.print_summary()
+    return report
 
 
 if __name__ == "__main__":
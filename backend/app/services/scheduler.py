@@ -0,0 +1,231 @@
+"""
+In-process executor for users' scheduled scrapes.
+
+``POST /api/settings/scheduled-scraping`` stores each user's schedule and
+its next run time. A background thread wakes every SCHEDULER_POLL_SECONDS,
+claims the users that are due and turns their schedules into scrape jobs.
+
+A schedule names its targets per platform (``targets``: subreddits,
+YouTube channel ids or keywords, Instagram usernames). Its niches are
+search keywords, so they are only scraped on platforms that search by
+keyword (YouTube); a niche is never used as a subreddit or an Instagram
+username. ``time_of_day`` is UTC.
+
+Targets are coalesced across users: if 40 users schedule r/Business for
+09:00, it is fetched once (at the largest requested limit) and the result
+is fanned out to each user's ScrapeHistory, so API cost grows with the
+number of distinct targets rather than with users.
+
+Each user's run time is offset by a stable per-user jitter (up to
+SCHEDULER_JITTER_SECONDS) so everyone who picked 09:00 doesn't fire in the
+same second.
+
+Databases created before scheduling existed get the new users columns at
+startup (ensure_schedule_columns), the same way the hooks table gets its
+engagement columns.
+"""
+
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, ensure_columns
+from app.services.scrape_jobs import enqueue_scrape
+from app.Settings.models import User
+
+# Platforms whose scrape accepts a search keyword, so a niche is a valid target
+KEYWORD_PLATFORMS = {"youtube"}
+
+PERIODS = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(days=7),
+    "monthly": timedelta(days=30),
+}
+
+# Columns added to users for scheduled scrapes, with their DDL types
+SCHEDULE_COLUMNS = {
+    "scheduled_scrape_settings": "JSON",
+    "scheduled_report_settings": "JSON",
+    "last_scheduled_scrape_at": "TIMESTAMP",
+    "next_scheduled_scrape_at": "TIMESTAMP",
+}
+
+_thread: Optional[threading.Thread] = None
+_stop = threading.Event()
+_last_tick: Dict = {}
+
+
+def ensure_schedule_columns(bind=None):
+    """Add the scheduling columns and due-time index if the users table predates them."""
+    ensure_columns(User.__table__, SCHEDULE_COLUMNS, ("ix_users_next_scheduled_scrape_at",), bind or engine)
+
+
+def _jitter(user_id: str) -> timedelta:
+    """Stable per-user offset, so the reported next run is the real one."""
+    if settings.SCHEDULER_JITTER_SECONDS <= 0:
+        return timedelta(0)
+    digest = int(hashlib.sha256(user_id.encode()).hexdigest(), 16)
+    return timedelta(seconds=digest % settings.SCHEDULER_JITTER_SECONDS)
+
+
+def compute_next_run(
+    schedule: Optional[Dict],
+    user_id: str,
+    now: Optional[datetime] = None,
+    last_run: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """
+    Next UTC run time for a schedule, or None if it is disabled.
+
+    Args:
+        schedule: ScheduledScrapeSettings as stored on the user
+        user_id: Seeds the jitter
+        now: Reference time (defaults to utcnow)
+        last_run: Previous run; the next one is a full period later
+
+    Returns:
+        The first ``time_of_day`` (+ jitter) slot after ``now`` and at least
+        one period after ``last_run``
+    """
+    if not schedule or not schedule.get("enabled"):
+        return None
+    now = now or datetime.utcnow()
+    hour, minute = (int(part) for part in schedule["time_of_day"].split(":"))
+    period = PERIODS.get(schedule.get("frequency"), PERIODS["daily"])
+    jitter = _jitter(user_id)
+
+    base = last_run + period if last_run else now
+    candidate = base.replace(hour=hour, minute=minute, second=0, microsecond=0) + jitter
+    while candidate <= now:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def schedule_targets(schedule: Dict) -> List[Tuple[str, str]]:
+    """
+    (platform, target) pairs a schedule asks for.
+
+    Each enabled platform gets its explicit ``targets``, plus the niches on
+    platforms in KEYWORD_PLATFORMS.
+    """
+    platforms = [p.strip().lower() for p in schedule.get("platforms", []) if p.strip()]
+    niches = [n.strip() for n in schedule.get("niches", []) if n.strip()]
+    explicit = {platform.strip().lower(): targets for platform, targets in (schedule.get("targets") or {}).items()}
+    pairs = []
+    for platform in platforms:
+        targets = [t.strip() for t in explicit.get(platform, []) if t.strip()]
+        if platform in KEYWORD_PLATFORMS:
+            targets += niches
+        seen = set()
+        for target in targets:
+            if target.lower() not in seen:
+                seen.add(target.lower())
+                pairs.append((platform, target))
+    return pairs
+
+
+def coalesce(schedules: Iterable[Tuple[str, Dict]]) -> Dict[Tuple[str, str], Dict]:
+    """
+    Merge many users' schedules into one entry per distinct target.
+
+    Returns:
+        {(platform, target): {"limit": max requested, "user_ids": [...]}}
+    """
+    plan: Dict[Tuple[str, str], Dict] = {}
+    for user_id, schedule in schedules:
+        limit = int(schedule.get("max_hooks_per_scrape") or 50)
+        for platform, target in schedule_targets(schedule):
+            entry = plan.setdefault((platform, target.lower()), {"target": target, "limit": 0, "user_ids": []})
+            entry["limit"] = max(entry["limit"], limit)
+            if user_id not in entry["user_ids"]:
+                entry["user_ids"].append(user_id)
+    return plan
+
+
+def run_due(now: Optional[datetime] = None) -> Dict:
+    """
+    Claim every due user, then enqueue one job per distinct target.
+
+    A user is claimed by moving their next run forward with a conditional
+    UPDATE, so several app workers polling the same DB never double-run it.
+    """
+    now = now or datetime.utcnow()
+    claimed: List[Tuple[str, Dict]] = []
+    db = SessionLocal()
+    try:
+        due = db.query(User).filter(User.next_scheduled_scrape_at <= now).all()
+        for user in due:
+            schedule = user.scheduled_scrape_settings or {}
+            updated = (
+                db.query(User)
+                .filter(User.id == user.id, User.next_scheduled_scrape_at == user.next_scheduled_scrape_at)
+                .update(
+                    {
+                        User.last_scheduled_scrape_at: now,
+                        User.next_scheduled_scrape_at: compute_next_run(schedule, user.id, now, last_run=now),
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if updated and schedule.get("enabled"):
+                claimed.append((user.id, schedule))
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"⚠️ Scheduler could not load due schedules: {e}")
+        return {"users": 0, "targets": 0, "jobs": []}
+    finally:
+        db.close()
+
+    plan = coalesce(claimed)
+    jobs = []
+    for (platform, _), entry in plan.items():
+        try:
+            job = enqueue_scrape(
+                platform, entry["target"], entry["limit"],
+                user_ids=entry["user_ids"], scheduled=True, coalesce=True,
+            )
+            jobs.append(job.id)
+        except ValueError as e:
+            print(f"⚠️ Skipping scheduled target {platform}/{entry['target']}: {e}")
+
+    requested = sum(len(schedule_targets(s)) for _, s in claimed)
+    if claimed:
+        print(f"⏰ Scheduled run: {len(claimed)} users, {requested} requested targets → {len(plan)} fetches")
+    return {"users": len(claimed), "requested_targets": requested, "targets": len(plan), "jobs": jobs}
+
+
+def _loop():
+    while not _stop.wait(settings.SCHEDULER_POLL_SECONDS):
+        try:
+            _last_tick.update(run_due(), at=datetime.utcnow().isoformat())
+        except Exception as e:
+            print(f"❌ Scheduler tick failed: {e}")
+
+
+def start_scheduler():
+    """Start the polling thread once per process."""
+    global _thread
+    if not settings.SCHEDULER_ENABLED or (_thread and _thread.is_alive()):
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_loop, name="scrape-scheduler", daemon=True)
+    _thread.start()
+    print(f"⏰ Scrape scheduler started (every {settings.SCHEDULER_POLL_SECONDS:.0f}s)")
+
+
+def stop_scheduler():
+    _stop.set()
+
+
+def get_scheduler_status() -> Dict:
+    """Whether the loop is running and what its last tick did."""
+    return {
+        "running": bool(_thread and _thread.is_alive()),
+        "poll_seconds": settings.SCHEDULER_POLL_SECONDS,
+        "last_tick": dict(_last_tick) or None,
+    }
@@ -0,0 +1,142 @@
+"""
+Cross-user cache of scrape results.
+
+Popular targets get scraped by many users within minutes. Results are
+cached per platform, keyed by (target, limit, watermark); a hit skips the
+network and the DB write entirely (the hooks are already stored) and just
+hands the cached posts to the caller. TTLs are set per platform.
+
+Misses still scrape incrementally. The watermark read before the fetch is
+part of the key, so the cached posts are exactly what an incremental scrape
+from that watermark served. Once the fetch has moved the watermark on,
+"nothing newer" is the right answer for the new watermark until the TTL
+runs out, so an empty result is cached under it too: callers right behind
+the first one neither re-fetch nor re-download the window.
+
+Misses are single-flight: while one job fetches a key, other jobs asking
+for the same key wait for that fetch and share its result instead of
+starting their own.
+"""
+
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.cache import MISSING, TTLCache
+from app.core.config import settings
+from app.services.watermarks import get_watermark
+
+PLATFORM_TTLS: Dict[str, float] = {
+    "reddit": settings.SCRAPE_CACHE_TTL_REDDIT,
+    "youtube": settings.SCRAPE_CACHE_TTL_YOUTUBE,
+    "instagram": settings.SCRAPE_CACHE_TTL_INSTAGRAM,
+}
+
+_caches: Dict[str, TTLCache] = {
+    platform: TTLCache(settings.SCRAPE_CACHE_MAX_ENTRIES, ttl)
+    for platform, ttl in PLATFORM_TTLS.items()
+}
+
+
+class _Flight:
+    """One in-progress fetch that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.posts: Optional[List[Dict]] = None
+        self.error: Optional[BaseException] = None
+
+
+CacheKey = Tuple[str, int, Optional[str]]
+
+_inflight: Dict[Tuple[str, CacheKey], _Flight] = {}
+_inflight_lock = threading.Lock()
+
+
+def _key(platform: str, target: str, limit: int) -> CacheKey:
+    return target.strip().lower(), limit, get_watermark(platform, target)
+
+
+def _report_shared(on_progress, posts: List[Dict]):
+    if on_progress:
+        on_progress("fetched", len(posts))
+        on_progress("saved", 0)
+
+
+def cached_scrape(
+    platform: str,
+    target: str,
+    limit: int,
+    scrape_fn: Callable,
+    on_progress: Optional[Callable[[str, int], None]] = None,
+) -> Tuple[List[Dict], bool]:
+    """
+    Run ``scrape_fn(target, limit, on_progress=...)`` unless a fresh result is cached.
+
+    The scrape stays incremental: the cache key includes the target's
+    watermark, so a hit is only served to callers scraping from the same
+    watermark the cached fetch started at.
+
+    Returns:
+        The posts and whether they came from the cache (or another caller's fetch)
+    """
+    cache = _caches.get(platform)
+    if cache is None or cache.ttl <= 0:
+        return scrape_fn(target, limit, on_progress=on_progress), False
+
+    key = _key(platform, target, limit)
+    posts = cache.get(key)
+    if posts is not MISSING:
+        print(f"♻️ Cache hit for {platform}/{target} (limit {limit}), skipping fetch")
+        _report_shared(on_progress, posts)
+        return posts, True
+
+    with _inflight_lock:
+        flight = _inflight.get((platform, key))
+        leader = flight is None
+        if leader:
+            flight = _inflight[(platform, key)] = _Flight()
+
+    if not leader:
+        print(f"⏳ Waiting for the in-flight {platform}/{target} fetch (limit {limit})")
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        _report_shared(on_progress, flight.posts)
+        return flight.posts, True
+
+    try:
+        posts = scrape_fn(target, limit, on_progress=on_progress) or []
+        cache.set(key, posts)
+        after = _key(platform, target, limit)
+        if after != key:
+            # Nothing is newer than the watermark this fetch just stored
+            cache.set(after, [])
+        flight.posts = posts
+        return posts, False
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[(platform, key)]
+        flight.done.set()
+
+
+def invalidate(platform: str, target: str, limit: int) -> bool:
+    cache = _caches.get(platform)
+    return cache.invalidate(_key(platform, target, limit)) if cache else False
+
+
+def clear_scrape_cache():
+    for cache in _caches.values():
+        cache.clear()
+
+
+def get_scrape_cache_stats() -> Dict:
+    """Per-platform entries, TTL, hit/miss counters and fetches in flight."""
+    with _inflight_lock:
+        inflight = [platform for platform, _ in _inflight]
+    return {
+        platform: dict(cache.to_dict(), in_flight=inflight.count(platform))
+        for platform, cache in _caches.items()
+    }
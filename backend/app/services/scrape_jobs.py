@@ -0,0 +1,255 @@
+"""
+Background scrape job queue.
+
+Scrape routes enqueue a job and return its ID immediately; a bounded worker
+pool runs the fetch + DB write. Jobs started by a signed-in user are
+recorded in ScrapeHistory (the job ID doubles as the history row ID), and
+their status can be polled while they run.
+
+A job can serve several users: with ``coalesce=True`` a request for a
+target that is already queued joins that job instead of fetching it again,
+and every user gets their own ScrapeHistory row when it finishes.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.scrape_cache import cached_scrape
+from app.Settings.models import ScrapeHistory
+
+MAX_TRACKED_JOBS = 1000
+
+_executor = ThreadPoolExecutor(max_workers=settings.SCRAPE_JOB_WORKERS, thread_name_prefix="scrape-job")
+_jobs: "OrderedDict[str, ScrapeJob]" = OrderedDict()
+_queued_by_target: Dict[Tuple[str, str], "ScrapeJob"] = {}
+_lock = threading.Lock()
+
+
+def _scrape_fn(platform: str) -> Callable:
+    """Resolve a platform's scrape_and_store lazily so clients are built on first use."""
+    if platform == "reddit":
+        from app.services.reddit_scraper import scrape_and_store
+    elif platform == "youtube":
+        from app.services.youtube_scraper import scrape_and_store
+    elif platform == "instagram":
+        from app.services.instagram_scaper import scrape_and_store
+    else:
+        raise ValueError(f"Unknown platform: {platform}")
+    return scrape_and_store
+
+
+class ScrapeJob:
+    """State of one queued scrape."""
+
+    def __init__(self, platform: str, target: str, limit: int, user_id: Optional[str] = None,
+                 scheduled: bool = False):
+        self.id = str(uuid.uuid4())
+        self.platform = platform
+        self.target = target
+        self.limit = limit
+        self.scheduled = scheduled
+        # user_id -> ScrapeHistory row id; the first user's row reuses the job id
+        self.history_ids: Dict[str, str] = {}
+        if user_id:
+            self.history_ids[user_id] = self.id
+        self.status = "queued"  # queued -> running -> success / failed
+        self.stage = "queued"   # queued -> fetching -> saving -> done
+        self.fetched = 0
+        self.saved = 0
+        self.cached = False
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return next(iter(self.history_ids), None)
+
+    def add_user(self, user_id: str):
+        """Fan this job's result out to another user's history."""
+        if user_id not in self.history_ids:
+            self.history_ids[user_id] = self.id if not self.history_ids else str(uuid.uuid4())
+
+    @property
+    def progress(self) -> int:
+        """Rough completion percentage based on the current stage."""
+        return {"queued": 0, "fetching": 25, "saving": 75, "done": 100}.get(self.stage, 0)
+
+    def on_progress(self, stage: str, count: int):
+        """Callback handed to scrape_and_store."""
+        if stage == "fetched":
+            self.fetched = count
+            self.stage = "saving"
+        elif stage == "saved":
+            self.saved = count
+
+    def to_dict(self) -> Dict:
+        """Convert job to dictionary."""
+        return {
+            "job_id": self.id,
+            "platform": self.platform,
+            "target": self.target,
+            "limit": self.limit,
+            "scheduled": self.scheduled,
+            "users": len(self.history_ids),
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "fetched": self.fetched,
+            "saved": self.saved,
+            "cached": self.cached,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+def _write_history(job: ScrapeJob):
+    """Create or update the ScrapeHistory row of every user attached to a job."""
+    if not job.history_ids:
+        return
+    db = SessionLocal()
+    try:
+        for user_id, row_id in list(job.history_ids.items()):
+            row = db.query(ScrapeHistory).filter(ScrapeHistory.id == row_id).first()
+            if not row:
+                filters = {"target": job.target, "limit": job.limit}
+                if job.scheduled:
+                    filters["scheduled"] = True
+                row = ScrapeHistory(
+                    id=row_id,
+                    user_id=user_id,
+                    platform=job.platform,
+                    filters_used=filters,
+                    created_at=job.created_at,
+                )
+                db.add(row)
+            row.status = job.status
+            row.hooks_fetched = job.fetched
+            row.error_message = job.error
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️ Could not record scrape history for job {job.id}: {e}")
+    finally:
+        db.close()
+
+
+def _run(job: ScrapeJob):
+    with _lock:
+        if _queued_by_target.get((job.platform, job.target)) is job:
+            del _queued_by_target[(job.platform, job.target)]
+        job.status = "running"
+        job.stage = "fetching"
+    job.started_at = datetime.utcnow()
+    _write_history(job)
+    try:
+        _, job.cached = cached_scrape(
+            job.platform, job.target, job.limit, _scrape_fn(job.platform), on_progress=job.on_progress
+        )
+        job.status = "success"
+    except Exception as e:
+        job.status = "failed"
+        job.error = str(e)
+        print(f"❌ Scrape job {job.id} ({job.platform}/{job.target}) failed: {e}")
+    finally:
+        job.stage = "done"
+        job.finished_at = datetime.utcnow()
+        _write_history(job)
+
+
+def enqueue_scrape(
+    platform: str,
+    target: str,
+    limit: int,
+    user_id: Optional[str] = None,
+    user_ids: Optional[List[str]] = None,
+    scheduled: bool = False,
+    coalesce: bool = False,
+) -> ScrapeJob:
+    """
+    Queue a scrape and return its job immediately.
+
+    Args:
+        platform: "reddit", "youtube" or "instagram"
+        target: Subreddit, channel ID / keyword or username
+        limit: Posts to fetch
+        user_id: User to record the scrape for
+        user_ids: Several users to record it for (one fetch, one history row each)
+        scheduled: Mark the history rows as scheduled runs
+        coalesce: Join an already-queued job for the same target instead of
+            fetching it again (its limit is raised if needed)
+    """
+    _scrape_fn(platform)  # fail fast on unknown platforms
+    users = list(user_ids or []) + ([user_id] if user_id else [])
+    key = (platform, target)
+
+    with _lock:
+        job = _queued_by_target.get(key) if coalesce else None
+        if job is not None and job.status == "queued":
+            job.limit = max(job.limit, limit)
+            for uid in users:
+                job.add_user(uid)
+            print(f"🔗 Coalesced {len(users)} user(s) into queued {platform} job for {target}")
+            return job
+
+        job = ScrapeJob(platform, target, limit, scheduled=scheduled)
+        for uid in users:
+            job.add_user(uid)
+        _jobs[job.id] = job
+        while len(_jobs) > MAX_TRACKED_JOBS:
+            _jobs.popitem(last=False)
+        if coalesce:
+            _queued_by_target[key] = job
+    _write_history(job)
+    _executor.submit(_run, job)
+    return job
+
+
+def get_job(job_id: str) -> Optional[ScrapeJob]:
+    """Look up a job tracked by this process."""
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def get_job_status(job_id: str) -> Optional[Dict]:
+    """
+    Status for a job ID, falling back to ScrapeHistory for jobs this process
+    no longer tracks (e.g. after a restart or on another worker).
+    """
+    job = get_job(job_id)
+    if job:
+        return job.to_dict()
+
+    db = SessionLocal()
+    try:
+        try:
+            row = db.query(ScrapeHistory).filter(ScrapeHistory.id == job_id).first()
+        except SQLAlchemyError:
+            return None
+        if not row:
+            return None
+        filters = row.filters_used or {}
+        return {
+            "job_id": row.id,
+            "platform": row.platform,
+            "target": filters.get("target"),
+            "limit": filters.get("limit"),
+            "status": row.status,
+            "stage": "done" if row.status in ("success", "failed") else row.status,
+            "fetched": row.hooks_fetched,
+            "error": row.error_message,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+        }
+    finally:
+        db.close()
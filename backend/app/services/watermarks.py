@@ -0,0 +1,113 @@
+"""
+Persisted per-source watermarks for incremental scraping.
+
+A watermark is the newest item already ingested for a (platform, target)
+pair: the submission fullname for Reddit, the ``publishedAt`` timestamp for
+YouTube and the post shortcode for Instagram. Chronological sources (new,
+uploads, timelines) stop iterating as soon as they reach it.
+
+Ranked sources (hot, most viewed) aren't ordered by age, so the watermark
+can't bound them. They keep their ranking and skip_known drops posts that
+are already stored instead, stopping once a whole page is known.
+"""
+
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+
+from app.core.database import SessionLocal
+from app.models.hook_model import Hook
+from app.models.watermark_model import ScrapeWatermark
+
+T = TypeVar("T")
+KNOWN_PAGE_SIZE = 25  # items checked against the hooks table per query
+
+
+def _key(platform: str, target: str):
+    return platform.lower(), target.strip().lower()
+
+
+def get_watermark(platform: str, target: str) -> Optional[str]:
+    """Return the stored cursor for a target, or None on first scrape."""
+    platform, target = _key(platform, target)
+    db = SessionLocal()
+    try:
+        row = db.query(ScrapeWatermark).filter_by(platform=platform, target=target).first()
+        return row.cursor if row else None
+    finally:
+        db.close()
+
+
+def set_watermark(platform: str, target: str, cursor: str):
+    """Store the newest cursor seen for a target (an upsert, safe against concurrent scrapes)."""
+    platform, target = _key(platform, target)
+    db = SessionLocal()
+    try:
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(ScrapeWatermark).values(platform=platform, target=target, cursor=cursor)
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=["platform", "target"],
+                set_={"cursor": stmt.excluded.cursor, "updated_at": datetime.utcnow()},
+            ))
+            db.commit()
+            return
+        try:
+            db.add(ScrapeWatermark(platform=platform, target=target, cursor=cursor))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            db.query(ScrapeWatermark).filter_by(platform=platform, target=target).update({"cursor": cursor})
+            db.commit()
+    finally:
+        db.close()
+
+
+def skip_known(hook_platform: str, items: Iterable[T], source_id: Callable[[T], str],
+               page_size: int = KNOWN_PAGE_SIZE) -> Iterator[T]:
+    """
+    Yield the items of a ranked listing whose source id isn't stored yet.
+
+    Items are checked against the hooks table a page at a time, and
+    iteration stops after a page that was entirely known: the listing has
+    reached content the previous scrapes already covered.
+
+    Args:
+        hook_platform: Platform as stored on hooks ("Reddit", "YouTube", ...)
+        items: The listing, in its own ranking order
+        source_id: Returns the id stored in hooks.source_id for an item
+        page_size: Items per lookup
+    """
+    iterator = iter(items)
+    while True:
+        page = [item for _, item in zip(range(page_size), iterator)]
+        if not page:
+            return
+        ids = {source_id(item) for item in page}
+        db = SessionLocal()
+        try:
+            known = {
+                row[0]
+                for row in db.query(Hook.source_id).filter(Hook.platform == hook_platform, Hook.source_id.in_(ids))
+            }
+        finally:
+            db.close()
+        fresh = [item for item in page if source_id(item) not in known]
+        yield from fresh
+        if not fresh or len(page) < page_size:
+            return
+
+
+def clear_watermark(platform: str, target: str):
+    """Forget a target's watermark so the next scrape fetches the full window."""
+    platform, target = _key(platform, target)
+    db = SessionLocal()
+    try:
+        db.query(ScrapeWatermark).filter_by(platform=platform, target=target).delete()
+        db.commit()
+    finally:
+        db.close()
@@ -1,10 +1,27 @@
+import json
 import os
-from googleapiclient.discovery import build
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Dict, List, Optional
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
 from dotenv import load_dotenv
-from sqlalchemy.orm import Session
-from app.models.hook_model import Hook
-from app.core.database import SessionLocal, Base, engine  # add engine and Base
 from app.core.config import settings  # load envs from config
+from app.core.scrape_engine import fan_out
+from app.core.metrics import scrape_run
+from app.core.raw_archive import archive_raw
+from app.core.scraper import ingest
+from app.core.streaming import stream_with_commits
+from app.core.bulk_writer import bulk_insert_hooks
+from app.services.watermarks import get_watermark, set_watermark, skip_known
+from app.core.rate_limit import acquire, get_bucket, parse_retry_after, record_throttle
+from app.core.clients import lazy_client
 
 load_dotenv()
 
@@ -12,60 +29,392 @@ API_KEY = os.getenv("YOUTUBE_API_KEY")
 YOUTUBE_API_SERVICE_NAME = "youtube"
 YOUTUBE_API_VERSION = "v3"
 
+# Quota units per call; anything not listed costs 1 unit
+QUOTA_COSTS = {"youtube.search.list": 100}
+QUOTA_EXCEEDED_PAUSE = 3600  # seconds
+
+MAX_BATCH_IDS = 50  # videos.list / playlistItems.list page size limit
+ETAG_CACHE_SIZE = 2048
+CHANNEL_ID_RE = re.compile(r"^UC[0-9A-Za-z_-]{22}$")
+
+# request URI -> (etag, parsed response), least recently used first
+_etag_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_etag_lock = threading.Lock()
+# channel id -> uploads playlist id (never changes)
+_uploads_playlists = {}
+
+
+def _etag_lookup(uri: str):
+    with _etag_lock:
+        entry = _etag_cache.get(uri)
+        if entry:
+            _etag_cache.move_to_end(uri)
+        return entry
+
+
+def _etag_store(uri: str, response):
+    if not isinstance(response, dict) or not response.get("etag"):
+        return
+    with _etag_lock:
+        _etag_cache[uri] = (response["etag"], response)
+        _etag_cache.move_to_end(uri)
+        while len(_etag_cache) > ETAG_CACHE_SIZE:
+            _etag_cache.popitem(last=False)
+
+
+class RateLimitedHttpRequest(HttpRequest):
+    """
+    HttpRequest that charges quota units to the shared YouTube bucket before
+    executing, and revalidates repeated GETs with If-None-Match.
+    """
+
+    def execute(self, http=None, num_retries=0):
+        cached = _etag_lookup(self.uri) if self.method == "GET" else None
+        if cached:
+            self.headers["If-None-Match"] = cached[0]
+
+        for attempt in range(settings.RATE_LIMIT_MAX_RETRIES + 1):
+            acquire("youtube", API_KEY, QUOTA_COSTS.get(self.methodId, 1))
+            try:
+                response = super().execute(http=http, num_retries=num_retries)
+                _etag_store(self.uri, response)
+                return response
+            except HttpError as e:
+                status = e.resp.status
+                if status == 304 and cached:
+                    return cached[1]
+                content = e.content.decode("utf-8", "ignore") if isinstance(e.content, bytes) else str(e.content)
+                if status == 403 and "quotaExceeded" in content:
+                    # Daily quota is gone: stop everyone from burning calls on it
+                    get_bucket("youtube", API_KEY).drain(0, QUOTA_EXCEEDED_PAUSE)
+                    raise
+                retryable = status in (429, 500, 503) or (status == 403 and "rateLimitExceeded" in content)
+                if not retryable or attempt == settings.RATE_LIMIT_MAX_RETRIES:
+                    raise
+                retry_after = parse_retry_after(e.resp.get("retry-after"))
+                time.sleep(record_throttle("youtube", API_KEY, attempt, retry_after))
+
+
 # --------------------------
-# Create tables if they don't exist
+# Client factory
 # --------------------------
+# build() re-reads and re-parses the ~400 KB discovery document and opens a
+# fresh httplib2 connection on every call. Instead the document is parsed
+# once, and built clients are pooled: a worker checks one out, uses it
+# exclusively (httplib2.Http is not thread-safe), and hands it back with
+# its keep-alive connection still open for the next scrape.
+_stats_lock = threading.Lock()
+_client_pool: "LifoQueue" = LifoQueue()
+_client_stats = {"builds": 0, "reuses": 0, "build_seconds": 0.0, "discarded": 0}
+# Cost of one cold build() (read + parse + construct), timed when the
+# discovery document is loaded and used to report savings
+_cold_build_seconds: Optional[float] = None
+
+
+def _warm_resources(resource):
+    """
+    Instantiate every nested resource once.
+
+    googleapiclient fixes up each method's ``parameters`` dict in the shared
+    discovery document the first time a resource is created. Doing that for
+    all resources before the document is shared means later calls from
+    worker threads only ever reassign existing keys.
+    """
+    for name in resource._resourceDesc.get("resources", {}):
+        _warm_resources(getattr(resource, name)())
+
+
+def _load_discovery_document() -> Dict:
+    global _cold_build_seconds
+    started = time.perf_counter()
+    document = json.loads(get_static_doc(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION))
+    service = build_from_document(document, http=build_http())
+    _cold_build_seconds = time.perf_counter() - started
+    _warm_resources(service)
+    return document
+
+
+# Parsed discovery document, loaded on first use (or by the startup warmup)
+_discovery = lazy_client("youtube", _load_discovery_document)
+
+
 def get_youtube_service():
-    return build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=API_KEY)
+    """
+    Build a new YouTube client from the cached discovery document.
+
+    Prefer ``youtube_client()``, which reuses pooled clients.
+    """
+    document = _discovery.get()
+    started = time.perf_counter()
+    service = build_from_document(
+        document,
+        developerKey=API_KEY,
+        http=build_http(),
+        requestBuilder=RateLimitedHttpRequest,
+        client_options={"api_endpoint": settings.YOUTUBE_API_ENDPOINT} if settings.YOUTUBE_API_ENDPOINT else None,
+    )
+    with _stats_lock:
+        _client_stats["builds"] += 1
+        _client_stats["build_seconds"] += time.perf_counter() - started
+    return service
+
+
+@contextmanager
+def youtube_client():
+    """
+    Check a YouTube client out of the pool, building one if none is idle.
+
+    Usage:
+        with youtube_client() as youtube:
+            youtube.search().list(...).execute()
+    """
+    try:
+        service = _client_pool.get_nowait()
+        with _stats_lock:
+            _client_stats["reuses"] += 1
+    except Empty:
+        service = get_youtube_service()
+    try:
+        yield service
+    finally:
+        if _client_pool.qsize() < settings.YOUTUBE_CLIENT_POOL_SIZE:
+            _client_pool.put(service)
+        else:
+            service.close()
+            with _stats_lock:
+                _client_stats["discarded"] += 1
+
+
+def get_youtube_client_stats() -> Dict:
+    """Client pool counters and the build time saved by reusing clients."""
+    with _stats_lock:
+        stats = dict(_client_stats)
+    builds = stats["builds"]
+    load_seconds = _discovery.build_seconds or 0.0
+    saved = None
+    if _cold_build_seconds is not None:
+        saved = round((builds + stats["reuses"]) * _cold_build_seconds - stats["build_seconds"] - load_seconds, 3)
+    return {
+        "builds": builds,
+        "reuses": stats["reuses"],
+        "discarded": stats["discarded"],
+        "idle": _client_pool.qsize(),
+        "pool_size": settings.YOUTUBE_CLIENT_POOL_SIZE,
+        "build_seconds": round(stats["build_seconds"], 4),
+        "avg_build_seconds": round(stats["build_seconds"] / builds, 5) if builds else 0.0,
+        "discovery_load_seconds": round(load_seconds, 4),
+        "cold_build_seconds": round(_cold_build_seconds, 5) if _cold_build_seconds is not None else None,
+        "estimated_seconds_saved": saved,
+    }
+
+def iter_youtube_videos(keyword: str, max_results: int = 20, since: Optional[str] = None):
+    """
+    Search videos for a keyword, most viewed first.
+
+    With ``since`` (a previous scrape happened) the ranking stays the
+    same, but videos already stored are left out.
+    """
+    with youtube_client() as youtube:
+        videos = _search_videos(youtube, keyword, max_results)
+        if since:
+            videos = skip_known("YouTube", videos, lambda item: item["id"]["videoId"], page_size=MAX_BATCH_IDS)
+        for item in videos:
+            archive_raw("youtube", keyword, "search_result", item)
+            yield video_from_raw(item)
 
-def fetch_youtube_videos(keyword: str, max_results: int = 20):
-    youtube = get_youtube_service()
-    request = youtube.search().list(
+
+def _search_videos(youtube, keyword: str, max_results: int):
+    """Raw search results for a keyword, most viewed first."""
+    response = youtube.search().list(
         q=keyword,
         part="snippet",
         type="video",
         maxResults=max_results,
         order="viewCount"
-    )
-    response = request.execute()
+    ).execute()
+    return response.get("items", [])
+
+
+def video_from_raw(item: Dict) -> Dict:
+    """Video dict from a raw search result or video resource (live or from the raw archive)."""
+    video = {
+        "title": item["snippet"]["title"],
+        "channel": item["snippet"]["channelTitle"],
+        "publish_date": item["snippet"]["publishedAt"],
+        "video_id": item["id"]["videoId"] if isinstance(item["id"], dict) else item["id"],
+    }
+    if "statistics" in item:
+        video["views"] = int(item["statistics"].get("viewCount", 0))
+    return video
 
+def fetch_youtube_videos(keyword: str, max_results: int = 20, since: Optional[str] = None):
+    """Search videos for a keyword (see iter_youtube_videos)."""
+    return list(iter_youtube_videos(keyword, max_results, since=since))
+
+def _uploads_playlist_id(youtube, channel_id: str) -> Optional[str]:
+    """Resolve a channel to its uploads playlist (1 quota unit, cached forever)."""
+    if channel_id not in _uploads_playlists:
+        response = youtube.channels().list(part="contentDetails", id=channel_id).execute()
+        items = response.get("items", [])
+        if not items:
+            return None
+        _uploads_playlists[channel_id] = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    return _uploads_playlists[channel_id]
+
+
+def _fetch_video_details(youtube, video_ids: List[str], target: Optional[str] = None):
+    """Enrich video IDs with snippet + statistics, 50 IDs per videos.list call."""
     videos = []
-    for item in response.get("items", []):
-        videos.append({
-            "title": item["snippet"]["title"],
-            "channel": item["snippet"]["channelTitle"],
-            "publish_date": item["snippet"]["publishedAt"]
-        })
+    for start in range(0, len(video_ids), MAX_BATCH_IDS):
+        batch = video_ids[start:start + MAX_BATCH_IDS]
+        response = youtube.videos().list(
+            part="snippet,statistics",
+            id=",".join(batch),  # maxResults is not allowed with id
+        ).execute()
+        for item in response.get("items", []):
+            if target:
+                archive_raw("youtube", target, "video", item)
+            videos.append(video_from_raw(dict(item, statistics=item.get("statistics", {}))))
     return videos
 
+
+def iter_channel_videos(channel_id: str, max_results: int = 20, since: Optional[str] = None):
+    """
+    Yield a channel's latest uploads, newest first, one playlist page at a time.
+
+    Pages through the channel's uploads playlist (1 unit per 50 videos)
+    instead of search().list (100 units per call), then enriches each page
+    of IDs with one videos.list call. With ``since`` paging stops at
+    already-ingested videos.
+    """
+    with youtube_client() as youtube:
+        yield from _channel_uploads(youtube, channel_id, max_results, since)
+
+
+def _channel_uploads(youtube, channel_id: str, max_results: int, since: Optional[str]):
+    playlist_id = _uploads_playlist_id(youtube, channel_id)
+    if not playlist_id:
+        return
+
+    remaining = max_results
+    page_token = None
+    while remaining > 0:
+        response = youtube.playlistItems().list(
+            part="contentDetails",
+            playlistId=playlist_id,
+            maxResults=min(MAX_BATCH_IDS, remaining),
+            pageToken=page_token
+        ).execute()
+        video_ids = []
+        reached_watermark = False
+        for item in response.get("items", []):
+            published_at = item["contentDetails"].get("videoPublishedAt")
+            if since and published_at and published_at <= since:
+                reached_watermark = True
+                break
+            video_ids.append(item["contentDetails"]["videoId"])
+        video_ids = video_ids[:remaining]
+        yield from _fetch_video_details(youtube, video_ids, channel_id)
+        remaining -= len(video_ids)
+        page_token = response.get("nextPageToken")
+        if reached_watermark or not page_token:
+            break
+
+
+def fetch_channel_videos(channel_id: str, max_results: int = 20, since: Optional[str] = None):
+    """Fetch a channel's latest uploads, newest first (see iter_channel_videos)."""
+    return list(iter_channel_videos(channel_id, max_results, since=since))
+
+
+def iter_videos(keyword: str, limit: int = 20, since: Optional[str] = None):
+    """
+    Yield videos for a channel ID (``UC...``, via the cheap uploads-playlist
+    path) or, for anything else, a search keyword.
+    """
+    if CHANNEL_ID_RE.match(keyword):
+        return iter_channel_videos(keyword, max_results=limit, since=since)
+    return iter_youtube_videos(keyword, max_results=limit, since=since)
+
+
+def hook_text(video):
+    return video["title"]
+
+
+def hook_meta(video):
+    return {"source_id": video.get("video_id"), "engagement": video.get("views")}
+
+
 def save_hooks_to_db(videos, niche: str):
-    db: Session = SessionLocal()
-    for v in videos:
-        new_hook = Hook(
-            text=v["title"],
-            tone="unknown",
-            niche=niche,
-            platform="YouTube"
-        )
-        db.add(new_hook)
-    db.commit()
-    db.close()
+    rows = [
+        {"text": v["title"], "tone": "unknown", "niche": niche, "platform": "YouTube", **hook_meta(v)}
+        for v in videos
+    ]
+    stats = bulk_insert_hooks(rows)
+    print(f"✅ Saved {stats.rows} new hooks for '{niche}' into DB, {stats.skipped} duplicates skipped ({stats.rows_per_sec:.0f} rows/sec).")
+    return stats
     
-def scrape_and_store(keyword: str, limit: int = 20):
-    """Fetch and save YouTube hooks for a single niche."""
-    videos = fetch_youtube_videos(keyword, max_results=limit)
+def scrape_and_store(keyword: str, limit: int = 20, incremental: bool = True, on_progress=None):
+    """
+    Fetch and save YouTube hooks for a single niche or channel through the
+    ingest pipeline.
+
+    Channel IDs (``UC...``) go through the cheap uploads-playlist path,
+    anything else is treated as a search keyword.
+    ``on_progress(stage, count)`` is called with "fetched" and "saved".
+    """
+    since = get_watermark("youtube", keyword) if incremental else None
+    with scrape_run("youtube", keyword) as run:
+        videos, report = ingest(
+            f"youtube:{keyword}",
+            iter_videos(keyword, limit, since=since),
+            hook_text,
+            platform="YouTube",
+            niche=keyword,
+            on_progress=on_progress,
+            run=run,
+            to_meta=hook_meta,
+        )
+        with run.span("log"):
+            if videos:
+                report.print_summary()
+            else:
+                print(f"⚠️ No videos found for '{keyword}'.")
     if videos:
-        save_hooks_to_db(videos, niche=keyword)
-    else:
-        print(f"⚠️ No videos found for '{keyword}'.")
+        newest = max(v["publish_date"] for v in videos)
+        if not since or newest > since:
+            set_watermark("youtube", keyword, newest)
+    return videos
+
+
+def scrape_stream(keyword: str, limit: int = 20, incremental: bool = True):
+    """
+    Streaming variant of scrape_and_store: yields events as videos arrive and
+    commits them in micro-batches. The watermark only advances once the
+    stream completes.
+    """
+    since = get_watermark("youtube", keyword) if incremental else None
+    newest = None
+
+    def _tracked():
+        nonlocal newest
+        for video in iter_videos(keyword, limit, since=since):
+            if newest is None or video["publish_date"] > newest:
+                newest = video["publish_date"]
+            yield video
+
+    with scrape_run("youtube", keyword, mode="stream") as run:
+        yield from stream_with_commits(_tracked(), lambda batch: save_hooks_to_db(batch, niche=keyword), run=run)
+    if newest and (not since or newest > since):
+        set_watermark("youtube", keyword, newest)
 
 
 def scrape_youtube_all():
-    """Scrape and save hooks for multiple niches."""
+    """Scrape and save hooks for multiple niches concurrently."""
     niches = ["motivation", "fitness", "business", "productivity", "makeup"]
-    for niche in niches:
-        print(f"🎥 Scraping YouTube for: {niche}")
-        scrape_and_store(niche, limit=20)
+    print(f"🎥 Scraping YouTube for {len(niches)} niches ...")
+    report = fan_out("youtube", niches, lambda niche: scrape_and_store(niche, limit=20))
+    report.print_summary()
+    return report
 
 if __name__ == "__main__":
     niche = input("Enter niche keyword (e.g. motivation, fitness, business): ")
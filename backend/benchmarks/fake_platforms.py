@@ -0,0 +1,536 @@
+"""
+Local stand-ins for the platform APIs the scrapers talk to.
+
+Each FakePlatformServer answers the subset of endpoints that praw,
+googleapiclient and instaloader actually hit:
+
+  - reddit:    POST /api/v1/access_token, GET /r/<sub>/hot|new|top|rising, GET /api/info
+  - youtube:   GET /youtube/v3/search|channels|playlistItems|videos (with ETags)
+  - instagram: GET /, GET /<username>/ (profile page), GET
+               /api/v1/users/web_profile_info/, POST /graphql/query
+
+Content is generated deterministically from a seed, with configurable
+latency, error rate and page size. Two more modes make runs reproducible
+against real data:
+
+  - record: forward every request to the real API once and save the
+            responses to ``<fixtures>/<platform>.json``
+  - replay: serve only the recorded responses
+
+Run one standalone:
+
+    python -m benchmarks.fake_platforms reddit --port 8001 --latency 0.05
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+PLATFORMS = ("reddit", "youtube", "instagram")
+
+# Real hosts used in record mode
+UPSTREAMS = {
+    "reddit": "oauth.reddit.com",
+    "youtube": "youtube.googleapis.com",
+    "instagram": "www.instagram.com",
+}
+REDDIT_AUTH_HOST = "www.reddit.com"
+
+# Query/form params that differ between otherwise identical requests
+VOLATILE_PARAMS = {"key", "server_timestamps", "raw_json"}
+# Response headers worth keeping in fixtures
+KEPT_HEADERS = {"content-type", "etag", "retry-after", "set-cookie",
+                "x-ratelimit-remaining", "x-ratelimit-reset", "x-ratelimit-used"}
+
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+WORDS = [
+    "nobody", "tells", "you", "this", "secret", "about", "growing", "fast", "why", "most",
+    "creators", "fail", "in", "30", "days", "the", "one", "habit", "that", "changed",
+    "everything", "stop", "doing", "mistake", "how", "I", "made", "first", "$10k", "online",
+]
+
+
+class FakeConfig:
+    """Knobs for the generated responses."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        page_size: int = 100,
+        posts_per_target: int = 500,
+        seed: int = 42,
+    ):
+        self.latency = latency            # seconds added to every response
+        self.jitter = jitter              # +/- random seconds on top of latency
+        self.error_rate = error_rate      # fraction of requests answered with error_status
+        self.error_status = error_status
+        self.page_size = page_size        # server-side cap on items per page
+        self.posts_per_target = posts_per_target
+        self.seed = seed
+
+    def to_dict(self) -> Dict:
+        """Convert config to dictionary."""
+        return dict(vars(self))
+
+
+def request_key(method: str, path: str, params: Dict[str, str]) -> str:
+    """Stable fixture key for a request, ignoring credentials and timestamps."""
+    stable = sorted((k, v) for k, v in params.items() if k not in VOLATILE_PARAMS)
+    return f"{method} {path}?" + "&".join(f"{k}={v}" for k, v in stable)
+
+
+class FixtureStore:
+    """Recorded responses for one platform, keyed by request_key."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.responses: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> "FixtureStore":
+        with open(self.path, "r", encoding="utf-8") as fh:
+            self.responses = json.load(fh)["responses"]
+        return self
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self.responses.get(key)
+
+    def put(self, key: str, status: int, headers: Dict[str, str], body: str):
+        with self._lock:
+            self.responses[key] = {"status": status, "headers": headers, "body": body}
+
+    def save(self):
+        with self._lock, open(self.path, "w", encoding="utf-8") as fh:
+            json.dump({"recorded_at": datetime.utcnow().isoformat(), "responses": self.responses}, fh, indent=1)
+
+
+# ---------------------------------------------------------------------------
+# Generated content
+# ---------------------------------------------------------------------------
+
+def _rng(*parts) -> random.Random:
+    return random.Random(hashlib.sha256(":".join(map(str, parts)).encode()).hexdigest())
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 12))).capitalize()
+
+
+def _iso(index: int) -> str:
+    """Publish time of the index-th newest item (one hour apart)."""
+    return (EPOCH - timedelta(hours=index)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _page(cfg: FakeConfig, start: int, requested: Optional[str]) -> range:
+    size = min(cfg.page_size, int(requested or cfg.page_size))
+    return range(start, min(start + size, cfg.posts_per_target))
+
+
+def _reddit(cfg: FakeConfig, method: str, path: str, params: Dict) -> Tuple[int, Dict, object]:
+    if path.rstrip("/") == "/api/v1/access_token":
+        return 200, {}, {"access_token": "fake-token", "token_type": "bearer", "expires_in": 3600, "scope": "*"}
+
+    if path.rstrip("/") == "/api/info":
+        # Engagement refresh: scores drift once a minute
+        children = []
+        for fullname in filter(None, params.get("id", "").split(",")):
+            rng = _rng(cfg.seed, "reddit-info", fullname, int(time.time() // 60))
+            children.append({"kind": "t3", "data": {
+                "id": fullname.split("_")[-1], "name": fullname, "title": _title(rng),
+                "score": rng.randint(0, 50_000), "stickied": False,
+            }})
+        return 200, {}, {"kind": "Listing", "data": {"after": None, "before": None, "dist": len(children), "children": children}}
+
+    parts = path.strip("/").split("/")
+    if len(parts) < 3 or parts[0] != "r" or parts[2] not in ("hot", "new", "top", "rising"):
+        return 404, {}, {"message": "Not Found", "error": 404}
+    sub = parts[1]
+    base = int(hashlib.sha256(sub.encode()).hexdigest()[:6], 16) * 10_000
+    # Every listing walks the same posts from a different starting point, so
+    # listings overlap the way real hot/top/rising pages do
+    shift = _listing_shift(cfg, parts[2], params.get("t"))
+
+    # Newest post has the highest id; "after" is the fullname of the last post seen
+    after = params.get("after")
+    if after:
+        after_index = base + cfg.posts_per_target - int(after.split("_")[-1], 36)
+        start = (after_index - shift) % cfg.posts_per_target + 1
+    else:
+        start = 0
+    children = []
+    for i in _page(cfg, start, params.get("limit")):
+        index = (i + shift) % cfg.posts_per_target
+        post_id = base + cfg.posts_per_target - index
+        rng = _rng(cfg.seed, "reddit", sub, index)
+        children.append({"kind": "t3", "data": {
+            "id": _base36(post_id),
+            "name": f"t3_{_base36(post_id)}",
+            "title": _title(rng),
+            "score": rng.randint(0, 50_000),
+            "url": f"https://www.reddit.com/r/{sub}/comments/{_base36(post_id)}/",
+            "permalink": f"/r/{sub}/comments/{_base36(post_id)}/",
+            "stickied": False,
+            "subreddit": sub,
+            "author": f"user{rng.randint(1, 9999)}",
+            "created_utc": (EPOCH - timedelta(hours=index)).timestamp(),
+            "num_comments": rng.randint(0, 500),
+        }})
+    last = children[-1]["data"]["name"] if children and start + len(children) < cfg.posts_per_target else None
+    headers = {"x-ratelimit-remaining": "599", "x-ratelimit-reset": "600", "x-ratelimit-used": "1"}
+    return 200, headers, {"kind": "Listing", "data": {"after": last, "before": None, "dist": len(children), "children": children}}
+
+
+def _listing_shift(cfg: FakeConfig, listing: str, time_filter: Optional[str]) -> int:
+    """Offset into the subreddit's posts at which a listing starts."""
+    fractions = {"top:day": 8, "top:week": 4, "rising": 2}
+    divisor = fractions.get(f"{listing}:{time_filter}" if listing == "top" else listing)
+    return cfg.posts_per_target // divisor if divisor else 0
+
+
+def _base36(n: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    out = ""
+    while n:
+        n, r = divmod(n, 36)
+        out = digits[r] + out
+    return out or "0"
+
+
+def _video(cfg: FakeConfig, video_id: str) -> Dict:
+    """Everything about a fake video is derived from its id (``<owner>-<index>``)."""
+    owner, _, index = video_id.rpartition("-")
+    rng = _rng(cfg.seed, "youtube", video_id)
+    return {
+        "kind": "youtube#video",
+        "id": video_id,
+        "snippet": {"title": _title(rng), "channelTitle": owner, "publishedAt": _iso(int(index or 0))},
+        "statistics": {"viewCount": str(rng.randint(100, 5_000_000))},
+    }
+
+
+def _youtube(cfg: FakeConfig, method: str, path: str, params: Dict) -> Tuple[int, Dict, object]:
+    resource = path.rstrip("/").rsplit("/", 1)[-1]
+    start = int(params.get("pageToken") or 0)
+
+    if resource == "search":
+        owner = hashlib.sha1(params.get("q", "").encode()).hexdigest()[:8]
+        page = _page(cfg, start, params.get("maxResults"))
+        since = params.get("publishedAfter")
+        items = []
+        for i in page:
+            video = _video(cfg, f"{owner}-{i}")
+            if since and video["snippet"]["publishedAt"] <= since:
+                break
+            items.append({"kind": "youtube#searchResult", "id": {"videoId": video["id"]}, "snippet": video["snippet"]})
+        body = {"kind": "youtube#searchListResponse", "items": items}
+    elif resource == "channels":
+        channel_id = params.get("id", "")
+        body = {"items": [{"id": channel_id, "contentDetails": {"relatedPlaylists": {"uploads": "UU" + channel_id[2:]}}}]}
+    elif resource == "playlistItems":
+        owner = params.get("playlistId", "")
+        items = [
+            {"contentDetails": {"videoId": f"{owner}-{i}", "videoPublishedAt": _iso(i)}}
+            for i in _page(cfg, start, params.get("maxResults"))
+        ]
+        body = {"items": items}
+    elif resource == "videos":
+        body = {"items": [_video(cfg, video_id) for video_id in params.get("id", "").split(",") if video_id]}
+    else:
+        return 404, {}, {"error": {"code": 404, "message": "Not Found", "errors": [{"reason": "notFound"}]}}
+
+    if resource in ("search", "playlistItems"):
+        end = start + len(body["items"])
+        if body["items"] and end < cfg.posts_per_target:
+            body["nextPageToken"] = str(end)
+    body["etag"] = hashlib.md5(json.dumps(body, sort_keys=True).encode()).hexdigest()
+    return 200, {"ETag": body["etag"]}, body
+
+
+_instagram_usernames: Dict[str, str] = {}  # pk -> username, for GraphQL pages keyed by user id
+
+
+def _instagram_user(cfg: FakeConfig, username: str) -> Dict:
+    rng = _rng(cfg.seed, "instagram", username)
+    pk = str(rng.randint(10**9, 10**10))
+    _instagram_usernames[pk] = username
+    return {
+        "pk": pk,
+        "username": username,
+        "full_name": username.title(),
+        "is_private": False,
+        "media_count": cfg.posts_per_target,
+        "follower_count": rng.randint(1_000, 10_000_000),
+        "following_count": rng.randint(10, 1_000),
+        "profile_pic_url": "",
+    }
+
+
+def _instagram_posts(cfg: FakeConfig, username: str, user_id: str, start: int) -> Dict:
+    edges = []
+    page = _page(cfg, start, "12")
+    for i in page:
+        rng = _rng(cfg.seed, "instagram", username, i)
+        edges.append({"node": {
+            "__typename": "GraphImage",
+            "id": str(int(user_id) * 10_000 + i),
+            "shortcode": hashlib.sha1(f"{username}:{i}".encode()).hexdigest()[:11],
+            "taken_at_timestamp": int((EPOCH - timedelta(hours=i)).timestamp()),
+            "edge_media_to_caption": {"edges": [{"node": {"text": _title(rng)}}]},
+            "edge_media_preview_like": {"count": rng.randint(0, 100_000)},
+            "edge_media_to_comment": {"count": rng.randint(0, 1_000)},
+            "is_video": False,
+            "owner": {"id": user_id, "username": username},
+        }})
+    end = page.stop
+    return {
+        "count": cfg.posts_per_target,
+        "page_info": {"has_next_page": end < cfg.posts_per_target, "end_cursor": str(end)},
+        "edges": edges,
+    }
+
+
+def _instagram(cfg: FakeConfig, method: str, path: str, params: Dict) -> Tuple[int, Dict, object]:
+    if path == "/":
+        return 200, {"Set-Cookie": "csrftoken=fake-csrf; Path=/", "Content-Type": "text/html"}, "<html></html>"
+
+    if path.startswith("/api/v1/users/web_profile_info"):
+        username = params.get("username", "")
+        user = _instagram_user(cfg, username)
+        node = dict(user, id=user["pk"], edge_owner_to_timeline_media=_instagram_posts(cfg, username, user["pk"], 0))
+        return 200, {}, {"data": {"user": node}, "status": "ok"}
+
+    if path.startswith("/graphql/query"):
+        variables = json.loads(params.get("variables") or "{}")
+        user_id = str(variables.get("id", ""))
+        username = _instagram_usernames.get(user_id, f"user{user_id}")
+        start = int(variables.get("after") or 0)
+        return 200, {}, {"data": {"user": {"edge_owner_to_timeline_media": _instagram_posts(cfg, username, user_id, start)}}, "status": "ok"}
+
+    # Profile page: instaloader reads the embedded GraphQL results
+    username = path.strip("/").split("/")[0]
+    payload = {"require": [{"__bbox": {"result": {"data": {"xig_user_by_username": _instagram_user(cfg, username)}}}}]}
+    html = f'<html><body><script type="application/json">{json.dumps(payload)}</script></body></html>'
+    return 200, {"Content-Type": "text/html"}, html
+
+
+GENERATORS = {"reddit": _reddit, "youtube": _youtube, "instagram": _instagram}
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakePlatformServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # keep benchmark output readable
+        pass
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _handle(self):
+        srv = self.server
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if body and "application/x-www-form-urlencoded" in self.headers.get("Content-Type", ""):
+            params.update(parse_qsl(body.decode(), keep_blank_values=True))
+        key = request_key(self.command, url.path, params)
+        srv.count("requests")
+
+        cfg = srv.config
+        delay = cfg.latency + (srv.rng.uniform(-cfg.jitter, cfg.jitter) if cfg.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        if srv.mode == "record":
+            status, headers, payload = srv.forward(self, url, body, key)
+        elif srv.mode == "replay":
+            fixture = srv.store.get(key)
+            if fixture is None:
+                srv.count("misses")
+                status, headers, payload = 404, {}, {"error": f"no fixture for {key}"}
+            else:
+                status, headers, payload = fixture["status"], dict(fixture["headers"]), fixture["body"]
+        elif cfg.error_rate and srv.rng.random() < cfg.error_rate:
+            srv.count("errors")
+            status, headers, payload = cfg.error_status, {"Retry-After": "0"}, {"error": {"code": cfg.error_status, "message": "injected"}}
+        else:
+            status, headers, payload = GENERATORS[srv.platform](cfg, self.command, url.path, params)
+
+        etag = headers.get("ETag")
+        if etag and self.headers.get("If-None-Match") == etag:
+            status, payload = 304, ""
+
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        data = data.encode()
+        self.send_response(status)
+        headers.setdefault("Content-Type", "application/json; charset=UTF-8")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakePlatformServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server standing in for one platform.
+
+    Args:
+        platform: "reddit", "youtube" or "instagram"
+        config: FakeConfig for generated responses
+        mode: "fake" (generated), "record" (proxy + save) or "replay"
+        fixtures: Directory holding ``<platform>.json`` for record/replay
+        port: 0 picks a free port
+    """
+
+    daemon_threads = True
+
+    def __init__(self, platform: str, config: Optional[FakeConfig] = None, mode: str = "fake",
+                 fixtures: Optional[str] = None, host: str = "127.0.0.1", port: int = 0):
+        if platform not in PLATFORMS:
+            raise ValueError(f"Unknown platform: {platform}")
+        super().__init__((host, port), _Handler)
+        self.platform = platform
+        self.config = config or FakeConfig()
+        self.mode = mode
+        self.rng = random.Random(self.config.seed)
+        self.stats: Dict[str, int] = {"requests": 0, "errors": 0, "misses": 0}
+        self._stats_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self.store = None
+        if mode in ("record", "replay"):
+            if not fixtures:
+                raise ValueError(f"{mode} mode needs a fixtures directory")
+            self.store = FixtureStore(f"{fixtures.rstrip('/')}/{platform}.json")
+            if mode == "replay":
+                self.store.load()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def forward(self, handler: _Handler, url, body: bytes, key: str) -> Tuple[int, Dict, str]:
+        """Record mode: replay the request against the real API and keep the response."""
+        host = handler.headers.get("X-Forwarded-Host") or UPSTREAMS[self.platform]
+        if self.platform == "reddit" and url.path.startswith("/api/v1/access_token"):
+            host = REDDIT_AUTH_HOST
+        headers = {k: v for k, v in handler.headers.items()
+                   if k.lower() not in ("host", "content-length", "x-forwarded-host", "accept-encoding")}
+        resp = requests.request(handler.command, f"https://{host}{handler.path}",
+                                headers=headers, data=body or None, allow_redirects=False, timeout=30)
+        kept = {k: v for k, v in resp.headers.items() if k.lower() in KEPT_HEADERS}
+        text = resp.text
+        if "access_token" in url.path:
+            text = json.dumps(dict(resp.json(), access_token="recorded-token"))
+        self.store.put(key, resp.status_code, kept, text)
+        return resp.status_code, kept, text
+
+    def start(self) -> "FakePlatformServer":
+        self._thread = threading.Thread(target=self.serve_forever, name=f"fake-{self.platform}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self.store is not None and self.mode == "record":
+            self.store.save()
+
+
+@contextmanager
+def redirect_hosts(mapping: Dict[str, str]):
+    """
+    Send ``requests`` traffic for the given hosts to a local server.
+
+    instaloader has no base-URL option, so its calls to www.instagram.com /
+    i.instagram.com are rewritten at the transport adapter. The original
+    host travels in X-Forwarded-Host for record mode.
+    """
+    from requests.adapters import HTTPAdapter
+
+    original_send = HTTPAdapter.send
+
+    def send(adapter, request, *args, **kwargs):
+        parts = urlsplit(request.url)
+        if parts.hostname in mapping:
+            request.headers["X-Forwarded-Host"] = parts.hostname
+            request.url = mapping[parts.hostname] + request.url[len(f"{parts.scheme}://{parts.netloc}"):]
+        return original_send(adapter, request, *args, **kwargs)
+
+    HTTPAdapter.send = send
+    try:
+        yield
+    finally:
+        HTTPAdapter.send = original_send
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """CLI flags shared by this module and the benchmark runner."""
+    parser.add_argument("--mode", choices=("fake", "record", "replay"), default="fake")
+    parser.add_argument("--fixtures", default=None, help="Directory for recorded <platform>.json fixtures")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds on top of --latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--page-size", type=int, default=100, help="Max items per page")
+    parser.add_argument("--posts-per-target", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def config_from_args(args) -> FakeConfig:
+    return FakeConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        page_size=args.page_size,
+        posts_per_target=args.posts_per_target,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a fake platform API server.")
+    parser.add_argument("platform", choices=PLATFORMS)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = FakePlatformServer(args.platform, config_from_args(args), args.mode, args.fixtures, args.host, args.port)
+    print(f"🧪 Fake {args.platform} API ({args.mode}) on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if server.store is not None and server.mode == "record":
+            server.store.save()
+            print(f"💾 Saved {len(server.store.responses)} responses to {server.store.path}")
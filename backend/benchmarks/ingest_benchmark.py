@@ -0,0 +1,144 @@
+"""
+Reproducible ingest-throughput benchmark against local fake platforms.
+
+Starts one FakePlatformServer per platform, points the real scraper
+clients (praw, googleapiclient, instaloader) at them and runs each
+platform's scrape_and_store over a set of targets through the fan-out
+engine. Nothing leaves the machine unless ``--mode record`` is used.
+
+    python -m benchmarks.ingest_benchmark --targets 6 --limit 300 --latency 0.05
+    python -m benchmarks.ingest_benchmark --mode record --fixtures fixtures/   # needs real credentials
+    python -m benchmarks.ingest_benchmark --mode replay --fixtures fixtures/
+
+Run from ``backend/``. Results go to stdout and optionally ``--json``.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.fake_platforms import (
+    PLATFORMS,
+    FakePlatformServer,
+    add_config_arguments,
+    config_from_args,
+    redirect_hosts,
+)
+
+DEFAULT_TARGETS = {
+    "reddit": ["Business", "ContentCreators", "developersIndia", "IndianMakeupAddicts", "TeenIndia", "InstaCelebsGossip"],
+    "youtube": [
+        "UCbenchmarkchannel000001", "UCbenchmarkchannel000002", "UCbenchmarkchannel000003",
+        "UCbenchmarkchannel000004", "UCbenchmarkchannel000005", "UCbenchmarkchannel000006",
+    ],
+    "instagram": ["garyvee", "garimakalraaa", "hubspot", "marketingharry", "creators", "themodernimbecile"],
+}
+
+
+def _configure_environment(servers: Dict[str, FakePlatformServer], args, workdir: str):
+    """Settings are read from the environment on import, so this runs before any app import."""
+    env = {
+        "DATABASE_URL": args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "INSTAGRAM_CACHE_DIR": os.path.join(workdir, "instagram-cache"),
+        "INSTAGRAM_SLEEP": "0",  # instaloader's politeness delay would dominate the numbers
+        "METRICS_RUN_LOG": os.path.join(workdir, "scrape_runs.jsonl"),
+        "RAW_ARCHIVE_DIR": os.path.join(workdir, "raw-archive"),
+        "SCRAPE_TARGET_TIMEOUT": str(args.timeout),
+    }
+    if not args.keep_rate_limits:
+        env.update(REDDIT_REQUESTS_PER_MINUTE="1000000", YOUTUBE_DAILY_QUOTA="1000000000",
+                   INSTAGRAM_REQUESTS_PER_HOUR="1000000000")
+    if args.mode != "record":
+        env.update(REDDIT_CLIENT_ID="bench", REDDIT_CLIENT_SECRET="bench",
+                   REDDIT_USER_AGENT="hooklibrary-benchmark", YOUTUBE_API_KEY="bench")
+    if "reddit" in servers:
+        env.update(REDDIT_OAUTH_URL=servers["reddit"].url, REDDIT_URL=servers["reddit"].url)
+    if "youtube" in servers:
+        env["YOUTUBE_API_ENDPOINT"] = servers["youtube"].url + "/"
+    os.environ.update(env)
+
+
+def _scrape_fn(platform: str):
+    if platform == "reddit":
+        from app.services.reddit_scraper import scrape_and_store
+    elif platform == "youtube":
+        from app.services.youtube_scraper import scrape_and_store
+    else:
+        from app.services.instagram_scaper import scrape_and_store
+    return scrape_and_store
+
+
+def run_benchmark(args) -> Dict:
+    """Run every requested platform and return a JSON-serialisable summary."""
+    config = config_from_args(args)
+    servers = {p: FakePlatformServer(p, config, args.mode, args.fixtures).start() for p in args.platforms}
+    workdir = tempfile.mkdtemp(prefix="hook-bench-")
+    _configure_environment(servers, args, workdir)
+
+    import app.core  # noqa: F401  (the package __init__ creates the tables)
+    from app.core.metrics import get_scrape_metrics
+    from app.core.raw_archive import flush_archive, get_archive_stats
+    from app.core.scrape_engine import fan_out
+
+    results: Dict[str, Dict] = {}
+    redirect = {}
+    if "instagram" in servers:
+        redirect = {"www.instagram.com": servers["instagram"].url, "i.instagram.com": servers["instagram"].url}
+    try:
+        with redirect_hosts(redirect):
+            for platform in args.platforms:
+                scrape_and_store = _scrape_fn(platform)
+                targets: List[str] = DEFAULT_TARGETS[platform][:args.targets]
+                print(f"🏎️ [{platform}] {len(targets)} targets x {args.limit} posts ({args.mode} mode)")
+                started = time.perf_counter()
+                report = fan_out(
+                    platform,
+                    targets,
+                    lambda target: scrape_and_store(target, args.limit, incremental=False),
+                    max_workers=args.workers,
+                )
+                wall = time.perf_counter() - started
+                report.print_summary()
+                fetched = sum(len(r.result or []) for r in report.results)
+                results[platform] = {
+                    "targets": len(targets),
+                    "fetched": fetched,
+                    "posts_per_sec": round(fetched / wall, 1) if wall > 0 else float(fetched),
+                    "server": dict(servers[platform].stats),
+                    "report": report.to_dict(),
+                    "spans": {
+                        key.split(":", 1)[1]: h for key, h in get_scrape_metrics()["platforms"].items()
+                        if key.startswith(platform + ":")
+                    },
+                }
+                print(f"📈 [{platform}] {fetched} posts in {wall:.2f}s → {results[platform]['posts_per_sec']} posts/sec")
+    finally:
+        for server in servers.values():
+            server.stop()
+
+    flush_archive()
+    return {"mode": args.mode, "config": config.to_dict(), "limit": args.limit, "platforms": results,
+            "raw_archive": dict(get_archive_stats(), root=os.environ["RAW_ARCHIVE_DIR"])}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark scraper ingest throughput against fake platform APIs.")
+    parser.add_argument("--platforms", nargs="+", choices=PLATFORMS, default=list(PLATFORMS))
+    parser.add_argument("--targets", type=int, default=6, help="Targets per platform (max 6)")
+    parser.add_argument("--limit", type=int, default=200, help="Posts requested per target")
+    parser.add_argument("--workers", type=int, default=None, help="Override the per-platform concurrency cap")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds allowed per target")
+    parser.add_argument("--database-url", default=None, help="Defaults to a throwaway SQLite file")
+    parser.add_argument("--keep-rate-limits", action="store_true", help="Keep the real token-bucket limits")
+    parser.add_argument("--json", default=None, help="Write the summary to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    summary = run_benchmark(args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
+        print(f"💾 Wrote {args.json}")
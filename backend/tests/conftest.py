@@ -0,0 +1,43 @@
+"""
+Shared fixtures: every test runs against a throwaway SQLite database.
+
+Settings are read from the environment when app modules are imported, so
+the environment is set up here before anything from ``app`` is imported.
+"""
+
+import os
+import tempfile
+
+_workdir = tempfile.mkdtemp(prefix="hook-tests-")
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{os.path.join(_workdir, 'test.db')}",
+    HOOK_INDEX_ENABLED="0",
+    HOOK_INDEX_SNAPSHOT="",
+    RAW_ARCHIVE_DIR=os.path.join(_workdir, "raw-archive"),
+    METRICS_RUN_LOG=os.path.join(_workdir, "scrape_runs.jsonl"),
+)
+
+import pytest  # noqa: E402
+
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.EssentialFeatures.EssentialFeaturesCache import clear_hook_cache  # noqa: E402
+from app.EssentialFeatures.models import EssentialHook, EssentialHookComment  # noqa: E402
+from app.models.hook_model import Hook  # noqa: E402
+
+TABLES = [EssentialHook.__table__, EssentialHookComment.__table__, Hook.__table__]
+
+
+@pytest.fixture
+def db():
+    """A session over empty hook tables."""
+    Base.metadata.create_all(engine, tables=TABLES)
+    clear_hook_cache()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            for table in reversed(TABLES):
+                conn.execute(table.delete())
+        clear_hook_cache()
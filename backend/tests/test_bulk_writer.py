@@ -0,0 +1,30 @@
+"""Chunked hook writes: bulk_insert_hooks."""
+
+from sqlalchemy import select
+
+from app.core.bulk_writer import bulk_insert_hooks
+from app.models.hook_model import Hook
+
+
+def _row(text, platform="Reddit", **extra):
+    return dict(text=text, tone="unknown", niche="fitness", platform=platform, **extra)
+
+
+def _stored(db):
+    return db.execute(select(Hook.platform, Hook.text, Hook.source_id).order_by(Hook.id)).all()
+
+
+def test_rows_are_written_across_chunks(db):
+    rows = [_row(f"hook number {i}", source_id=f"t3_{i}", engagement=i) for i in range(25)]
+    stats = bulk_insert_hooks(rows, chunk_size=10)
+    assert (stats.rows, stats.skipped, stats.chunks, stats.method) == (25, 0, 3, "executemany")
+    stored = _stored(db)
+    assert len(stored) == 25
+    assert stored[0] == ("Reddit", "hook number 0", "t3_0")
+    assert db.get(Hook, 1).content_hash is not None
+
+
+def test_stats_serialise():
+    stats = bulk_insert_hooks([])
+    assert stats.to_dict()["rows"] == 0
+    assert stats.chunks == 0
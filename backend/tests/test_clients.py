@@ -0,0 +1,68 @@
+"""Lazy platform clients: shared vs pooled (per-thread) instances."""
+
+import threading
+
+import pytest
+
+from app.core.clients import LazyClient
+
+
+class _Session:
+    """Stands in for praw.Reddit / Instaloader: one user at a time."""
+
+    def __init__(self):
+        self.in_use = threading.Lock()
+
+
+def test_shared_client_is_built_once():
+    client = LazyClient("shared", object)
+    assert client.get() is client.get()
+    assert client.builds == 1 and client.ready
+
+
+def test_pooled_client_refuses_get():
+    client = LazyClient("pooled", _Session, pool_size=2)
+    with pytest.raises(RuntimeError):
+        client.get()
+
+
+def test_pooled_checkouts_never_share_an_instance():
+    client = LazyClient("pooled", _Session, pool_size=2)
+    barrier = threading.Barrier(4)
+    overlaps = []
+
+    def _scrape():
+        with client.checkout() as session:
+            if not session.in_use.acquire(blocking=False):
+                overlaps.append(session)
+                return
+            barrier.wait(timeout=5)  # all four hold an instance at once
+            session.in_use.release()
+
+    threads = [threading.Thread(target=_scrape) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert overlaps == []
+    assert client.builds == 4
+    assert client.to_dict()["idle"] == 2  # the rest are dropped, not kept
+
+
+def test_pooled_instances_are_reused_between_scrapes():
+    client = LazyClient("pooled", _Session, pool_size=2)
+    with client.checkout() as first:
+        pass
+    with client.checkout() as second:
+        assert second is first
+    assert client.builds == 1
+
+
+def test_failed_build_is_recorded():
+    def _broken():
+        raise RuntimeError("no credentials")
+
+    client = LazyClient("broken", _broken, pool_size=1)
+    assert client.warm() is False
+    assert client.to_dict()["error"] == "no credentials"
+    assert not client.ready
@@ -0,0 +1,71 @@
+"""Content-hash de-duplication: the upsert and the startup migration of old hooks tables."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.core.bulk_writer import bulk_insert_hooks
+from app.core.dedupe import content_hash
+from app.models.hook_model import Hook
+from app.services.dedupe_backfill import UNIQUE_INDEX, ensure_content_hash
+from app.services.engagement_refresh import ensure_engagement_columns
+
+
+def _row(text, platform="Reddit", **extra):
+    return dict(text=text, tone="unknown", niche="fitness", platform=platform, **extra)
+
+
+def test_trivial_variations_hash_the_same():
+    assert content_hash("Stop  scrolling!") == content_hash(" stop scrolling! ")
+    assert content_hash("Ｓtop scrolling!") == content_hash("stop scrolling!")  # NFKC
+    assert content_hash("stop scrolling") != content_hash("stop scrolling!")
+
+
+def test_upsert_skips_duplicates_per_platform(db):
+    first = bulk_insert_hooks([_row("Stop scrolling"), _row("stop  SCROLLING"), _row("Stop scrolling", "YouTube")])
+    assert (first.rows, first.skipped) == (2, 1)  # same text on another platform is kept
+
+    again = bulk_insert_hooks([_row("STOP scrolling"), _row("Something new")])
+    assert (again.rows, again.skipped) == (1, 1)
+    assert db.scalar(select(Hook.id).where(Hook.text == "Something new")) is not None
+    assert len(db.execute(select(Hook.id)).all()) == 3
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    """A hooks table from before content hashing, holding duplicates."""
+    bind = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with bind.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE hooks (id INTEGER PRIMARY KEY, text VARCHAR NOT NULL, "
+            "tone VARCHAR, niche VARCHAR, platform VARCHAR)"
+        ))
+        conn.execute(text(
+            "INSERT INTO hooks (text, tone, niche, platform) VALUES "
+            "('Stop scrolling', 'Funny', 'fitness', 'Reddit'), "
+            "('stop  scrolling', 'Funny', 'fitness', 'Reddit'), "
+            "('Stop scrolling', 'Funny', 'fitness', 'YouTube'), "
+            "('Wake up early', 'Serious', 'fitness', 'Reddit')"
+        ))
+    yield bind
+    bind.dispose()
+
+
+def test_startup_migrates_a_legacy_hooks_table(legacy_engine):
+    counts = ensure_content_hash(legacy_engine)
+    ensure_engagement_columns(legacy_engine)
+    assert counts == {"hashed": 4, "deleted": 1}
+    assert UNIQUE_INDEX in {index["name"] for index in inspect(legacy_engine).get_indexes("hooks")}
+
+    # The first scrape after the upgrade used to fail on the missing column
+    stats = bulk_insert_hooks(
+        [_row("STOP scrolling", source_id="t3_a", engagement=5), _row("Brand new hook", source_id="t3_b")],
+        bind=legacy_engine,
+    )
+    assert (stats.rows, stats.skipped) == (1, 1)
+    with legacy_engine.connect() as conn:
+        assert conn.execute(text("SELECT id FROM hooks ORDER BY id")).scalars().all() == [1, 3, 4, 5]
+
+
+def test_startup_migration_is_a_no_op_once_done(legacy_engine):
+    ensure_content_hash(legacy_engine)
+    assert ensure_content_hash(legacy_engine) is None
@@ -0,0 +1,104 @@
+"""Engagement refresh: due selection, cross-worker claims, failures and the engagement sort."""
+
+from datetime import datetime, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import engine, get_db
+from app.models.hook_model import Hook
+from app.routers import reddit
+from app.services import engagement_refresh
+
+
+def _seed(db, count=5, platform="Reddit", **values):
+    now = datetime.utcnow()
+    hooks = [
+        Hook(text=f"{platform} hook {i}", platform=platform, content_hash=f"{platform}-{i}",
+             source_id=f"t3_{i}", created_at=now - timedelta(minutes=i), **values)
+        for i in range(count)
+    ]
+    db.add_all(hooks)
+    db.commit()
+    return hooks
+
+
+def _scores(fullnames):
+    return {name: 100 + int(name.split("_")[1]) for name in fullnames}
+
+
+def test_due_hooks_are_refreshed_once(db):
+    _seed(db)
+    stale = Hook(text="old", platform="Reddit", content_hash="old", source_id="t3_old",
+                 created_at=datetime.utcnow() - timedelta(days=60))
+    db.add(stale)
+    db.commit()
+
+    result = engagement_refresh.refresh_platform("reddit", fetcher=_scores)
+    assert (result["selected"], result["updated"], result["calls"]) == (5, 5, 1)
+    assert engagement_refresh.select_due("reddit", 100) == []
+    db.expire_all()
+    assert sorted(h.engagement for h in db.query(Hook).filter(Hook.engagement.isnot(None))) == [100, 101, 102, 103, 104]
+
+
+def test_a_hook_is_claimed_by_one_worker(db):
+    _seed(db, count=4)
+    now = datetime.utcnow()
+    first = engagement_refresh.claim_due("reddit", 3, now=now)
+    second = engagement_refresh.claim_due("reddit", 10, now=now + timedelta(microseconds=1))
+    assert len(first) == 3 and len(second) == 1
+    assert not {hook_id for hook_id, _ in first} & {hook_id for hook_id, _ in second}
+
+
+def test_a_claim_lost_between_select_and_update_is_skipped(db, monkeypatch):
+    _seed(db, count=2)
+    select_due = engagement_refresh.select_due
+
+    def _raced(platform, limit, now=None, bind=None):
+        due = select_due(platform, limit, now, bind)
+        with engine.begin() as conn:  # another worker claims them first
+            conn.execute(Hook.__table__.update().values(engagement_updated_at=now + timedelta(microseconds=1)))
+        return due
+
+    monkeypatch.setattr(engagement_refresh, "select_due", _raced)
+    assert engagement_refresh.claim_due("reddit", 10, now=datetime.utcnow()) == []
+
+
+def test_failed_batches_are_released_for_the_next_run(db):
+    _seed(db, count=3)
+
+    def _down(fullnames):
+        raise RuntimeError("503 from reddit")
+
+    result = engagement_refresh.refresh_platform("reddit", fetcher=_down)
+    assert (result["failed"], result["calls"]) == (3, 0)
+    assert len(engagement_refresh.select_due("reddit", 10)) == 3
+
+
+def test_hooks_the_api_no_longer_returns_wait_for_the_next_window(db):
+    _seed(db, count=2)
+    result = engagement_refresh.refresh_platform("reddit", fetcher=lambda names: {names[0]: 7})
+    assert (result["updated"], result["missing"]) == (1, 1)
+    assert engagement_refresh.select_due("reddit", 10) == []
+
+
+def _client(db):
+    app = FastAPI()
+    app.include_router(reddit.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def test_engagement_sort_needs_a_platform(db):
+    _seed(db, count=1)
+    assert _client(db).get("/reddit/hooks", params={"sort": "engagement"}).status_code == 400
+
+
+def test_engagement_sort_keeps_unrefreshed_hooks_last(db):
+    reddit_hooks = _seed(db, count=3)
+    _seed(db, count=1, platform="YouTube", engagement=10_000_000)
+    reddit_hooks[0].engagement, reddit_hooks[2].engagement = 5, 50
+    db.commit()
+
+    hooks = _client(db).get("/reddit/hooks", params={"sort": "engagement", "platform": "Reddit"}).json()
+    assert [h["engagement"] for h in hooks] == [50, 5, None]  # the YouTube views are not mixed in
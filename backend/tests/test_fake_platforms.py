@@ -0,0 +1,50 @@
+"""Fake platform servers used by the benchmark (and these tests)."""
+
+import json
+
+import requests
+
+from benchmarks.fake_platforms import FakeConfig, FakePlatformServer, FixtureStore, request_key
+
+
+def _listing(server, **params):
+    return requests.get(f"{server.url}/r/Business/new", params=dict(limit=5, **params), timeout=5)
+
+
+def test_generated_listings_are_deterministic_and_paged():
+    server = FakePlatformServer("reddit", FakeConfig(page_size=3)).start()
+    try:
+        first = _listing(server).json()["data"]["children"]
+        assert len(first) == 3  # server-side page cap
+        assert first == _listing(server).json()["data"]["children"]
+        after = first[-1]["data"]["name"]
+        second = _listing(server, after=after).json()["data"]["children"]
+        assert not {c["data"]["name"] for c in first} & {c["data"]["name"] for c in second}
+        assert server.stats["requests"] == 3
+    finally:
+        server.stop()
+
+
+def test_injected_errors_carry_retry_after():
+    server = FakePlatformServer("reddit", FakeConfig(error_rate=1.0, error_status=429)).start()
+    try:
+        response = _listing(server)
+        assert (response.status_code, response.headers["Retry-After"]) == (429, "0")
+        assert server.stats["errors"] == 1
+    finally:
+        server.stop()
+
+
+def test_replay_serves_recorded_fixtures(tmp_path):
+    store = FixtureStore(str(tmp_path / "reddit.json"))
+    key = request_key("GET", "/r/Business/new", {"limit": "5"})
+    store.put(key, 200, {"Content-Type": "application/json"}, json.dumps({"recorded": True}))
+    store.save()
+
+    server = FakePlatformServer("reddit", mode="replay", fixtures=str(tmp_path)).start()
+    try:
+        assert _listing(server).json() == {"recorded": True}
+        assert _listing(server, after="t3_x").status_code == 404
+        assert server.stats["misses"] == 1
+    finally:
+        server.stop()
@@ -0,0 +1,56 @@
+"""Explorer page cache: hits, and generation bumps from ORM commits."""
+
+import pytest
+
+from app.EssentialFeatures import EssentialFeaturesCache as hook_cache
+from app.EssentialFeatures.EssentialFeaturesService import fetch_filtered_hooks_service
+from app.EssentialFeatures.models import EssentialHook
+
+
+@pytest.fixture
+def cached(db, monkeypatch):
+    monkeypatch.setattr(hook_cache.settings, "HOOK_CACHE_COUNTER_FLUSH_SECONDS", 0.0)
+    db.add_all([EssentialHook(id=i, title=f"hook {i}", platform="Reddit", view_count=i) for i in range(1, 6)])
+    db.commit()
+    return db
+
+
+def _ids(db, **filters):
+    return [hook["id"] for hook in fetch_filtered_hooks_service(db, limit=10, **filters)["hooks"]]
+
+
+def test_equivalent_filters_share_a_cached_page(cached):
+    _ids(cached, platform="All Platforms")
+    hits = hook_cache.get_hook_cache_stats()["hits"]
+    _ids(cached, platform="", sort_by="unknown")
+    assert hook_cache.get_hook_cache_stats()["hits"] == hits + 1
+
+
+def test_insert_and_delete_invalidate_pages(cached):
+    assert _ids(cached) == [5, 4, 3, 2, 1]
+    cached.add(EssentialHook(id=6, title="hook 6", platform="Reddit"))
+    cached.commit()
+    assert _ids(cached) == [6, 5, 4, 3, 2, 1]
+    cached.delete(cached.get(EssentialHook, 6))
+    cached.commit()
+    assert _ids(cached) == [5, 4, 3, 2, 1]
+
+
+def test_counter_writes_only_invalidate_counter_sorts(cached):
+    assert _ids(cached, sort_by="Most Popular") == [5, 4, 3, 2, 1]
+    generations = hook_cache.get_hook_cache_stats()["generations"]
+    cached.get(EssentialHook, 1).view_count = 100
+    cached.commit()
+    assert _ids(cached, sort_by="Most Popular") == [1, 5, 4, 3, 2]
+    after = hook_cache.get_hook_cache_stats()["generations"]
+    assert after["hooks"] == generations["hooks"]
+    assert after["counters"] > generations["counters"]
+
+
+def test_rolled_back_writes_keep_the_cache(cached):
+    _ids(cached)
+    generations = hook_cache.get_hook_cache_stats()["generations"]
+    cached.add(EssentialHook(id=7, title="never committed"))
+    cached.flush()
+    cached.rollback()
+    assert hook_cache.get_hook_cache_stats()["generations"] == generations
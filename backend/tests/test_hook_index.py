@@ -0,0 +1,152 @@
+"""Typeahead index: ORM updates, sync of other workers' rows, rebuilds."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.core.database import engine
+from app.EssentialFeatures import EssentialFeaturesIndex as hook_index
+from app.EssentialFeatures.EssentialFeaturesService import typeahead_hooks_service
+from app.EssentialFeatures.models import EssentialHook
+
+
+@pytest.fixture
+def index_state(monkeypatch):
+    """Fresh process-wide index state; the background thread is never started."""
+    monkeypatch.setattr(hook_index, "_index", None)
+    monkeypatch.setattr(hook_index, "_rebuild_changes", None)
+    monkeypatch.setattr(hook_index, "start_hook_index", lambda on_demand=False: None)
+    monkeypatch.setattr(settings, "HOOK_INDEX_REBUILD_SECONDS", 3600.0)
+
+
+def _insert_elsewhere(**values):
+    """A row written by another worker: Core insert, no ORM events here."""
+    with engine.begin() as conn:
+        conn.execute(EssentialHook.__table__.insert().values(**values))
+
+
+def _ids(q, **filters):
+    return hook_index.get_hook_index().search(q, filters or None, limit=50)["hook_ids"]
+
+
+def _loaded(db):
+    db.add_all([
+        EssentialHook(id=1, title="morning routine", platform="YouTube", tone="Funny"),
+        EssentialHook(id=2, title="morning coffee", platform="Reddit", tone="Serious"),
+    ])
+    db.commit()
+    hook_index.refresh_hook_index(db)
+    return hook_index.get_hook_index()
+
+
+def test_typeahead_is_unavailable_until_loaded(db, index_state):
+    with pytest.raises(HTTPException) as exc:
+        typeahead_hooks_service(db, "morn")
+    assert exc.value.status_code == 503
+
+
+def test_orm_commits_update_the_index(db, index_state):
+    index = _loaded(db)
+    assert _ids("morn") == [2, 1]
+    assert _ids("morn", platform="Reddit") == [2]
+
+    db.add(EssentialHook(id=3, title="zebra crossing", platform="Reddit"))
+    db.commit()
+    assert _ids("zeb") == [3]
+
+    hook = db.get(EssentialHook, 1)
+    hook.title = "evening routine"
+    db.commit()
+    assert _ids("morn") == [2]
+    assert _ids("even") == [1]
+
+    db.delete(db.get(EssentialHook, 2))
+    db.commit()
+    assert _ids("morn") == []
+    assert index.documents == 2
+
+
+def test_counter_updates_leave_the_index_alone(db, index_state):
+    index = _loaded(db)
+    before = index.to_dict()
+    hook = db.get(EssentialHook, 1)
+    hook.view_count = 10
+    db.commit()
+    assert index.to_dict() == before
+
+
+def test_sync_picks_up_lower_ids_after_a_local_insert(db, index_state):
+    index = _loaded(db)
+    _insert_elsewhere(id=9001, title="zebracorn from another worker")
+    db.add(EssentialHook(id=9002, title="local hook"))
+    db.commit()
+    assert index.max_id == 9002
+    assert _ids("zebrac") == []
+
+    hook_index.refresh_hook_index(db)
+    assert _ids("zebrac") == [9001]
+    assert index.synced_id == 9002
+
+
+def test_sync_rereads_ids_committed_out_of_order(db, index_state):
+    _loaded(db)
+    _insert_elsewhere(id=50, title="walrus one")
+    _insert_elsewhere(id=40, title="walrus two")
+    hook_index.refresh_hook_index(db)
+    _insert_elsewhere(id=45, title="walrus three")  # below synced_id, inside the overlap
+    hook_index.refresh_hook_index(db)
+    assert _ids("walr") == [50, 45, 40]
+    assert hook_index.get_hook_index().documents == 5
+
+
+def test_repeated_syncs_do_not_double_count(db, index_state):
+    index = _loaded(db)
+    _insert_elsewhere(id=3, title="third")
+    for _ in range(3):
+        hook_index.refresh_hook_index(db)
+    assert index.documents == 3
+    assert index.to_dict()["postings"] == sum(len(p) for p in index.postings.values())
+
+
+def test_rebuild_reconciles_edits_and_deletes_from_other_workers(db, index_state, monkeypatch):
+    old = _loaded(db)
+    with engine.begin() as conn:
+        table = EssentialHook.__table__
+        conn.execute(table.delete().where(table.c.id == 2))
+        conn.execute(table.update().where(table.c.id == 1).values(title="afternoon nap"))
+    hook_index.refresh_hook_index(db)
+    assert _ids("morn") == [2, 1]  # a sync can't see edits or deletes
+
+    monkeypatch.setattr(settings, "HOOK_INDEX_REBUILD_SECONDS", 0.001)
+    old.built_at -= 1
+    hook_index.refresh_hook_index(db)
+    assert hook_index.get_hook_index() is not old
+    assert _ids("morn") == []
+    assert _ids("aftern") == [1]
+    assert hook_index.get_hook_index().documents == 1
+
+
+def test_changes_committed_during_a_rebuild_are_replayed(db, index_state, monkeypatch):
+    _loaded(db)
+    build = hook_index.build_hook_index
+
+    def _slow_build(session):
+        index = build(session)
+        # Committed after the rebuild read the table, before the swap
+        db.delete(db.get(EssentialHook, 1))
+        db.commit()
+        return index
+
+    monkeypatch.setattr(hook_index, "build_hook_index", _slow_build)
+    hook_index.rebuild_hook_index(db)
+    assert _ids("morn") == [2]
+
+
+def test_snapshot_round_trip(tmp_path, db, index_state):
+    index = _loaded(db)
+    path = str(tmp_path / "hook-index.bin")
+    index.save(path)
+    loaded = hook_index.HookIndex.load(path)
+    assert loaded.to_dict()["postings"] == index.to_dict()["postings"]
+    assert (loaded.documents, loaded.synced_id, loaded.built_at) == (2, 2, index.built_at)
+    assert loaded.search("morn")["hook_ids"] == [2, 1]
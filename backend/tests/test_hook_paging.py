@@ -0,0 +1,101 @@
+"""Keyset pagination of the hook explorer (fetch_filtered_hooks_service)."""
+
+import pytest
+from fastapi import HTTPException
+
+from app.EssentialFeatures.EssentialFeaturesService import fetch_filtered_hooks_service
+from app.EssentialFeatures.models import EssentialHook
+
+COUNTERS = ("view_count", "like_count", "comment_count", "copy_count")
+
+
+def _seed(db, count=47):
+    """Hooks with heavily tied counters (and some NULLs) so pages split inside ties."""
+    hooks = []
+    for i in range(1, count + 1):
+        hooks.append(EssentialHook(
+            id=i,
+            title=f"morning routine hook {i}" if i % 3 == 0 else f"evening hook {i}",
+            text="wake up early" if i % 4 == 0 else "stay late",
+            platform="YouTube" if i % 2 else "Reddit",
+            niche="fitness",
+            tone="Funny",
+            view_count=None if i % 7 == 0 else i % 5,
+            like_count=i % 3,
+            comment_count=i % 2,
+            copy_count=(i * 7) % 4,
+        ))
+    db.add_all(hooks)
+    db.commit()
+    return hooks
+
+
+def _walk(db, limit=10, **filters):
+    """Every hook id across all pages, in page order."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = fetch_filtered_hooks_service(db, limit=limit, cursor=cursor, **filters)
+        ids.extend(hook["id"] for hook in page["hooks"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids, pages
+        assert pages < 100, "cursor never ran out"
+
+
+def _value(hook, field):
+    return getattr(hook, field) or 0
+
+
+SORT_KEYS = {
+    "Most Popular": lambda h: _value(h, "view_count"),
+    "Most Copied": lambda h: _value(h, "copy_count"),
+    "Highest Engagement": lambda h: sum(_value(h, f) for f in ("like_count", "comment_count", "view_count")),
+}
+
+
+def test_newest_pages_cover_every_hook_once(db):
+    hooks = _seed(db)
+    ids, pages = _walk(db)
+    assert ids == sorted((h.id for h in hooks), reverse=True)
+    assert pages == 5
+
+
+@pytest.mark.parametrize("sort_by", list(SORT_KEYS))
+def test_counter_sorts_page_through_ties(db, sort_by):
+    hooks = _seed(db)
+    key = SORT_KEYS[sort_by]
+    expected = [h.id for h in sorted(hooks, key=lambda h: (key(h), h.id), reverse=True)]
+    ids, _ = _walk(db, sort_by=sort_by, limit=7)
+    assert ids == expected
+
+
+def test_filters_apply_on_every_page(db):
+    hooks = _seed(db)
+    ids, _ = _walk(db, platform="Reddit", sort_by="Most Popular", limit=4)
+    assert sorted(ids) == sorted(h.id for h in hooks if h.platform == "Reddit")
+    assert len(ids) == len(set(ids))
+
+
+def test_relevance_pages_return_every_match_once(db):
+    hooks = _seed(db)
+    ids, _ = _walk(db, search_query="morn", sort_by="Relevance", limit=4)
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {h.id for h in hooks if "morning" in h.title}
+
+
+def test_insert_between_pages_does_not_shift_the_next_page(db):
+    _seed(db, count=20)
+    first = fetch_filtered_hooks_service(db, limit=10)
+    db.add(EssentialHook(id=100, title="brand new hook", platform="Reddit"))
+    db.commit()
+    second = fetch_filtered_hooks_service(db, limit=10, cursor=first["next_cursor"])
+    assert [h["id"] for h in second["hooks"]] == list(range(10, 0, -1))
+
+
+def test_cursor_from_another_sort_is_rejected(db):
+    _seed(db, count=20)
+    cursor = fetch_filtered_hooks_service(db, limit=5, sort_by="Most Popular")["next_cursor"]
+    with pytest.raises(HTTPException) as exc:
+        fetch_filtered_hooks_service(db, limit=5, sort_by="Most Copied", cursor=cursor)
+    assert exc.value.status_code == 400
@@ -0,0 +1,69 @@
+"""Instagram profile/cursor cache: resuming where the last scrape stopped."""
+
+import threading
+
+import pytest
+
+from app.core import rate_limit
+from app.core.config import settings
+from app.services import instagram_cache, instagram_scaper
+from benchmarks.fake_platforms import FakeConfig, FakePlatformServer, redirect_hosts
+
+
+@pytest.fixture
+def fake_instagram(monkeypatch, tmp_path):
+    server = FakePlatformServer("instagram", FakeConfig(page_size=4)).start()
+    monkeypatch.setattr(settings, "INSTAGRAM_CACHE_DIR", str(tmp_path / "instagram"))
+    monkeypatch.setattr(settings, "INSTAGRAM_SLEEP", False)
+    # The real budget (200 requests/hour) would stall the test
+    monkeypatch.setitem(rate_limit.PLATFORM_LIMITS, "instagram", (0, 1.0))
+    monkeypatch.setattr(rate_limit, "_buckets", {})
+    instagram_scaper._instaloader.reset()
+    try:
+        with redirect_hosts({"www.instagram.com": server.url, "i.instagram.com": server.url}):
+            yield server
+    finally:
+        instagram_scaper._instaloader.reset()
+        server.stop()
+
+
+def _shortcodes(username, limit, **kwargs):
+    return [p["shortcode"] for p in instagram_scaper.fetch_instagram_posts(username, limit, **kwargs)]
+
+
+def test_caught_up_scrape_resumes_the_saved_cursor(fake_instagram):
+    full = _shortcodes("garyvee", 20, resume=False)
+    first = _shortcodes("garyvee", 5)
+    assert first == full[:5]
+
+    # Nothing new above the watermark: the budget backfills older posts
+    backfill = instagram_scaper.fetch_instagram_posts("garyvee", 7, since=first[0])
+    assert [p["shortcode"] for p in backfill] == full[5:12]
+    assert all(p["is_backfill"] for p in backfill)
+    assert _shortcodes("garyvee", 3, since=first[0]) == full[12:15]
+
+
+def test_profile_lookup_is_served_from_disk(fake_instagram):
+    _shortcodes("hubspot", 2)
+    requests = fake_instagram.stats["requests"]
+    with instagram_scaper.instagram_client() as loader:
+        instagram_cache.get_profile(loader.context, "HubSpot")
+    assert fake_instagram.stats["requests"] == requests
+
+
+def test_one_lock_per_username_under_contention():
+    instagram_cache._locks.clear()
+    barrier = threading.Barrier(16)
+    locks = []
+
+    def _get():
+        barrier.wait()
+        locks.append(instagram_cache._lock("SameUser"))
+
+    threads = [threading.Thread(target=_get) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(lock) for lock in locks}) == 1
+    assert instagram_cache._lock("sameuser") is locks[0]
@@ -0,0 +1,65 @@
+"""Offline import of instaloader dumps."""
+
+import json
+import lzma
+
+from sqlalchemy import select
+
+from app.models.hook_model import Hook
+from app.services.instagram_dump_importer import import_dumps, parse_dump_file
+
+
+def _post(shortcode, caption, likes, layout="graphql"):
+    if layout == "graphql":
+        return {
+            "shortcode": shortcode,
+            "edge_media_to_caption": {"edges": [{"node": {"text": caption}}]},
+            "edge_media_preview_like": {"count": likes},
+        }
+    return {"code": shortcode, "caption": {"text": caption}, "like_count": likes}
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".xz":
+        with lzma.open(path, "wt", encoding="utf-8") as fh:
+            json.dump(data, fh)
+    else:
+        path.write_text(json.dumps(data))
+
+
+def _dumps(root):
+    _write(root / "beerbiceps" / "2024-01-01_UTC.json.xz",
+           {"node": _post("AAA", "Wake up at 5am", 120), "instaloader": {"node_type": "Post"}})
+    _write(root / "beerbiceps" / "2024-01-02_UTC.json",
+           {"node": _post("BBB", "Nobody talks about this", 45, layout="iphone")})
+    _write(root / "beerbiceps" / "2024-01-03_UTC.json.xz", {"node": _post("CCC", "", 3)})  # no caption
+    _write(root / "garyvee" / "garyvee_123.json.xz", {
+        "node": {
+            "username": "garyvee",
+            "edge_owner_to_timeline_media": {"edges": [
+                {"node": _post("DDD", "Stop waiting for permission", 9000)},
+                {"node": _post("EEE", "wake up at 5AM", 10)},  # duplicate text of another account's post
+            ]},
+        },
+        "instaloader": {"node_type": "Profile"},
+    })
+    (root / "garyvee" / "broken.json.xz").write_bytes(b"not xz at all")
+
+
+def test_parse_handles_both_node_layouts(tmp_path):
+    _dumps(tmp_path)
+    graphql = parse_dump_file(str(tmp_path / "beerbiceps" / "2024-01-01_UTC.json.xz"))
+    iphone = parse_dump_file(str(tmp_path / "beerbiceps" / "2024-01-02_UTC.json"))
+    assert graphql == [{"text": "Wake up at 5am", "tone": "unknown", "niche": "beerbiceps",
+                        "platform": "Instagram", "engagement": 120, "source_id": "AAA"}]
+    assert (iphone[0]["text"], iphone[0]["engagement"], iphone[0]["source_id"]) == ("Nobody talks about this", 45, "BBB")
+    assert parse_dump_file(str(tmp_path / "garyvee" / "broken.json.xz")) == []
+
+
+def test_import_walks_the_tree_and_dedupes(db, tmp_path):
+    _dumps(tmp_path)
+    result = import_dumps(str(tmp_path), workers=2, chunk_size=2)
+    assert (result["files"], result["parsed"], result["inserted"], result["skipped"]) == (5, 4, 3, 1)
+    stored = db.execute(select(Hook.source_id, Hook.niche).order_by(Hook.source_id)).all()
+    assert stored == [("AAA", "beerbiceps"), ("BBB", "beerbiceps"), ("DDD", "garyvee")]
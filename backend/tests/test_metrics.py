@@ -0,0 +1,89 @@
+"""Scrape span metrics: histograms, run recording, Prometheus output and the run log CLI."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.routers import internal
+
+
+@pytest.fixture
+def scrape_metrics(tmp_path, monkeypatch):
+    fresh = metrics.ScrapeMetrics(max_targets=2, history=10, log_file=str(tmp_path / "runs.jsonl"))
+    monkeypatch.setattr(metrics, "_metrics", fresh)
+    return fresh
+
+
+def test_histogram_counts_per_bucket():
+    h = metrics.Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        h.observe(value)
+    assert h.counts == [1, 2, 1]
+    assert (h.count, h.max) == (4, 3.0)
+    assert h.quantile(0.5) == 1.0
+    assert h.quantile(1.0) == 3.0
+    assert h.to_dict()["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 1}
+
+
+def test_prometheus_buckets_are_cumulative(scrape_metrics):
+    for seconds in (0.003, 0.2, 0.2):
+        run = metrics.ScrapeRun("reddit", "Business")
+        run.add("fetch", seconds)
+        scrape_metrics.record(run)
+    lines = scrape_metrics.to_prometheus().splitlines()
+    fetch = [line for line in lines if 'span="fetch"' in line]
+    assert 'le="0.005"} 1' in fetch[0]
+    assert any('le="0.25"} 3' in line for line in fetch)
+    assert fetch[-1].endswith("_count{platform=\"reddit\",target=\"Business\",span=\"fetch\"} 3")
+
+
+def test_scrape_run_records_spans_and_errors(scrape_metrics):
+    with metrics.scrape_run("youtube", "cooking") as run:
+        with run.span("fetch"):
+            pass
+        run.add("persist", 0.5)
+    with pytest.raises(ValueError):
+        with metrics.scrape_run("youtube", "cooking"):
+            raise ValueError("quota exceeded")
+
+    recent = metrics.get_scrape_metrics()["recent_runs"]
+    assert [r["error"] for r in recent] == [None, "quota exceeded"]
+    assert set(recent[0]["spans"]) == {"fetch", "persist"}
+    assert metrics.get_scrape_metrics()["platforms"]["youtube:total"]["count"] == 2
+
+
+def test_least_recently_used_targets_are_dropped(scrape_metrics):
+    for target in ("a", "b", "c"):
+        scrape_metrics.record(metrics.ScrapeRun("reddit", target))
+    assert [t["target"] for t in scrape_metrics.to_dict()["targets"]] == ["c", "b"]
+
+
+def test_run_log_summary(scrape_metrics):
+    for target, total in (("slow", 4.0), ("fast", 1.0), ("slow", 2.0)):
+        run = metrics.ScrapeRun("reddit", target)
+        run.add("fetch", total * 0.75)
+        run.add("persist", total * 0.25)
+        run.total = total
+        scrape_metrics.record(run)
+    summary = metrics.summarize_runs(metrics.load_runs(scrape_metrics.log_file, last=10))
+    assert summary["runs"] == 3
+    assert [(t["target"], t["mean"], t["slowest_span"]) for t in summary["targets"]] == [
+        ("slow", 3.0, "fetch"), ("fast", 1.0, "fetch")]
+    assert summary["spans"]["fetch"]["share"] == 0.75
+
+
+def test_internal_routes_are_off_by_default():
+    from app.main import app
+
+    assert TestClient(app).get("/internal/metrics").status_code == 404
+
+
+def test_internal_metrics_route(scrape_metrics):
+    app = FastAPI()
+    app.include_router(internal.router)
+    scrape_metrics.record(metrics.ScrapeRun("reddit", "Business"))
+    client = TestClient(app)
+    assert client.get("/internal/metrics").json()["recent_runs"][0]["target"] == "Business"
+    text = client.get("/internal/metrics", params={"format": "prometheus"}).text
+    assert text.startswith("# HELP hook_scrape_span_seconds")
@@ -0,0 +1,45 @@
+"""Paged niche search (in-process trigram backend on SQLite)."""
+
+import pytest
+
+from app.core.trigram import TrigramIndex
+from app.models.hook_model import Hook
+from app.services import niche_search
+
+
+@pytest.fixture
+def niches(db, monkeypatch):
+    monkeypatch.setattr(niche_search, "_niche_index", TrigramIndex())
+    monkeypatch.setattr(niche_search, "_niche_index_refreshed", 0.0)
+    rows = [("fitness", 6), ("fitness tips", 4), ("home fitness", 3), ("finance", 5), ("cooking", 2)]
+    hook_id = 0
+    for niche, count in rows:
+        for _ in range(count):
+            hook_id += 1
+            db.add(Hook(id=hook_id, text=f"{niche} hook {hook_id}", platform="Reddit", niche=niche))
+    db.commit()
+    return db
+
+
+def _walk(db, query, limit):
+    results, cursor = [], None
+    while True:
+        page, cursor = niche_search.search_hooks_by_niche(db, query, limit=limit, cursor=cursor)
+        results.extend(page)
+        if cursor is None:
+            return results
+
+
+@pytest.mark.parametrize("limit", [1, 3, 4, 50])
+def test_pages_return_every_match_once_in_order(niches, limit):
+    results = _walk(niches, "fitness", limit)
+    ids = [r["id"] for r in results]
+    assert len(ids) == len(set(ids)) == 13
+    keys = [(-r["similarity"], r["niche"], -r["id"]) for r in results]
+    assert keys == sorted(keys)
+    assert results[0]["niche"] == "fitness"
+
+
+def test_malformed_cursor_is_rejected(niches):
+    with pytest.raises(ValueError):
+        niche_search.search_hooks_by_niche(niches, "fitness", cursor="not-a-cursor")
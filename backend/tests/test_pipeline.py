@@ -0,0 +1,84 @@
+"""Staged ingest pipeline: batching, errors, early exit and the hook ingest."""
+
+import threading
+
+import pytest
+from sqlalchemy import select
+
+from app.core.scraper import FunctionStage, Pipeline, ingest
+from app.models.hook_model import Hook
+
+
+def test_stages_run_in_order_with_batches():
+    sizes = []
+
+    def _double(batch):
+        sizes.append(len(batch))
+        return [x * 2 for x in batch]
+
+    pipeline = Pipeline("test", range(10), [
+        FunctionStage("odd", lambda batch: [x for x in batch if x % 2]),
+        FunctionStage("double", _double, batch_size=2, batch_timeout=5),
+    ], queue_size=2)
+    assert pipeline.run() == [2, 6, 10, 14, 18]
+    assert sizes == [2, 2, 1]
+    report = pipeline.report.to_dict()
+    assert [s["stage"] for s in report["stages"]] == ["fetch", "odd", "double"]
+    assert report["stages"][1]["items_in"] == 10 and report["stages"][1]["items_out"] == 5
+
+
+def test_parallel_workers_process_everything_once():
+    seen = []
+    lock = threading.Lock()
+
+    def _record(batch):
+        with lock:
+            seen.extend(batch)
+        return batch
+
+    pipeline = Pipeline("test", range(200), [FunctionStage("work", _record, workers=4)])
+    assert sorted(pipeline.run()) == list(range(200))
+    assert sorted(seen) == list(range(200))
+
+
+def test_stage_error_is_raised_after_draining():
+    def _explode(batch):
+        if 3 in batch:
+            raise ValueError("bad item")
+        return batch
+
+    pipeline = Pipeline("test", range(10), [FunctionStage("boom", _explode)])
+    with pytest.raises(ValueError):
+        pipeline.run()
+    assert pipeline.report.error == "bad item"
+
+
+def test_closing_early_stops_the_fetch():
+    pulled = []
+
+    def _source():
+        for i in range(10_000):
+            pulled.append(i)
+            yield i
+
+    results = Pipeline("test", _source(), [FunctionStage("pass", lambda b: b)], queue_size=4).run_iter()
+    assert [next(results) for _ in range(3)] == [0, 1, 2]
+    results.close()
+    assert len(pulled) < 100
+
+
+def test_ingest_normalizes_dedupes_and_stores(db):
+    posts = [{"title": "Stop scrolling", "id": "a"}, {"title": "  "}, {"title": "STOP  scrolling", "id": "b"},
+             {"title": "Wake up early", "id": "c"}]
+    progress = []
+    fetched, report = ingest(
+        "test:r/Business", iter(posts), lambda p: p["title"], platform="Reddit", niche="Business",
+        on_progress=lambda stage, n: progress.append((stage, n)),
+        to_meta=lambda p: {"source_id": p.get("id")},
+    )
+    assert fetched == posts
+    assert progress == [("fetched", 4), ("saved", 2)]
+    assert report.stage("normalize").counters == {"empty": 1}
+    assert report.stage("dedupe").counters == {"duplicates": 1}
+    stored = db.execute(select(Hook.text, Hook.source_id, Hook.niche).order_by(Hook.id)).all()
+    assert stored == [("Stop scrolling", "a", "Business"), ("Wake up early", "c", "Business")]
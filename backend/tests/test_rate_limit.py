@@ -0,0 +1,111 @@
+"""Shared token buckets, server retry hints and backoff."""
+
+import threading
+import time
+
+import pytest
+
+from app.core import rate_limit
+from app.core.rate_limit import TokenBucket, backoff_delay, parse_retry_after
+
+
+class _Clock:
+    """Stands in for the time module: sleeping just moves the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
+
+
+def test_burst_then_steady_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=3.0)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.to_dict()["wait_seconds"] == 1.0
+
+
+def test_pause_holds_every_caller(clock):
+    bucket = TokenBucket(rate=10.0, capacity=10.0)
+    bucket.pause(30, retry=True)
+    assert bucket.acquire() == pytest.approx(30)
+    stats = bucket.to_dict()
+    assert (stats["throttled"], stats["retries"]) == (1, 1)
+
+
+def test_zero_rate_is_unlimited_but_honours_pauses(clock):
+    bucket = TokenBucket(rate=0, capacity=1.0)
+    assert sum(bucket.acquire() for _ in range(100)) == 0
+    bucket.pause(5)
+    assert bucket.acquire() == pytest.approx(5)
+    assert bucket.to_dict()["rate_per_sec"] is None
+
+
+def test_negative_rate_is_rejected():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=-1, capacity=1)
+
+
+def test_drain_syncs_with_the_server_budget(clock):
+    bucket = TokenBucket(rate=1.0, capacity=60.0)
+    bucket.drain(remaining=2, reset_in=40)
+    assert bucket.to_dict()["tokens"] == 2
+    bucket.drain(remaining=0, reset_in=40)
+    assert bucket.acquire() == pytest.approx(40)
+
+
+def test_concurrent_callers_share_one_budget():
+    bucket = TokenBucket(rate=1000.0, capacity=20.0)
+    barrier = threading.Barrier(8)
+
+    def _take():
+        barrier.wait()
+        for _ in range(10):
+            bucket.acquire()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=_take) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bucket.acquired == 80
+    assert time.monotonic() - started >= 0.05  # 60 tokens beyond the burst at 1000/s
+
+
+def test_buckets_are_shared_per_platform_and_credential(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_buckets", {})
+    assert rate_limit.get_bucket("reddit", "abc") is rate_limit.get_bucket("reddit", "abc")
+    assert rate_limit.get_bucket("reddit", "abc") is not rate_limit.get_bucket("reddit", "xyz")
+    assert "reddit:abc" in rate_limit.get_rate_limit_metrics()
+    rate_limit.get_bucket("youtube", "AIzaSyLongApiKey")
+    assert "youtube:AIza…" in rate_limit.get_rate_limit_metrics()
+
+
+def test_retry_after_parsing():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+
+
+def test_backoff_prefers_the_server_hint():
+    assert backoff_delay(5, retry_after=7.0) == 7.0
+    for attempt in range(12):
+        assert 0 <= backoff_delay(attempt) <= min(rate_limit.BACKOFF_CAP, 2 ** attempt)
@@ -0,0 +1,105 @@
+"""Raw payload archive and the offline reprocessor, including --replace."""
+
+import pytest
+
+from app.core import raw_archive
+from app.core.bulk_writer import bulk_insert_hooks, bulk_replace_hooks
+from app.core.config import settings
+from app.models.hook_model import Hook
+from app.services.raw_reprocessor import parse_archive_file, reprocess_archive
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "RAW_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setattr(raw_archive, "_writers", {})
+    return tmp_path
+
+
+def _submission(i, title=None, score=1):
+    return {"name": f"t3_{i}", "title": title or f"hook number {i}", "score": score,
+            "url": f"https://www.reddit.com/{i}"}
+
+
+def _archive(submissions, target="Business"):
+    for raw in submissions:
+        raw_archive.archive_raw("reddit", target, "submission", raw)
+    raw_archive.flush_archive()
+
+
+def _stored(db):
+    db.expire_all()
+    return {h.source_id: (h.text, h.engagement, h.niche) for h in db.query(Hook)}
+
+
+def test_archive_round_trip_skips_bad_records(archive):
+    _archive([_submission(1), _submission(2)])
+    raw_archive.archive_raw("reddit", "Business", "comment", {"body": "no extractor for this kind"})
+    raw_archive.archive_raw("reddit", "Business", "submission", {"title": "missing fields"})
+    _archive([_submission(3)])
+
+    paths = list(raw_archive.iter_archive_files(platforms=["reddit"]))
+    assert len(paths) == 1  # each flush appends a stream to the same part
+    assert len(list(raw_archive.iter_records(paths[0]))) == 5
+    rows = parse_archive_file(paths[0])
+    assert [row["source_id"] for row in rows] == ["t3_1", "t3_2", "t3_3"]
+    assert rows[0]["niche"] == "Business" and rows[0]["platform"] == "Reddit"
+
+
+def test_a_truncated_part_keeps_its_complete_streams(archive):
+    _archive([_submission(1)])
+    path = next(raw_archive.iter_archive_files())
+    with open(path, "ab") as fh:
+        fh.write(b"\xfd7zXZ\x00 truncated")
+    assert [r["payload"]["name"] for r in raw_archive.iter_records(path)] == ["t3_1"]
+
+
+def test_replace_rewrites_hooks_matched_on_source_id(db):
+    bulk_insert_hooks([
+        {"text": "old text 1", "tone": "Funny", "niche": "fitness", "platform": "Reddit", "source_id": "t3_1",
+         "engagement": 1},
+        {"text": "taken text", "tone": "unknown", "niche": "fitness", "platform": "Reddit", "source_id": "t3_2",
+         "engagement": 2},
+    ])
+    stats = bulk_replace_hooks([
+        {"text": "new text 1", "tone": "unknown", "niche": "Business", "platform": "Reddit", "source_id": "t3_1",
+         "engagement": 10},
+        # t3_3 is new, but its text is already stored under t3_2, so the upsert skips it
+        {"text": "taken text", "tone": "unknown", "niche": "Business", "platform": "Reddit", "source_id": "t3_3",
+         "engagement": 30},
+        {"text": "brand new", "tone": "unknown", "niche": "Business", "platform": "Reddit", "source_id": "t3_4",
+         "engagement": 40},
+    ])
+    assert (stats.rows, stats.updated, stats.skipped) == (1, 1, 1)
+    stored = _stored(db)
+    assert stored["t3_1"] == ("new text 1", 10, "fitness")  # labels kept without update_labels
+    assert stored["t3_2"] == ("taken text", 2, "fitness")
+    assert "t3_3" not in stored and stored["t3_4"][0] == "brand new"
+
+
+def test_replace_can_update_labels(db):
+    bulk_insert_hooks([{"text": "a hook", "tone": "Funny", "niche": "fitness", "platform": "Reddit",
+                        "source_id": "t3_1"}])
+    bulk_replace_hooks([{"text": "a hook", "tone": "Serious", "niche": "Business", "platform": "Reddit",
+                         "source_id": "t3_1"}], update_labels=True)
+    db.expire_all()
+    hook = db.query(Hook).one()
+    assert (hook.tone, hook.niche) == ("Serious", "Business")
+
+
+def test_reprocess_inserts_then_replaces(db, archive):
+    _archive([_submission(i) for i in range(5)])
+    first = reprocess_archive(workers=1)
+    assert (first["files"], first["parsed"], first["inserted"]) == (1, 5, 5)
+    assert reprocess_archive(workers=1)["inserted"] == 0  # already stored, skipped
+
+    _archive([_submission(0, title="hook number 0, edited", score=99)])
+    replaced = reprocess_archive(workers=1, replace=True)
+    assert replaced["updated"] == 6  # t3_0 is archived twice; the later payload wins
+    assert _stored(db)["t3_0"][:2] == ("hook number 0, edited", 99)
+
+
+def test_dry_run_writes_nothing(db, archive):
+    _archive([_submission(1)])
+    assert reprocess_archive(workers=1, dry_run=True)["parsed"] == 1
+    assert _stored(db) == {}
@@ -0,0 +1,63 @@
+"""Concurrent Reddit listings: spec parsing, merging, the limit cap and failures."""
+
+import asyncio
+
+import pytest
+from prawcore.exceptions import NotFound
+
+from app.core.config import settings
+from app.services import reddit_async, reddit_scraper
+from benchmarks.fake_platforms import FakeConfig, FakePlatformServer
+
+LISTINGS = [("hot", None), ("new", None), ("top", "day"), ("rising", None)]
+
+
+@pytest.fixture
+def fake_reddit(monkeypatch):
+    server = FakePlatformServer("reddit", FakeConfig(posts_per_target=80)).start()
+    for name, value in dict(
+        REDDIT_CLIENT_ID="test", REDDIT_CLIENT_SECRET="test", REDDIT_USER_AGENT="test",
+        REDDIT_OAUTH_URL=server.url, REDDIT_URL=server.url,
+    ).items():
+        monkeypatch.setattr(settings, name, value)
+    reddit_scraper._reddit.reset()  # pooled clients point at the real API
+    try:
+        yield server
+    finally:
+        reddit_scraper._reddit.reset()
+        server.stop()
+
+
+def test_parse_listings(monkeypatch):
+    assert reddit_async.parse_listings("hot, top:week,,rising") == [("hot", None), ("top", "week"), ("rising", None)]
+    monkeypatch.setattr(settings, "REDDIT_LISTINGS", "new")
+    assert reddit_async.parse_listings() == [("new", None)]
+
+
+def test_listings_are_merged_without_duplicates(fake_reddit):
+    # Every fake listing walks the subreddit's 80 posts from a different start
+    posts = reddit_async.fetch_reddit_listings("Business", limit=500, listings=LISTINGS)
+    fullnames = [p["fullname"] for p in posts]
+    assert len(fullnames) == len(set(fullnames)) == 80
+    assert {p["listing"] for p in posts} <= {"hot", "new", "top:day", "rising"}
+
+
+def test_limit_caps_the_merged_stream(fake_reddit):
+    assert len(reddit_async.fetch_reddit_listings("Business", limit=7, listings=LISTINGS)) == 7
+
+
+def test_a_failing_listing_is_skipped(fake_reddit):
+    posts = reddit_async.fetch_reddit_listings("Business", limit=20, listings=[("hot", None), ("bogus", None)])
+    assert len(posts) == 20
+    assert {p["listing"] for p in posts} == {"hot"}
+
+
+def test_every_listing_failing_raises(fake_reddit):
+    with pytest.raises(NotFound):
+        reddit_async.fetch_reddit_listings("Business", limit=5, listings=[("bogus", None)])
+
+
+def test_several_subreddits_at_once(fake_reddit):
+    by_sub = asyncio.run(reddit_async.afetch_subreddits(["Business", "startups"], limit=10, listings=LISTINGS[:2]))
+    assert {sub: len(posts) for sub, posts in by_sub.items()} == {"Business": 10, "startups": 10}
+    assert not {p["fullname"] for p in by_sub["Business"]} & {p["fullname"] for p in by_sub["startups"]}
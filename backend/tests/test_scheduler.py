@@ -0,0 +1,124 @@
+"""Scheduled scrapes: targets, next-run times, coalescing and the cross-worker claim."""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.services import scheduler
+from app.Settings.models import User
+
+
+def _schedule(**overrides):
+    schedule = {
+        "enabled": True,
+        "platforms": ["Reddit", "YouTube", "Instagram"],
+        "frequency": "daily",
+        "time_of_day": "09:00",
+        "niches": ["fitness"],
+        "targets": {"reddit": ["Business"], "Instagram": ["garyvee"]},
+        "max_hooks_per_scrape": 50,
+    }
+    schedule.update(overrides)
+    return schedule
+
+
+def test_niches_are_only_keyword_searches():
+    assert scheduler.schedule_targets(_schedule()) == [
+        ("reddit", "Business"), ("youtube", "fitness"), ("instagram", "garyvee"),
+    ]
+    # No explicit targets: a niche is never turned into a subreddit or username
+    assert scheduler.schedule_targets(_schedule(targets={})) == [("youtube", "fitness")]
+    both = _schedule(targets={"youtube": ["Fitness", "UCabc"]}, platforms=["youtube"])
+    assert scheduler.schedule_targets(both) == [("youtube", "Fitness"), ("youtube", "UCabc")]
+
+
+def test_next_run_is_the_next_utc_slot(monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULER_JITTER_SECONDS", 0)
+    now = datetime(2024, 5, 1, 10, 30)
+    assert scheduler.compute_next_run(_schedule(), "u1", now) == datetime(2024, 5, 2, 9, 0)
+    assert scheduler.compute_next_run(_schedule(time_of_day="11:15"), "u1", now) == datetime(2024, 5, 1, 11, 15)
+    weekly = _schedule(frequency="weekly")
+    assert scheduler.compute_next_run(weekly, "u1", now, last_run=now) == datetime(2024, 5, 8, 9, 0)
+    assert scheduler.compute_next_run(_schedule(enabled=False), "u1", now) is None
+
+
+def test_jitter_is_stable_and_bounded(monkeypatch):
+    monkeypatch.setattr(settings, "SCHEDULER_JITTER_SECONDS", 900)
+    now = datetime(2024, 5, 1, 10, 30)
+    runs = {scheduler.compute_next_run(_schedule(), f"user-{i}", now) for i in range(20)}
+    assert len(runs) > 1
+    assert all(datetime(2024, 5, 2, 9, 0) <= run < datetime(2024, 5, 2, 9, 15) for run in runs)
+    assert scheduler.compute_next_run(_schedule(), "user-1", now) == scheduler.compute_next_run(_schedule(), "user-1", now)
+
+
+def test_targets_are_coalesced_across_users():
+    plan = scheduler.coalesce([
+        ("u1", _schedule(max_hooks_per_scrape=20)),
+        ("u2", _schedule(max_hooks_per_scrape=80, targets={"reddit": ["business"]})),
+    ])
+    assert plan[("reddit", "business")] == {"target": "Business", "limit": 80, "user_ids": ["u1", "u2"]}
+    assert plan[("instagram", "garyvee")]["user_ids"] == ["u1"]
+
+
+@pytest.fixture
+def users(monkeypatch):
+    User.__table__.create(engine, checkfirst=True)
+    enqueued = []
+    lock = threading.Lock()
+
+    def _enqueue(platform, target, limit, **kwargs):
+        with lock:
+            enqueued.append((platform, target, limit, tuple(kwargs["user_ids"])))
+        return type("Job", (), {"id": f"{platform}/{target}"})()
+
+    monkeypatch.setattr(scheduler, "enqueue_scrape", _enqueue)
+    yield enqueued
+    with engine.begin() as conn:
+        conn.execute(User.__table__.delete())
+
+
+def _add_user(db, name, next_run, **schedule):
+    db.add(User(id=name, full_name=name, username=name, email=f"{name}@example.com", password_hash="x",
+                scheduled_scrape_settings=_schedule(**schedule), next_scheduled_scrape_at=next_run))
+    db.commit()
+
+
+def test_due_users_are_claimed_once_across_workers(users):
+    now = datetime(2024, 5, 1, 9, 5)
+    db = SessionLocal()
+    try:
+        _add_user(db, "due1", now - timedelta(minutes=5))
+        _add_user(db, "due2", now - timedelta(minutes=1), max_hooks_per_scrape=100)
+        _add_user(db, "later", now + timedelta(hours=1))
+    finally:
+        db.close()
+
+    barrier = threading.Barrier(4)
+    results = []
+
+    def _worker():
+        barrier.wait()
+        results.append(scheduler.run_due(now))
+
+    threads = [threading.Thread(target=_worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(r["users"] for r in results) == 2
+    assert sorted(users) == [
+        ("instagram", "garyvee", 100, ("due1", "due2")),
+        ("reddit", "Business", 100, ("due1", "due2")),
+        ("youtube", "fitness", 100, ("due1", "due2")),
+    ]
+    db = SessionLocal()
+    try:
+        claimed = db.get(User, "due1")
+        assert claimed.last_scheduled_scrape_at == now
+        assert claimed.next_scheduled_scrape_at > now
+    finally:
+        db.close()
@@ -0,0 +1,108 @@
+"""Cross-user scrape cache: watermark-keyed hits, single-flight misses."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import delete
+
+from app.core.database import engine
+from app.models.watermark_model import ScrapeWatermark
+from app.services import scrape_cache
+from app.services.watermarks import set_watermark
+
+
+class _IncrementalScrape:
+    """scrape_and_store stand-in that serves posts newer than the watermark and moves it on."""
+
+    def __init__(self):
+        self.newest = 3
+        self.calls = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, target, limit, incremental=True, on_progress=None):
+        self.calls.append((target, limit, incremental))
+        self.release.wait(5)
+        if target == "broken":
+            raise RuntimeError("subreddit is private")
+        posts = [{"fullname": f"t3_{i}"} for i in range(self.newest, 0, -1)][:limit]
+        set_watermark("reddit", target, f"t3_{self.newest}")
+        return posts
+
+
+@pytest.fixture
+def scrape():
+    scrape_cache.clear_scrape_cache()
+    yield _IncrementalScrape()
+    scrape_cache.clear_scrape_cache()
+    with engine.begin() as conn:
+        conn.execute(delete(ScrapeWatermark))
+
+
+def test_a_miss_scrapes_incrementally(scrape):
+    posts, cached = scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    assert len(posts) == 3 and not cached
+    assert scrape.calls == [("Business", 10, True)]
+
+
+def test_callers_behind_a_fetch_get_nothing_new_without_refetching(scrape):
+    scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    posts, cached = scrape_cache.cached_scrape("reddit", " business ", 10, scrape)
+    assert (posts, cached) == ([], True)
+    assert len(scrape.calls) == 1
+
+
+def test_a_moved_watermark_is_a_new_key(scrape):
+    scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    scrape.newest = 5
+    set_watermark("reddit", "Business", "t3_4")  # another worker scraped in between
+    posts, cached = scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    assert not cached
+    assert len(scrape.calls) == 2
+
+
+def test_a_watermark_keeps_its_cached_posts(scrape):
+    set_watermark("reddit", "Business", "t3_0")
+    first, _ = scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    set_watermark("reddit", "Business", "t3_0")  # e.g. a user still on the old watermark
+    again, cached = scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    assert cached and again == first
+
+
+def test_concurrent_misses_share_one_fetch(scrape):
+    scrape.release.clear()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(scrape_cache.cached_scrape, "reddit", "Business", 10, scrape) for _ in range(4)]
+        while not scrape.calls:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        scrape.release.set()
+        results = [f.result() for f in futures]
+    assert len(scrape.calls) == 1
+    assert sorted(cached for _, cached in results) == [False, True, True, True]
+    assert all(len(posts) == 3 for posts, _ in results)
+
+
+def test_errors_reach_waiters_and_are_not_cached(scrape):
+    scrape.release.clear()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(scrape_cache.cached_scrape, "reddit", "broken", 10, scrape) for _ in range(2)]
+        while not scrape.calls:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        scrape.release.set()
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result()
+    with pytest.raises(RuntimeError):
+        scrape_cache.cached_scrape("reddit", "broken", 10, scrape)
+    assert len(scrape.calls) == 2
+
+
+def test_zero_ttl_bypasses_the_cache(scrape, monkeypatch):
+    monkeypatch.setitem(scrape_cache._caches, "reddit", scrape_cache.TTLCache(10, 0))
+    scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    scrape_cache.cached_scrape("reddit", "Business", 10, scrape)
+    assert len(scrape.calls) == 2
@@ -0,0 +1,85 @@
+"""fan_out: concurrency caps, per-target timeouts and per-worker clients."""
+
+import threading
+import time
+
+from app.core.scrape_engine import fan_out
+from app.services import reddit_scraper
+
+
+class _Tracker:
+    """Counts how many scrapes run at once."""
+
+    def __init__(self, delays=None):
+        self.delays = delays or {}
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, target):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delays.get(target, 0.02))
+            if target.startswith("bad"):
+                raise ValueError(f"{target} failed")
+            return target.upper()
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def test_results_keep_input_order_under_the_cap():
+    scrape = _Tracker()
+    targets = [f"t{i}" for i in range(8)] + ["bad1"]
+    report = fan_out("reddit", targets, scrape, max_workers=3, timeout=5)
+    assert [r.target for r in report.results] == targets
+    assert [r.result for r in report.results[:8]] == [t.upper() for t in targets[:8]]
+    assert report.results[-1].status == "error"
+    assert report.results[-1].error == "bad1 failed"
+    assert scrape.peak == 3
+    assert report.workers == 3
+
+
+def test_slow_target_times_out_without_stalling_the_rest():
+    scrape = _Tracker({"slow": 1.0})
+    report = fan_out("reddit", ["slow", "a", "b", "c"], scrape, max_workers=2, timeout=0.2)
+    assert [r.status for r in report.results] == ["timeout", "success", "success", "success"]
+    assert report.wall_time < 1.0
+
+
+def test_timed_out_threads_keep_their_slot():
+    scrape = _Tracker({"slow1": 0.5, "slow2": 0.5})
+    targets = ["slow1", "slow2"] + [f"t{i}" for i in range(6)]
+    report = fan_out("reddit", targets, scrape, max_workers=2, timeout=0.2)
+    assert scrape.peak == 2  # orphaned scrapes still count against the cap
+    assert [r.status for r in report.results[:2]] == ["timeout", "timeout"]
+    assert all(r.status == "success" for r in report.results[-3:])
+
+
+def test_target_without_a_free_slot_times_out():
+    scrape = _Tracker({"hang": 1.0})
+    report = fan_out("reddit", ["hang", "a"], scrape, max_workers=1, timeout=0.2)
+    assert [r.status for r in report.results] == ["timeout", "timeout"]
+    assert report.results[1].error == "no free slot within 0s"
+
+
+def test_concurrent_scrapes_get_their_own_reddit_client(monkeypatch):
+    client = reddit_scraper._reddit
+    monkeypatch.setattr(client, "factory", object)
+    client.reset()
+    barrier = threading.Barrier(3)
+
+    def _scrape(target):
+        with reddit_scraper.reddit_client() as reddit:
+            barrier.wait(timeout=5)  # all three hold a client at once
+            return reddit
+
+    try:
+        report = fan_out("reddit", ["a", "b", "c"], _scrape, max_workers=3, timeout=5)
+        assert len({id(r.result) for r in report.results}) == 3
+        with reddit_scraper.reddit_client() as reddit:
+            assert reddit in [r.result for r in report.results]  # reused, not rebuilt
+    finally:
+        client.reset()
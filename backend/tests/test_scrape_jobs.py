@@ -0,0 +1,92 @@
+"""Background scrape jobs: the 202 + poll contract and coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import jobs, reddit
+from app.services import scrape_cache, scrape_jobs
+
+
+class _FakeScrape:
+    """scrape_and_store stand-in that can be held open."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.release.set()
+        self.calls = []
+
+    def __call__(self, target, limit, incremental=True, on_progress=None):
+        self.calls.append((target, limit))
+        self.release.wait(5)
+        if target == "broken":
+            raise RuntimeError("subreddit is private")
+        posts = [{"fullname": f"t3_{i}"} for i in range(limit)]
+        if on_progress:
+            on_progress("fetched", len(posts))
+            on_progress("saved", len(posts))
+        return posts
+
+
+@pytest.fixture
+def fake_scrape(monkeypatch):
+    scrape = _FakeScrape()
+    monkeypatch.setattr(scrape_jobs, "_scrape_fn", lambda platform: scrape)
+    monkeypatch.setattr(scrape_jobs, "_executor", ThreadPoolExecutor(max_workers=1))
+    scrape_cache.clear_scrape_cache()
+    yield scrape
+    scrape.release.set()
+    scrape_cache.clear_scrape_cache()
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(reddit.router)
+    app.include_router(jobs.router)
+    return TestClient(app)
+
+
+def _wait(job_id, client):
+    for _ in range(200):
+        status = client.get(f"/jobs/{job_id}").json()
+        if status["status"] in ("success", "failed"):
+            return status
+        time.sleep(0.01)
+    raise AssertionError("job never finished")
+
+
+def test_scrape_is_queued_and_polled_to_completion(client, fake_scrape):
+    response = client.post("/reddit/scrape", params={"subreddit": "Business", "limit": 3})
+    assert response.status_code == 202
+    body = response.json()
+    assert body["data"]["job_id"] == body["job_id"]
+    status = _wait(body["job_id"], client)
+    assert (status["status"], status["stage"], status["fetched"]) == ("success", "done", 3)
+
+
+def test_failed_scrape_reports_its_error(client, fake_scrape):
+    job_id = client.post("/reddit/scrape", params={"subreddit": "broken"}).json()["job_id"]
+    status = _wait(job_id, client)
+    assert (status["status"], status["error"]) == ("failed", "subreddit is private")
+
+
+def test_unknown_job_is_404(client):
+    assert client.get("/jobs/not-a-job").status_code == 404
+
+
+def test_queued_job_is_joined_not_repeated(client, fake_scrape):
+    fake_scrape.release.clear()
+    busy = scrape_jobs.enqueue_scrape("reddit", "holding", 1)  # occupies the only worker
+    first = scrape_jobs.enqueue_scrape("reddit", "Business", 5, coalesce=True)
+    second = scrape_jobs.enqueue_scrape("reddit", "Business", 10, coalesce=True)
+    assert second is first and first.limit == 10
+    fake_scrape.release.set()
+    for job in (busy, first):
+        _wait(job.id, client)
+    assert fake_scrape.calls.count(("Business", 10)) == 1
+    assert ("Business", 5) not in fake_scrape.calls
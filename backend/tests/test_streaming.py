@@ -0,0 +1,75 @@
+"""Streaming scrapes: micro-batch commits and the NDJSON / SSE encoding."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.bulk_writer import BulkInsertStats
+from app.core.streaming import encode_event, stream_with_commits
+from app.routers import reddit
+
+
+class _Saver:
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, batch):
+        self.batches.append([post["id"] for post in batch])
+        return BulkInsertStats(len(batch), 0.0, "test", 1)
+
+
+def _posts(count, fail_at=None):
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError("connection reset")
+        yield {"id": i}
+
+
+def test_posts_are_committed_in_micro_batches():
+    save = _Saver()
+    events = list(stream_with_commits(_posts(7), save, batch_size=3))
+    assert [e["event"] for e in events] == ["post"] * 3 + ["saved"] + ["post"] * 3 + ["saved", "post", "saved", "done"]
+    assert save.batches == [[0, 1, 2], [3, 4, 5], [6]]
+    assert events[-1]["data"] == {"fetched": 7, "saved": 7, "skipped": 0}
+
+
+def test_failed_fetch_keeps_what_was_already_fetched():
+    save = _Saver()
+    with pytest.raises(RuntimeError):
+        list(stream_with_commits(_posts(10, fail_at=5), save, batch_size=3))
+    assert save.batches == [[0, 1, 2], [3, 4]]
+
+
+def test_client_disconnect_saves_the_open_batch():
+    save = _Saver()
+    events = stream_with_commits(_posts(10), save, batch_size=4)
+    for _ in range(2):
+        next(events)
+    events.close()
+    assert save.batches == [[0, 1]]
+
+
+def test_event_encodings():
+    event = {"event": "post", "data": {"title": "hi"}}
+    assert json.loads(encode_event(event, "ndjson")) == event
+    assert encode_event(event, "sse") == 'event: post\ndata: {"title": "hi"}\n\n'
+
+
+def test_scrape_route_streams_and_reports_errors_in_band(monkeypatch):
+    def _scrape_stream(subreddit, limit):
+        yield {"event": "post", "data": {"title": f"{subreddit} hook"}}
+        raise RuntimeError("rate limited")
+
+    monkeypatch.setattr(reddit, "scrape_stream", _scrape_stream)
+    app = FastAPI()
+    app.include_router(reddit.router)
+    response = TestClient(app).post("/reddit/scrape", params={"subreddit": "Business", "stream": "ndjson"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"event": "post", "data": {"title": "Business hook"}},
+        {"event": "error", "data": {"detail": "rate limited"}},
+    ]
@@ -0,0 +1,76 @@
+"""Incremental scraping: stored watermarks, skip_known and the Reddit scrape end to end."""
+
+import pytest
+from sqlalchemy import delete
+
+from app.core.bulk_writer import bulk_insert_hooks
+from app.core.config import settings
+from app.core.database import engine
+from app.models.watermark_model import ScrapeWatermark
+from app.services import reddit_scraper
+from app.services.watermarks import clear_watermark, get_watermark, set_watermark, skip_known
+from benchmarks.fake_platforms import FakeConfig, FakePlatformServer
+
+
+@pytest.fixture
+def watermarks():
+    yield
+    with engine.begin() as conn:
+        conn.execute(delete(ScrapeWatermark))
+
+
+class _Submission:
+    def __init__(self, fullname, stickied=False):
+        self.fullname = fullname
+        self.stickied = stickied
+
+
+def test_watermark_round_trip(watermarks):
+    assert get_watermark("reddit", "Business") is None
+    set_watermark("reddit", "Business", "t3_a")
+    set_watermark("Reddit", " business ", "t3_b")  # same target, upserted
+    assert get_watermark("reddit", "BUSINESS") == "t3_b"
+    clear_watermark("reddit", "business")
+    assert get_watermark("reddit", "Business") is None
+
+
+def test_new_listing_stops_at_the_watermark():
+    listing = [_Submission("t3_zz", stickied=True), _Submission("t3_c"), _Submission("t3_b"), _Submission("t3_a")]
+    walked = reddit_scraper.walk_listing("new", iter(listing), since="t3_b")
+    assert [s.fullname for s in walked] == ["t3_c"]
+
+
+def test_skip_known_drops_stored_posts_and_stops_after_a_known_page(db):
+    bulk_insert_hooks([
+        dict(text=f"stored {i}", platform="Reddit", source_id=f"t3_{i}") for i in range(10, 20)
+    ])
+    listing = [f"t3_{i}" for i in (1, 10, 2, 11, 12, 13, 14, 15, 16, 17, 3)]
+    fresh = list(skip_known("Reddit", iter(listing), lambda s: s, page_size=3))
+    # pages: [1, 10, 2] [11, 12, 13] -> all known, the rest is never read
+    assert fresh == ["t3_1", "t3_2"]
+
+
+@pytest.fixture
+def fake_reddit(monkeypatch):
+    server = FakePlatformServer("reddit", FakeConfig(posts_per_target=80)).start()
+    for name, value in dict(
+        REDDIT_CLIENT_ID="test", REDDIT_CLIENT_SECRET="test", REDDIT_USER_AGENT="test",
+        REDDIT_OAUTH_URL=server.url, REDDIT_URL=server.url, REDDIT_LISTINGS="hot",
+    ).items():
+        monkeypatch.setattr(settings, name, value)
+    reddit_scraper._reddit.reset()  # pooled clients point at the real API
+    try:
+        yield server
+    finally:
+        reddit_scraper._reddit.reset()
+        server.stop()
+
+
+def test_repeat_scrapes_only_store_new_posts(db, watermarks, fake_reddit):
+    first = reddit_scraper.scrape_and_store("Business", 40)
+    assert len(first) == 40
+    assert get_watermark("reddit", "Business") == max(
+        (p["fullname"] for p in first), key=reddit_scraper._fullname_to_int
+    )
+    assert reddit_scraper.scrape_and_store("Business", 40) == []
+    assert len(reddit_scraper.scrape_and_store("Business", 40, incremental=False)) == 40
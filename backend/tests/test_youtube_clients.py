@@ -0,0 +1,56 @@
+"""YouTube client pool: checkout reuse, the idle cap and the reported savings."""
+
+from queue import LifoQueue
+
+import pytest
+
+from app.core.config import settings
+from app.services import youtube_scraper
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(youtube_scraper, "_client_pool", LifoQueue())
+    monkeypatch.setattr(youtube_scraper, "_client_stats", {"builds": 0, "reuses": 0, "build_seconds": 0.0,
+                                                           "discarded": 0})
+    return youtube_scraper._client_pool
+
+
+def test_clients_come_from_the_cached_discovery_document():
+    youtube = youtube_scraper.get_youtube_service()
+    assert hasattr(youtube, "search") and hasattr(youtube, "playlistItems")
+    assert youtube_scraper._discovery.get() is youtube_scraper._discovery.get()
+
+
+def test_a_returned_client_is_reused(pool):
+    with youtube_scraper.youtube_client() as first:
+        pass
+    with youtube_scraper.youtube_client() as second:
+        assert second is first
+    stats = youtube_scraper.get_youtube_client_stats()
+    assert (stats["builds"], stats["reuses"], stats["idle"]) == (1, 1, 1)
+
+
+def test_concurrent_checkouts_get_their_own_client(pool):
+    with youtube_scraper.youtube_client() as one, youtube_scraper.youtube_client() as two:
+        assert one is not two
+    assert pool.qsize() == 2
+
+
+def test_clients_beyond_the_pool_size_are_closed(pool, monkeypatch):
+    monkeypatch.setattr(settings, "YOUTUBE_CLIENT_POOL_SIZE", 1)
+    with youtube_scraper.youtube_client(), youtube_scraper.youtube_client():
+        pass
+    stats = youtube_scraper.get_youtube_client_stats()
+    assert (stats["idle"], stats["discarded"]) == (1, 1)
+
+
+def test_savings_are_unknown_until_a_cold_build_was_timed(pool, monkeypatch):
+    monkeypatch.setattr(youtube_scraper, "_cold_build_seconds", None)
+    assert youtube_scraper.get_youtube_client_stats()["estimated_seconds_saved"] is None
+
+    monkeypatch.setattr(youtube_scraper, "_cold_build_seconds", 0.01)
+    youtube_scraper._client_stats.update(builds=1, reuses=9, build_seconds=0.001)
+    stats = youtube_scraper.get_youtube_client_stats()
+    load = youtube_scraper._discovery.build_seconds or 0.0
+    assert stats["estimated_seconds_saved"] == round(10 * 0.01 - 0.001 - load, 3)
@@ -0,0 +1,65 @@
+"""YouTube channel scrapes: uploads playlist paging, quota cost and ETag revalidation."""
+
+from collections import OrderedDict
+from queue import LifoQueue
+
+import pytest
+
+from app.core.config import settings
+from app.core.rate_limit import get_bucket
+from app.services import youtube_scraper
+from benchmarks.fake_platforms import FakeConfig, FakePlatformServer
+
+CHANNEL = "UCtestchannel0000000000001"
+
+
+@pytest.fixture
+def fake_youtube(monkeypatch):
+    server = FakePlatformServer("youtube", FakeConfig(posts_per_target=120)).start()
+    monkeypatch.setattr(settings, "YOUTUBE_API_ENDPOINT", server.url + "/")
+    monkeypatch.setattr(youtube_scraper, "_client_pool", LifoQueue())  # pooled clients point elsewhere
+    monkeypatch.setattr(youtube_scraper, "_etag_cache", OrderedDict())
+    monkeypatch.setattr(youtube_scraper, "_uploads_playlists", {})
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def _units(fn, *args, **kwargs):
+    """Quota units charged to the shared YouTube bucket by one call."""
+    bucket = get_bucket("youtube", youtube_scraper.API_KEY)
+    before = bucket.acquired
+    result = fn(*args, **kwargs)
+    return result, bucket.acquired - before
+
+
+def test_channel_uploads_cost_one_unit_per_page(fake_youtube):
+    videos, units = _units(youtube_scraper.fetch_channel_videos, CHANNEL, 60)
+    assert len(videos) == 60
+    assert all("views" in v for v in videos)
+    dates = [v["publish_date"] for v in videos]
+    assert dates == sorted(dates, reverse=True)
+    # channels.list + 2 playlistItems pages + 2 videos.list batches; search.list alone is 100
+    assert units == 5
+
+
+def test_uploads_playlist_is_resolved_once(fake_youtube):
+    youtube_scraper.fetch_channel_videos(CHANNEL, 10)
+    _, units = _units(youtube_scraper.fetch_channel_videos, CHANNEL, 10)
+    assert units == 2
+
+
+def test_watermark_stops_paging(fake_youtube):
+    videos = youtube_scraper.fetch_channel_videos(CHANNEL, 30)
+    newer = youtube_scraper.fetch_channel_videos(CHANNEL, 30, since=videos[9]["publish_date"])
+    assert [v["video_id"] for v in newer] == [v["video_id"] for v in videos[:9]]
+
+
+def test_repeated_requests_are_revalidated_with_etags(fake_youtube, monkeypatch):
+    first = youtube_scraper.fetch_channel_videos(CHANNEL, 10)
+    stored = []
+    store = youtube_scraper._etag_store
+    monkeypatch.setattr(youtube_scraper, "_etag_store", lambda uri, response: (stored.append(uri), store(uri, response)))
+    assert youtube_scraper.fetch_channel_videos(CHANNEL, 10) == first
+    assert stored == []  # every response was a 304 served from the cache
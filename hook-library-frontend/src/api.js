@@ -19,13 +19,38 @@ export async function register(email, password, username) {
   return res.json();
 }
 
+// ---- Scrape Jobs ----
+// Single-target scrapes are queued: the backend answers 202 with a job_id.
+export async function getScrapeJob(jobId) {
+  const res = await fetch(`${API_BASE}/jobs/${jobId}`, {
+    headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
+  });
+  return res.json();
+}
+
+// Poll a queued scrape until it succeeds or fails; returns the finished job
+export async function waitForScrapeJob(queued, intervalMs = 1000) {
+  if (!queued.job_id) {
+    throw new Error(queued.detail || 'Scraping failed');
+  }
+  let job = queued.data;
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise(resolve => setTimeout(resolve, intervalMs));
+    job = await getScrapeJob(queued.job_id);
+  }
+  if (job.status === 'failed') {
+    throw new Error(job.error || 'Scraping failed');
+  }
+  return job;
+}
+
 // ---- Reddit Scraper ----
 export async function scrapeReddit(subreddit, limit = 50) {
   const res = await fetch(`${API_BASE}/reddit/scrape?subreddit=${subreddit}&limit=${limit}`, {
     method: 'POST',
     headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
   });
-  return res.json();
+  return waitForScrapeJob(await res.json());
 }
 
 export async function scrapeRedditAll() {
@@ -49,7 +74,7 @@ export async function scrapeYoutube(channelId, limit = 10) {
     method: 'POST',
     headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
   });
-  return res.json();
+  return waitForScrapeJob(await res.json());
 }
 
 export async function scrapeYoutubeAll() {
@@ -66,7 +91,7 @@ export async function scrapeInstagram(username, limit = 5) {
     method: 'POST',
     headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
   });
-  return res.json();
+  return waitForScrapeJob(await res.json());
 }
 
 export async function scrapeInstagramAll() {
@@ -188,6 +213,7 @@ export async function getAICredits() {
 // ---- Export as api object ----
 export const api = {
   auth: { login, register },
+  jobs: { getScrapeJob, waitForScrapeJob },
   reddit: { scrapeReddit, scrapeRedditAll, getRedditHooks },
   youtube: { scrapeYoutube, scrapeYoutubeAll },
   instagram: { scrapeInstagram, scrapeInstagramAll },
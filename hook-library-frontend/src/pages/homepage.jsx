@@ -6,12 +6,36 @@ import { Search, Menu, X, Youtube, Camera, Mail, Mic, Video, Pen, Copy, Heart, E
 // API CONFIGURATION
 // ============================================
 const API_BASE_URL = 'http://localhost:8000/api';
+const JOB_POLL_INTERVAL_MS = 1000;
+
+// Single-target scrapes are queued: the backend answers 202 with a job_id,
+// and the job is polled until it succeeds or fails. Resolves to the finished job.
+const waitForScrapeJob = async (request) => {
+  const response = await request;
+  const queued = await response.json();
+  if (!response.ok) {
+    throw new Error(queued.detail || 'Scraping failed');
+  }
+  let job = queued.data;
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+    const res = await api.jobs.get(queued.job_id);
+    job = await res.json();
+    if (!res.ok) {
+      throw new Error(job.detail || 'Could not check scrape job');
+    }
+  }
+  if (job.status === 'failed') {
+    throw new Error(job.error || 'Scraping failed');
+  }
+  return job;
+};
 
 const api = {
   // Reddit endpoints
   reddit: {
     scrape: (subreddit, limit = 50) => 
-      fetch(`${API_BASE_URL}/reddit/scrape?subreddit=${subreddit}&limit=${limit}`, { method: 'POST' }),
+      waitForScrapeJob(fetch(`${API_BASE_URL}/reddit/scrape?subreddit=${subreddit}&limit=${limit}`, { method: 'POST' })),
     scrapeAll: () => 
       fetch(`${API_BASE_URL}/reddit/scrape-all`, { method: 'POST' }),
     getHooks: () => 
@@ -23,7 +47,7 @@ const api = {
   // YouTube endpoints
   youtube: {
     scrape: (channelId, limit = 10) => 
-      fetch(`${API_BASE_URL}/youtube/scrape?channel_id=${channelId}&limit=${limit}`, { method: 'POST' }),
+      waitForScrapeJob(fetch(`${API_BASE_URL}/youtube/scrape?channel_id=${channelId}&limit=${limit}`, { method: 'POST' })),
     scrapeAll: () => 
       fetch(`${API_BASE_URL}/youtube/scrape-all`, { method: 'POST' })
   },
@@ -31,10 +55,16 @@ const api = {
   // Instagram endpoints
   instagram: {
     scrape: (username, limit = 5) => 
-      fetch(`${API_BASE_URL}/instagram/scrape?username=${username}&limit=${limit}`, { method: 'POST' }),
+      waitForScrapeJob(fetch(`${API_BASE_URL}/instagram/scrape?username=${username}&limit=${limit}`, { method: 'POST' })),
     scrapeAll: () => 
       fetch(`${API_BASE_URL}/instagram/scrape-all`, { method: 'POST' })
   },
+
+  // Queued scrape jobs
+  jobs: {
+    get: (jobId) => 
+      fetch(`${API_BASE_URL}/jobs/${jobId}`)
+  },
   
   // Settings & Reports endpoints
   settings: {